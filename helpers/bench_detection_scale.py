@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from speed_monitor.detector import DETECTOR_BACKENDS, get_detector_class  # noqa: E402
+
+
+def parse_args():
+    """Parse the command-line options."""
+    p = argparse.ArgumentParser(description="Benchmark detector throughput at several detection scales")
+    p.add_argument("input", help="Input video file")
+    p.add_argument(
+        "--scales",
+        type=float,
+        nargs="+",
+        default=[1.0, 0.5, 0.25],
+        help="Detection scales to compare (default: 1.0 0.5 0.25)",
+    )
+    p.add_argument("--max-frames", type=int, default=300, help="Frames to decode into memory (default: 300)")
+    p.add_argument("--min-contour-area", type=int, default=800, help="Full-resolution contour area threshold")
+    p.add_argument("--detector", choices=list(DETECTOR_BACKENDS), default="mog2", help="Detector backend")
+    return p.parse_args()
+
+
+def load_frames(path: str, max_frames: int) -> list:
+    """Decode up to max_frames frames so decode cost is excluded from timings."""
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise ValueError(f"Unable to open video file: {path}")
+    frames = []
+    try:
+        while len(frames) < max_frames:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            frames.append(frame)
+    finally:
+        cap.release()
+    return frames
+
+
+def bench_scale(frames: list, scale: float, min_contour_area: int, backend: str = "mog2") -> dict:
+    """Run a fresh detector over all frames and return timing and detection counts."""
+    detector = get_detector_class(backend)(min_contour_area_px=min_contour_area, scale=scale)
+    n_boxes = 0
+    t0 = time.perf_counter()
+    for frame in frames:
+        n_boxes += len(detector.detect(frame).bboxes)
+    elapsed = time.perf_counter() - t0
+    return {
+        "scale": scale,
+        "frames": len(frames),
+        "ms_per_frame": 1000.0 * elapsed / max(1, len(frames)),
+        "fps": len(frames) / elapsed if elapsed > 0 else float("inf"),
+        "detections": n_boxes,
+    }
+
+
+def main():
+    """Benchmark the chosen detector at each scale and print a results table."""
+    args = parse_args()
+    frames = load_frames(args.input, args.max_frames)
+    if not frames:
+        print("No frames decoded from:", args.input, file=sys.stderr)
+        sys.exit(1)
+
+    h, w = frames[0].shape[:2]
+    print(f"{args.input}: {len(frames)} frames at {w}x{h}")
+    print(f"{'scale':>6} {'ms/frame':>9} {'fps':>8} {'detections':>11}")
+    for scale in args.scales:
+        r = bench_scale(frames, scale, args.min_contour_area, args.detector)
+        print(f"{r['scale']:>6.2f} {r['ms_per_frame']:>9.2f} {r['fps']:>8.1f} {r['detections']:>11d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+import argparse
+import dataclasses
+import datetime as dt
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from speed_monitor.columnar import ColumnarSpeedLogger  # noqa: E402
+from speed_monitor.config import MonitorConfig  # noqa: E402
+from speed_monitor.detector import DETECTOR_BACKENDS  # noqa: E402
+from speed_monitor.kalman import KalmanTracker  # noqa: E402
+from speed_monitor.logger import CsvSpeedLogger, SpeedLogRow, ThreadedCsvSpeedLogger  # noqa: E402
+from speed_monitor.monitor import SpeedMonitor  # noqa: E402
+from speed_monitor.synthetic import make_scene, match_ground_truth, render_frames, write_scene_video  # noqa: E402
+from speed_monitor.tracker import CentroidTracker  # noqa: E402
+from speed_monitor.types import BBox, Detections  # noqa: E402
+
+# Targets from ssd.md.
+TARGET_FPS = 30.0
+TARGET_SPEED_ERROR_PCT = 10.0
+
+
+def parse_args():
+    """Parse the command-line options."""
+    p = argparse.ArgumentParser(
+        description="Benchmark the pipeline and its components on synthetic traffic; prints JSON"
+    )
+    p.add_argument("--width", type=int, default=1280, help="Frame width (default: 1280)")
+    p.add_argument("--height", type=int, default=720, help="Frame height (default: 720)")
+    p.add_argument("--frames", type=int, default=300, help="Frames in the synthetic clip (default: 300)")
+    p.add_argument("--vehicles", type=int, default=8, help="Vehicles in the synthetic clip (default: 8)")
+    p.add_argument("--noise", type=float, default=4.0, help="Per-pixel Gaussian noise std (default: 4.0)")
+    p.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    p.add_argument("--config", default=None, help="Monitor config JSON to benchmark (default: built-in)")
+    p.add_argument(
+        "--detectors", nargs="+", default=list(DETECTOR_BACKENDS), help="Detector backends to compare"
+    )
+    p.add_argument("--tracker-counts", type=int, nargs="+", default=[1, 10, 100], help="Tracker sizes")
+    p.add_argument("--tracker-updates", type=int, default=500, help="Updates per tracker benchmark")
+    p.add_argument("--logger-rows", type=int, default=100_000, help="Rows per logger benchmark")
+    p.add_argument("--skip", nargs="+", default=[], choices=["pipeline", "detector", "tracker", "logger"])
+    p.add_argument("--output", default=None, help="Write JSON here instead of stdout")
+    return p.parse_args()
+
+
+class _CollectingLogger:
+    """In-memory logger used to capture per-frame rows from `SpeedMonitor.run`."""
+
+    def __init__(self):
+        """Start with no rows."""
+        self.rows = []
+
+    def __enter__(self):
+        """No-op; rows stay in memory."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """No-op; rows stay in memory."""
+
+    def log(self, row):
+        """Keep `row`."""
+        self.rows.append(row)
+
+
+def bench_pipeline(scene, config: MonitorConfig, workdir: Path) -> dict:
+    """Run the full pipeline (decode included) and score speeds against ground truth."""
+    clip = write_scene_video(scene, workdir / "synthetic.avi", fps=config.calibration.fps)
+    config = dataclasses.replace(config, log_mode="frames")
+    logger = _CollectingLogger()
+
+    t0 = time.perf_counter()
+    SpeedMonitor(config=config).run(video_source=str(clip), logger=logger)
+    elapsed = time.perf_counter() - t0
+
+    truth = {v.vehicle_id: v.speed_mph(config.calibration) for v in scene.vehicles}
+    vehicles = {v.vehicle_id: v for v in scene.vehicles}
+    frame_errors = []
+    per_vehicle = {}
+    for row in logger.rows:
+        bbox = BBox(row.x1, row.y1, row.x2, row.y2)
+        vid = match_ground_truth(scene, row.frame_idx, bbox, max_distance_px=config.match_max_distance_px)
+        if vid is None:
+            continue
+        frame_errors.append(100.0 * abs(row.speed_mph - truth[vid]) / truth[vid])
+        # Per-vehicle estimates only use frames where the vehicle is fully in view.
+        if scene.visible_bbox(vehicles[vid], row.frame_idx) == vehicles[vid].bbox_at(row.frame_idx):
+            per_vehicle.setdefault(vid, []).append(row.speed_mph)
+
+    vehicle_errors = [
+        100.0 * abs(statistics.median(speeds) - truth[vid]) / truth[vid] for vid, speeds in per_vehicle.items()
+    ]
+    n_visible = sum(
+        1 for v in scene.vehicles if any(scene.visible_bbox(v, f) for f in range(1, scene.n_frames + 1))
+    )
+    return {
+        "frames": scene.n_frames,
+        "seconds": elapsed,
+        "fps": scene.n_frames / elapsed if elapsed > 0 else float("inf"),
+        "rows": len(logger.rows),
+        "matched_rows": len(frame_errors),
+        "vehicles_visible": n_visible,
+        "vehicles_measured": len(vehicle_errors),
+        "vehicle_error_pct": _summarize(vehicle_errors),
+        "vehicles_within_target": sum(e <= TARGET_SPEED_ERROR_PCT for e in vehicle_errors),
+        "frame_error_pct": _summarize(frame_errors),
+    }
+
+
+def bench_detector(frames: list, config: MonitorConfig, backend: str) -> dict:
+    """Time one detector backend's `detect` over pre-decoded frames."""
+    detector = SpeedMonitor._make_detector(dataclasses.replace(config, detector=backend))
+    boxes = []
+    t0 = time.perf_counter()
+    for frame in frames:
+        boxes.append(detector.detect(frame).bboxes)
+    elapsed = time.perf_counter() - t0
+    return {
+        "backend": backend,
+        "frames": len(frames),
+        "ms_per_frame": 1000.0 * elapsed / max(1, len(frames)),
+        "fps": len(frames) / elapsed if elapsed > 0 else float("inf"),
+        "detections": sum(len(b) for b in boxes),
+        "alloc_kb_per_frame": _alloc_kb_per_frame(detector, frames),
+        "boxes": boxes,
+    }
+
+
+def _alloc_kb_per_frame(detector, frames: list, n_frames: int = 30) -> float:
+    """Mean peak transient heap allocation of one `detect` call, in KiB.
+
+    Measured with tracemalloc (which sees NumPy/OpenCV array buffers) on an
+    already warmed-up detector, separately from the timed loop.
+    """
+    peaks = []
+    tracemalloc.start()
+    try:
+        for frame in frames[-n_frames:]:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            result = detector.detect(frame)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+            del result
+    finally:
+        tracemalloc.stop()
+    return sum(peaks) / max(1, len(peaks)) / 1024.0
+
+
+def _iou(a: BBox, b: BBox) -> float:
+    """Intersection over union of two boxes."""
+    iw = min(a.x2, b.x2) - max(a.x1, b.x1)
+    ih = min(a.y2, b.y2) - max(a.y1, b.y1)
+    if iw <= 0 or ih <= 0:
+        return 0.0
+    inter = iw * ih
+    return inter / float(a.area + b.area - inter)
+
+
+def _match_rate(found: list, reference: list, min_iou: float = 0.5) -> float | None:
+    """Fraction of `reference` boxes (per frame) overlapped by some `found` box."""
+    total = matched = 0
+    for f_boxes, r_boxes in zip(found, reference):
+        total += len(r_boxes)
+        matched += sum(1 for r in r_boxes if any(_iou(r, f) >= min_iou for f in f_boxes))
+    return matched / total if total else None
+
+
+def score_detectors(scene, results: list) -> None:
+    """Add ground-truth recall/precision and cross-backend agreement to `results`."""
+    truth = [
+        [b for b in (scene.visible_bbox(v, f) for v in scene.vehicles) if b is not None]
+        for f in range(1, scene.n_frames + 1)
+    ]
+    for r in results:
+        r["recall"] = _match_rate(r["boxes"], truth)
+        r["precision"] = _match_rate(truth, r["boxes"])
+    for r in results:
+        r["agreement"] = {
+            other["backend"]: _match_rate(r["boxes"], other["boxes"])
+            for other in results
+            if other is not r
+        }
+    for r in results:
+        del r["boxes"]
+
+
+def _grid_detections(n_tracks: int, frame_idx: int) -> list:
+    """`n_tracks` boxes on a 120 px grid, each moving 3 px per frame."""
+    cols = int(np.ceil(np.sqrt(n_tracks)))
+    dx = 3 * frame_idx
+    return [
+        BBox(120 * (i % cols) + dx, 120 * (i // cols), 120 * (i % cols) + dx + 40, 120 * (i // cols) + 20)
+        for i in range(n_tracks)
+    ]
+
+
+def bench_tracker(n_tracks: int, n_updates: int, config: MonitorConfig) -> list:
+    """Time tracker updates with `n_tracks` live tracks for each backend."""
+    results = []
+    for name, cls, kwargs in (
+        ("centroid", CentroidTracker, {}),
+        ("kalman", KalmanTracker, {}),
+    ):
+        for assignment in ("greedy", "optimal"):
+            tracker = cls(
+                max_age_frames=config.max_track_age_frames,
+                match_max_distance_px=config.match_max_distance_px,
+                assignment=assignment,
+                max_tracks=max(config.max_tracks, n_tracks),
+                **kwargs,
+            )
+            # Packed the way the detector returns them.
+            detections = [Detections.from_bboxes(_grid_detections(n_tracks, f)) for f in range(1, n_updates + 1)]
+            t0 = time.perf_counter()
+            for frame_idx, dets in enumerate(detections, start=1):
+                tracks = tracker.update(detections=dets, frame_idx=frame_idx)
+            elapsed = time.perf_counter() - t0
+            results.append(
+                {
+                    "backend": name,
+                    "assignment": assignment,
+                    "tracks": n_tracks,
+                    "live_tracks": len(tracks),
+                    "updates": n_updates,
+                    "us_per_update": 1e6 * elapsed / n_updates,
+                    "updates_per_s": n_updates / elapsed if elapsed > 0 else float("inf"),
+                }
+            )
+    return results
+
+
+def bench_logger(n_rows: int, workdir: Path) -> list:
+    """Time writing `n_rows` per-frame rows with each logger backend."""
+    now = dt.datetime.now(dt.timezone.utc)
+    rows = [
+        SpeedLogRow(
+            timestamp_iso=(now + dt.timedelta(milliseconds=33 * (i // 4))).isoformat(),
+            frame_idx=i // 4,
+            track_id=i % 4,
+            x1=10,
+            y1=20,
+            x2=110,
+            y2=70,
+            speed_mph=25.0 + (i % 7),
+        )
+        for i in range(n_rows)
+    ]
+    backends = (
+        ("csv", lambda: CsvSpeedLogger(workdir / "bench.csv")),
+        ("csv_threaded", lambda: ThreadedCsvSpeedLogger(workdir / "bench_threaded.csv")),
+        ("columnar", lambda: ColumnarSpeedLogger(workdir / "bench_columnar")),
+    )
+    results = []
+    for name, factory in backends:
+        logger = factory()
+        t0 = time.perf_counter()
+        with logger:
+            t_log = time.perf_counter()
+            for row in rows:
+                logger.log(row)
+            log_elapsed = time.perf_counter() - t_log
+        elapsed = time.perf_counter() - t0
+        results.append(
+            {
+                "backend": name,
+                "rows": n_rows,
+                # Time spent in log() calls, i.e. what the capture loop sees.
+                "us_per_log_call": 1e6 * log_elapsed / n_rows,
+                "rows_per_s": n_rows / elapsed if elapsed > 0 else float("inf"),
+            }
+        )
+    return results
+
+
+def _summarize(values: list) -> dict:
+    """Mean/median/p95/max of a list of errors (None values when empty)."""
+    if not values:
+        return {"n": 0, "mean": None, "median": None, "p95": None, "max": None}
+    arr = np.asarray(values, dtype=np.float64)
+    return {
+        "n": int(arr.size),
+        "mean": float(arr.mean()),
+        "median": float(np.median(arr)),
+        "p95": float(np.percentile(arr, 95)),
+        "max": float(arr.max()),
+    }
+
+
+def main():
+    """Run the selected benchmarks and print the report as JSON (or write it to --output)."""
+    args = parse_args()
+    if args.config is not None:
+        from speed_monitor.config import load_config
+
+        config = load_config(args.config)
+    else:
+        config = MonitorConfig()
+
+    scene = make_scene(
+        width=args.width,
+        height=args.height,
+        n_frames=args.frames,
+        n_vehicles=args.vehicles,
+        noise_std=args.noise,
+        seed=args.seed,
+    )
+    report = {
+        "schema_version": 1,
+        "timestamp_iso": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "platform": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+        },
+        "scene": {
+            "width": scene.width,
+            "height": scene.height,
+            "frames": scene.n_frames,
+            "vehicles": len(scene.vehicles),
+            "noise_std": scene.noise_std,
+            "seed": scene.seed,
+        },
+        "targets": {"fps": TARGET_FPS, "speed_error_pct": TARGET_SPEED_ERROR_PCT},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="speed_monitor_bench_") as tmp:
+        workdir = Path(tmp)
+        if "pipeline" not in args.skip:
+            pipeline = bench_pipeline(scene, config, workdir)
+            err = pipeline["vehicle_error_pct"]["max"]
+            pipeline["meets_fps_target"] = pipeline["fps"] >= TARGET_FPS
+            pipeline["meets_accuracy_target"] = err is not None and err <= TARGET_SPEED_ERROR_PCT
+            report["pipeline"] = pipeline
+        if "detector" not in args.skip:
+            frames = [frame for _, frame in render_frames(scene)]
+            results = [bench_detector(frames, config, backend) for backend in args.detectors]
+            score_detectors(scene, results)
+            report["detector"] = results
+        if "tracker" not in args.skip:
+            report["tracker"] = [
+                r for n in args.tracker_counts for r in bench_tracker(n, args.tracker_updates, config)
+            ]
+        if "logger" not in args.skip:
+            report["logger"] = bench_logger(args.logger_rows, workdir)
+
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from speed_monitor.columnar import columnar_to_csv, csv_to_columnar  # noqa: E402
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Convert speed logs between CSV and the columnar binary format")
+    p.add_argument("direction", choices=["to-columnar", "to-csv"], help="Conversion direction")
+    p.add_argument("input", help="Input CSV file (to-columnar) or columnar directory (to-csv)")
+    p.add_argument("--output", required=True, help="Output columnar directory (to-columnar) or CSV file (to-csv)")
+    p.add_argument("--chunk-rows", type=int, default=65_536, help="Rows per chunk for to-columnar (default: 65536)")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.direction == "to-columnar":
+        n = csv_to_columnar(args.input, args.output, chunk_rows=args.chunk_rows)
+    else:
+        n = columnar_to_csv(args.input, args.output)
+    print("Converted", n, "rows:", args.output)
+
+
+if __name__ == "__main__":
+    main()
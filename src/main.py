@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import signal
+import sys
 from pathlib import Path
 
-from speed_monitor.config import MonitorConfig, load_config
+from speed_monitor.config import CameraConfig, MonitorConfig, load_config
 from speed_monitor.monitor import SpeedMonitor
+from speed_monitor.multicam import MultiCameraRunner
+from speed_monitor.segments import run_segmented
 
 
 def _parse_args(argv: list[str] | None) -> argparse.Namespace:
@@ -12,8 +17,12 @@ def _parse_args(argv: list[str] | None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Speed Monitor (baseline)")
     parser.add_argument(
         "--video",
-        default="0",
-        help="Path to a video file, or a camera index (default: 0)",
+        action="append",
+        default=None,
+        help=(
+            "Path to a video file, or a camera index (default: 0). Repeat to run several "
+            "sources, each in its own worker process."
+        ),
     )
     parser.add_argument(
         "--config",
@@ -23,13 +32,25 @@ def _parse_args(argv: list[str] | None) -> argparse.Namespace:
     parser.add_argument(
         "--output",
         default="speeds.csv",
-        help="CSV output path (default: speeds.csv)",
+        help="Output path: CSV file, or directory for --log-format columnar (default: speeds.csv)",
     )
     parser.add_argument(
         "--display",
         action="store_true",
         help="Show the video with overlays; press 'q' to quit.",
     )
+    parser.add_argument(
+        "--display-max-fps",
+        type=float,
+        default=None,
+        help="Maximum display refresh rate; the window is drawn on its own thread (default: from config, 15).",
+    )
+    parser.add_argument(
+        "--display-scale",
+        type=float,
+        default=None,
+        help="Downscale the display window by this factor in (0, 1] (default: from config, 1.0).",
+    )
     parser.add_argument(
         "--max-frames",
         type=int,
@@ -42,12 +63,151 @@ def _parse_args(argv: list[str] | None) -> argparse.Namespace:
         default=None,
         help="Optional alert threshold in mph.",
     )
+    parser.add_argument(
+        "--detection-scale",
+        type=float,
+        default=None,
+        help="Run detection on a frame downscaled by this factor in (0, 1] (default: from config, 1.0).",
+    )
+    parser.add_argument(
+        "--detector",
+        choices=["mog2", "frame_diff"],
+        default=None,
+        help="Detector backend; frame_diff is a cheap grayscale alternative to MOG2 (default: from config, mog2).",
+    )
+    parser.add_argument(
+        "--tracker",
+        choices=["centroid", "kalman"],
+        default=None,
+        help="Tracker backend (default: from config, centroid).",
+    )
+    parser.add_argument(
+        "--adaptive-stride",
+        action="store_true",
+        help="Skip (grab-only) frames as needed to keep processing within the latency budget.",
+    )
+    parser.add_argument(
+        "--latency-budget-ms",
+        type=float,
+        default=None,
+        help="Per-frame processing budget for --adaptive-stride (default: 1000 / fps).",
+    )
+    parser.add_argument(
+        "--log-mode",
+        choices=["summary", "frames"],
+        default=None,
+        help="summary: one row per vehicle (default); frames: one row per track per frame (debug).",
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=["csv", "columnar"],
+        default=None,
+        help="Per-frame output format; columnar (requires --log-mode frames) writes a directory of binary "
+        "column chunks (default: csv).",
+    )
+    parser.add_argument(
+        "--async-log",
+        action="store_true",
+        help="Write CSV rows in batches from a background thread.",
+    )
+    parser.add_argument(
+        "--threaded-capture",
+        action="store_true",
+        help="Decode frames on a background thread into a bounded queue.",
+    )
+    parser.add_argument(
+        "--capture-queue-size",
+        type=int,
+        default=None,
+        help="Frame queue capacity for --threaded-capture (default: from config, 4).",
+    )
+    parser.add_argument(
+        "--capture-overflow",
+        choices=["auto", "block", "drop_oldest"],
+        default=None,
+        help="Queue overflow policy; auto blocks for files and drops oldest for cameras.",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Print per-stage latency, FPS and drop summaries to stderr periodically.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        help="Rewrite this file with Prometheus text metrics every interval (enables instrumentation).",
+    )
+    parser.add_argument(
+        "--metrics-interval-s",
+        type=float,
+        default=None,
+        help="Seconds between metrics summaries (default: from config, 10).",
+    )
+    parser.add_argument(
+        "--idle-gate",
+        action="store_true",
+        help="On quiet roads, skip full detection until a cheap thumbnail check sees motion.",
+    )
+    parser.add_argument(
+        "--checkpoint-file",
+        default=None,
+        help="Save the background model and live tracks here periodically and on exit; resume from it on start.",
+    )
+    parser.add_argument(
+        "--checkpoint-interval-s",
+        type=float,
+        default=None,
+        help="Seconds between checkpoint saves (default: from config, 60).",
+    )
+    parser.add_argument(
+        "--alert-jsonl",
+        default=None,
+        help="Append speed alerts to this JSON-lines file.",
+    )
+    parser.add_argument(
+        "--alert-webhook",
+        default=None,
+        help="POST each speed alert as JSON to this URL.",
+    )
+    parser.add_argument(
+        "--traffic-stats",
+        default=None,
+        help="Append per-interval traffic statistics (counts, mean, p85, histogram) to this JSON-lines file.",
+    )
+    parser.add_argument(
+        "--watch-config",
+        action="store_true",
+        help="Apply edits to --config (polled, or on SIGHUP) to tunable settings without restarting.",
+    )
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=None,
+        help="Split a recorded video into N segments and process them in parallel worker processes.",
+    )
+    parser.add_argument(
+        "--segment-warmup-frames",
+        type=int,
+        default=None,
+        help="Frames decoded before each segment to warm up the background model (default: from config, 100).",
+    )
     return parser.parse_args(argv)
 
 
+def _parse_video_source(video: str) -> str | int:
+    """Accept a camera index as a string like "0"."""
+    return int(video) if video.isdigit() else video
+
+
+def _exit_on_sigterm(signum: int, frame: object) -> None:
+    """Turn SIGTERM into SystemExit so context managers flush and close outputs."""
+    raise SystemExit(128 + signum)
+
+
 def main(argv: list[str] | None = None) -> int:
     """Run the speed monitor CLI."""
     args = _parse_args(argv)
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
 
     config: MonitorConfig
     if args.config is not None:
@@ -56,24 +216,132 @@ def main(argv: list[str] | None = None) -> int:
         config = MonitorConfig()
 
     if args.speed_limit_mph is not None:
-        config = MonitorConfig(
-            calibration=config.calibration,
-            min_contour_area_px=config.min_contour_area_px,
-            max_track_age_frames=config.max_track_age_frames,
-            match_max_distance_px=config.match_max_distance_px,
-            speed_smoothing_window=config.speed_smoothing_window,
-            speed_limit_mph=float(args.speed_limit_mph),
-        )
+        config = dataclasses.replace(config, speed_limit_mph=float(args.speed_limit_mph))
+    if args.detection_scale is not None:
+        config = dataclasses.replace(config, detection_scale=float(args.detection_scale))
+    if args.display_max_fps is not None:
+        config = dataclasses.replace(config, display_max_fps=float(args.display_max_fps))
+    if args.display_scale is not None:
+        config = dataclasses.replace(config, display_scale=float(args.display_scale))
+    if args.detector is not None:
+        config = dataclasses.replace(config, detector=str(args.detector))
+    if args.tracker is not None:
+        config = dataclasses.replace(config, tracker=str(args.tracker))
+    if args.adaptive_stride:
+        config = dataclasses.replace(config, adaptive_stride=True)
+    if args.latency_budget_ms is not None:
+        config = dataclasses.replace(config, latency_budget_ms=float(args.latency_budget_ms))
+    if args.log_mode is not None:
+        config = dataclasses.replace(config, log_mode=str(args.log_mode))
+    if args.log_format is not None:
+        config = dataclasses.replace(config, log_format=str(args.log_format))
+    if args.async_log:
+        config = dataclasses.replace(config, log_async=True)
+    if args.threaded_capture:
+        config = dataclasses.replace(config, capture_threaded=True)
+    if args.capture_queue_size is not None:
+        config = dataclasses.replace(config, capture_queue_size=int(args.capture_queue_size))
+    if args.capture_overflow is not None:
+        config = dataclasses.replace(config, capture_overflow=str(args.capture_overflow))
+    if args.metrics:
+        config = dataclasses.replace(config, metrics_enabled=True)
+    if args.metrics_file is not None:
+        config = dataclasses.replace(config, metrics_file=str(args.metrics_file))
+    if args.metrics_interval_s is not None:
+        config = dataclasses.replace(config, metrics_interval_s=float(args.metrics_interval_s))
+    if args.idle_gate:
+        config = dataclasses.replace(config, idle_gate=True)
+    if args.alert_jsonl is not None:
+        config = dataclasses.replace(config, alert_jsonl_file=str(args.alert_jsonl))
+    if args.alert_webhook is not None:
+        config = dataclasses.replace(config, alert_webhook_url=str(args.alert_webhook))
+    if args.traffic_stats is not None:
+        config = dataclasses.replace(config, traffic_stats_file=str(args.traffic_stats))
+    if args.checkpoint_file is not None:
+        config = dataclasses.replace(config, checkpoint_file=str(args.checkpoint_file))
+    if args.checkpoint_interval_s is not None:
+        config = dataclasses.replace(config, checkpoint_interval_s=float(args.checkpoint_interval_s))
+    if args.segment_warmup_frames is not None:
+        config = dataclasses.replace(config, segment_warmup_frames=int(args.segment_warmup_frames))
 
-    # Accept camera index as a string like "0".
-    video_source: str | int
-    video_str = str(args.video)
-    if video_str.isdigit():
-        video_source = int(video_str)
-    else:
-        video_source = video_str
+    if config.log_format == "columnar" and config.log_mode != "frames":
+        print("--log-format columnar requires --log-mode frames", file=sys.stderr)
+        return 2
+
+    cameras: list[CameraConfig] = list(config.cameras)
+    for video in args.video or []:
+        cameras.append(CameraConfig(camera_id=f"cam{len(cameras)}", source=_parse_video_source(video)))
+
+    if len(cameras) > 1:
+        unsupported = [
+            name
+            for name, value in (
+                ("--display", args.display),
+                ("--watch-config", args.watch_config),
+                ("--segments", args.segments is not None),
+            )
+            if value
+        ]
+        if unsupported:
+            print(f"multiple cameras do not support {', '.join(unsupported)}", file=sys.stderr)
+            return 2
+        try:
+            runner = MultiCameraRunner(config=config, cameras=cameras)
+        except ValueError as exc:
+            print(exc, file=sys.stderr)
+            return 2
+        runner.run(output_csv=str(args.output), max_frames=args.max_frames)
+        return 0
+
+    video_source: str | int = 0
+    if cameras:
+        camera = cameras[0]
+        video_source = camera.source
+        if camera.calibration is not None:
+            config = dataclasses.replace(config, calibration=camera.calibration)
+        if camera.roi is not None:
+            config = dataclasses.replace(config, roi=camera.roi)
+
+    if args.segments is not None and args.segments > 1:
+        if args.display or not isinstance(video_source, str):
+            print("--segments requires a video file and does not support --display", file=sys.stderr)
+            return 2
+        # Segment workers only measure and log; nothing raises alerts or counts traffic.
+        unsupported = [
+            name
+            for name, value in (
+                ("speed_limit_mph alerts", config.speed_limit_mph),
+                ("--alert-jsonl", config.alert_jsonl_file),
+                ("--alert-webhook", config.alert_webhook_url),
+                ("--traffic-stats", config.traffic_stats_file),
+                ("--checkpoint-file", config.checkpoint_file),
+                ("--watch-config", args.watch_config or None),
+            )
+            if value is not None
+        ]
+        if unsupported:
+            print(f"--segments does not support {', '.join(unsupported)}", file=sys.stderr)
+            return 2
+        run_segmented(
+            config=config,
+            video_path=video_source,
+            output_path=str(args.output),
+            n_segments=int(args.segments),
+            warmup_frames=config.segment_warmup_frames,
+            max_frames=args.max_frames,
+        )
+        return 0
 
-    SpeedMonitor(config=config).run(
+    config_path = None
+    if args.watch_config:
+        if args.config is None:
+            print("--watch-config requires --config", file=sys.stderr)
+            return 2
+        config_path = Path(args.config)
+    monitor = SpeedMonitor(config=config, config_path=config_path)
+    if config_path is not None and hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda signum, frame: monitor.request_config_reload())
+    monitor.run(
         video_source=video_source,
         output_csv=str(args.output),
         display=bool(args.display),
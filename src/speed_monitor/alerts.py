@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import queue
+import sys
+import threading
+import time
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol, TextIO
+
+from .tracker import Track
+
+
+@dataclass(frozen=True)
+class SpeedAlert:
+    """Speed alert metadata for a single tracked object.
+
+    `event` is "speeding" when the track's estimate first settles above the
+    limit, and "closed" when the track ends with a higher peak than was first
+    reported; `speed_mph` is then the peak.
+    """
+    timestamp_iso: str
+    frame_idx: int
+    track_id: int
+    speed_mph: float
+    speed_limit_mph: float
+    event: str = "speeding"
+
+
+class AlertSink(Protocol):
+    """Destination for alerts. Called on the dispatcher thread only."""
+
+    def send(self, alert: SpeedAlert) -> None:
+        """Deliver one alert; exceptions are counted and logged by the dispatcher."""
+        ...
+
+    def close(self) -> None:
+        """Release resources once the dispatcher has delivered everything queued."""
+        ...
+
+
+class StdoutAlertSink:
+    """Print one line per alert."""
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        """Write to `stream` (default: sys.stdout at send time)."""
+        self._stream = stream
+
+    def send(self, alert: SpeedAlert) -> None:
+        """Print the alert as one human-readable line."""
+        label = "ALERT" if alert.event == "speeding" else "ALERT_UPDATE"
+        print(
+            f"{label} track={alert.track_id} speed={alert.speed_mph:.1f}mph "
+            f"limit={alert.speed_limit_mph:.1f}mph frame={alert.frame_idx}",
+            file=self._stream or sys.stdout,
+            flush=True,
+        )
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class JsonLinesAlertSink:
+    """Append alerts to a file as one JSON object per line."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open `path` for appending."""
+        self._file = Path(path).open("a", encoding="utf-8")
+
+    def send(self, alert: SpeedAlert) -> None:
+        """Append the alert as one JSON line and flush it."""
+        self._file.write(json.dumps(dataclasses.asdict(alert)) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+class WebhookAlertSink:
+    """POST each alert as a JSON object to an HTTP endpoint."""
+
+    def __init__(self, url: str, *, timeout_s: float = 2.0) -> None:
+        """Configure the endpoint and the per-request timeout."""
+        self._url = url
+        self._timeout_s = float(timeout_s)
+
+    def send(self, alert: SpeedAlert) -> None:
+        """POST the alert; HTTP errors and timeouts propagate to the dispatcher."""
+        request = urllib.request.Request(
+            self._url,
+            data=json.dumps(dataclasses.asdict(alert)).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self._timeout_s) as response:
+            response.read()
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+@dataclass
+class AlertStats:
+    """Counters for one dispatcher.
+
+    `suppressed` alerts were over the rate limit, `dropped` ones found the
+    queue full; neither reached any sink. `delivered` and `sink_errors` count
+    successful and failed sends, per sink.
+    """
+    raised: int = 0
+    updated: int = 0
+    suppressed: int = 0
+    dropped: int = 0
+    delivered: int = 0
+    sink_errors: int = 0
+
+
+@dataclass
+class _TrackAlertState:
+    """Alert bookkeeping for one track that has been over the limit."""
+    over_limit: int = 0
+    peak_mph: float = 0.0
+    alerted_mph: float | None = None
+
+
+class AlertDispatcher:
+    """Raise one alert per speeding track and deliver it off the frame loop.
+
+    `observe` is fed each fresh speed estimate. Once a track has
+    `min_samples` consecutive estimates above the limit it raises a single
+    "speeding" alert; later estimates only update its peak. When the track
+    closes, a "closed" alert carries the peak if it exceeds the speed first
+    reported. New alerts are limited to `max_per_minute` (token bucket, bursts
+    up to the same amount); updates for tracks already alerted always pass.
+
+    Alerts go through a bounded queue to a worker thread that calls every
+    sink in turn, so a slow or failing sink never stalls the frame loop: when
+    the queue is full the alert is dropped and counted. Use as a context
+    manager; `__exit__` delivers everything queued and closes the sinks.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(
+        self,
+        sinks: list[AlertSink],
+        *,
+        min_samples: int = 5,
+        max_per_minute: float = 30.0,
+        queue_size: int = 256,
+    ) -> None:
+        """Configure sinks, stability requirement, rate limit and queue bound."""
+        self._sinks = list(sinks)
+        self._min_samples = max(1, int(min_samples))
+        self._rate_per_s = max(0.0, float(max_per_minute)) / 60.0
+        self._burst = max(1.0, float(max_per_minute))
+        self._tokens = self._burst
+        self._refilled_s = time.monotonic()
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._thread: threading.Thread | None = None
+        self._tracks: dict[int, _TrackAlertState] = {}
+        self.stats = AlertStats()
+
+    def __enter__(self) -> "AlertDispatcher":
+        """Start the delivery thread."""
+        self._thread = threading.Thread(target=self._run, name="speed_monitor-alerts", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Deliver queued alerts, then close the sinks."""
+        if self._thread is not None:
+            self._queue.put(self._SENTINEL)
+            self._thread.join()
+            self._thread = None
+        for sink in self._sinks:
+            try:
+                sink.close()
+            except Exception as err:  # a failing sink must not break shutdown
+                print(f"Alert sink close failed: {err}", file=sys.stderr)
+
+    def observe(
+        self,
+        tr: Track,
+        frame_idx: int,
+        speed_mph: float,
+        speed_limit_mph: float | None,
+        timestamp_iso: str,
+    ) -> None:
+        """Record a fresh speed estimate for `tr`, raising its alert once stable."""
+        state = self._tracks.get(tr.track_id)
+        if speed_limit_mph is None or speed_mph <= speed_limit_mph:
+            if state is not None and state.alerted_mph is None:
+                state.over_limit = 0
+            return
+
+        if state is None:
+            state = self._tracks[tr.track_id] = _TrackAlertState()
+        state.over_limit += 1
+        state.peak_mph = max(state.peak_mph, speed_mph)
+        if state.alerted_mph is not None or state.over_limit < self._min_samples:
+            return
+        if not self._take_token():
+            self.stats.suppressed += 1
+            state.alerted_mph = float("inf")  # one decision per track
+            return
+        state.alerted_mph = speed_mph
+        self.stats.raised += 1
+        self._enqueue(SpeedAlert(timestamp_iso, frame_idx, tr.track_id, float(speed_mph), float(speed_limit_mph)))
+
+    def close(self, tr: Track, speed_limit_mph: float | None, timestamp_iso: str) -> None:
+        """Forget a closed track, sending its peak speed if it rose after the alert."""
+        state = self._tracks.pop(tr.track_id, None)
+        if state is None or state.alerted_mph is None or state.peak_mph <= state.alerted_mph:
+            return
+        self.stats.updated += 1
+        self._enqueue(
+            SpeedAlert(
+                timestamp_iso,
+                tr.last_seen_frame,
+                tr.track_id,
+                float(state.peak_mph),
+                float(speed_limit_mph) if speed_limit_mph is not None else float("nan"),
+                event="closed",
+            )
+        )
+
+    def _take_token(self) -> bool:
+        """Refill the rate-limit bucket and take one token; False if none is left."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._refilled_s) * self._rate_per_s)
+        self._refilled_s = now
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def _enqueue(self, alert: SpeedAlert) -> None:
+        """Queue an alert for delivery, counting it as dropped if the queue is full."""
+        if self._thread is None:
+            raise RuntimeError("AlertDispatcher must be used as a context manager")
+        try:
+            self._queue.put_nowait(alert)
+        except queue.Full:
+            self.stats.dropped += 1
+
+    def _run(self) -> None:
+        """Delivery loop executed on the background thread."""
+        while True:
+            alert = self._queue.get()
+            if alert is self._SENTINEL:
+                return
+            for sink in self._sinks:
+                try:
+                    sink.send(alert)
+                except Exception as exc:  # keep delivering to the other sinks
+                    self.stats.sink_errors += 1
+                    print(f"Alert sink {type(sink).__name__} failed: {exc}", file=sys.stderr)
+                else:
+                    self.stats.delivered += 1
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+
+ASSIGNMENT_METHODS = ("greedy", "optimal")
+
+
+def pairwise_distances(a_xy: np.ndarray, b_xy: np.ndarray) -> np.ndarray:
+    """Return the (len(a), len(b)) Euclidean distance matrix between point sets."""
+    a = np.asarray(a_xy, dtype=np.float64).reshape(-1, 2)
+    b = np.asarray(b_xy, dtype=np.float64).reshape(-1, 2)
+    dx = a[:, 0:1] - b[:, 0]
+    dy = a[:, 1:2] - b[:, 1]
+    return np.sqrt(dx * dx + dy * dy)
+
+
+def greedy_assignment(dist: np.ndarray, max_distance: float) -> list[tuple[int, int]]:
+    """Greedily match rows to columns of a distance matrix.
+
+    Each row proposes its nearest column (lowest index on ties); proposals are
+    then accepted in order of increasing distance if both sides are still free
+    and the distance is within `max_distance`. A row whose nearest column is
+    taken does not fall back to its second choice.
+    """
+    n_rows, n_cols = dist.shape
+    if n_rows == 0 or n_cols == 0:
+        return []
+
+    best_cols = np.argmin(dist, axis=1)
+    best_dists = dist[np.arange(n_rows), best_cols]
+    order = np.argsort(best_dists, kind="stable")
+
+    col_used = np.zeros(n_cols, dtype=bool)
+    pairs: list[tuple[int, int]] = []
+    for r in order.tolist():
+        if best_dists[r] > max_distance:
+            # Sorted ascending, so every remaining proposal is out of range too.
+            break
+        c = int(best_cols[r])
+        if col_used[c]:
+            continue
+        col_used[c] = True
+        pairs.append((r, c))
+    return pairs
+
+
+def optimal_assignment(dist: np.ndarray, max_distance: float) -> list[tuple[int, int]]:
+    """Match rows to columns minimizing total distance (Hungarian algorithm).
+
+    Pairs farther apart than `max_distance` are gated with a cost larger than
+    any combination of valid pairs, so the solver first maximizes the number of
+    valid matches and then minimizes their total distance. Gated pairs are
+    dropped from the result.
+    """
+    n_rows, n_cols = dist.shape
+    if n_rows == 0 or n_cols == 0:
+        return []
+
+    valid = dist <= max_distance
+    if not valid.any():
+        return []
+
+    gate_cost = float(dist[valid].sum()) + 1.0
+    cost = np.where(valid, dist, gate_cost)
+
+    if n_rows <= n_cols:
+        pairs = _hungarian(cost)
+    else:
+        pairs = [(r, c) for c, r in _hungarian(cost.T)]
+
+    return sorted((r, c) for r, c in pairs if valid[r, c])
+
+
+def _hungarian(cost: np.ndarray) -> list[tuple[int, int]]:
+    """Solve a rectangular assignment problem with rows <= columns.
+
+    Shortest augmenting path formulation with row/column potentials; the inner
+    column scan is vectorized, giving O(n^2 * m) total work.
+    """
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    # Column j (1-based) is assigned to row col_row[j] (1-based), 0 if free.
+    col_row = np.zeros(m + 1, dtype=np.int64)
+    way = np.zeros(m + 1, dtype=np.int64)
+
+    for i in range(1, n + 1):
+        col_row[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+
+        while True:
+            used[j0] = True
+            i0 = col_row[j0]
+            free = ~used
+            free[0] = False
+
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            improve = free[1:] & (reduced < minv[1:])
+            minv[1:][improve] = reduced[improve]
+            way[1:][improve] = j0
+
+            candidates = np.where(free[1:], minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+
+            u[col_row[used]] += delta
+            v[used] -= delta
+            minv[~used] -= delta
+
+            j0 = j1
+            if col_row[j0] == 0:
+                break
+
+        # Augment along the alternating path.
+        while j0 != 0:
+            j1 = way[j0]
+            col_row[j0] = col_row[j1]
+            j0 = j1
+
+    return [(int(col_row[j]) - 1, j - 1) for j in range(1, m + 1) if col_row[j] != 0]
+
+
+def get_assignment_solver(method: str) -> Callable[[np.ndarray, float], list[tuple[int, int]]]:
+    """Return the assignment function registered under `method`."""
+    if method == "greedy":
+        return greedy_assignment
+    if method == "optimal":
+        return optimal_assignment
+    raise ValueError(f"assignment method must be one of {', '.join(ASSIGNMENT_METHODS)}; got {method!r}")
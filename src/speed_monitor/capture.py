@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from .scheduler import StrideScheduler
+
+OVERFLOW_POLICIES = ("block", "drop_oldest")
+
+
+@dataclass(frozen=True)
+class CapturedFrame:
+    """A decoded frame tagged with its 1-based index in the source stream."""
+    frame_idx: int
+    frame: np.ndarray
+    # time.perf_counter() when decoding finished; start of end-to-end latency.
+    captured_s: float = 0.0
+
+
+@dataclass
+class CaptureStats:
+    """Counters describing how frames moved from the source to the consumer."""
+    frames_read: int = 0
+    frames_dropped: int = 0
+    # Frames advanced with grab() only (never decoded to BGR) by the scheduler.
+    frames_skipped: int = 0
+
+
+def is_live_source(video_source: str | int) -> bool:
+    """Return True if the video source looks like a live camera or stream."""
+    if isinstance(video_source, int):
+        return True
+    return "://" in str(video_source)
+
+
+def resolve_overflow_policy(policy: str, video_source: str | int) -> str:
+    """Resolve the configured overflow policy for a given video source.
+
+    `auto` blocks for files (every frame is processed) and drops the oldest
+    queued frame for live cameras (latency stays bounded).
+    """
+    if policy == "auto":
+        return "drop_oldest" if is_live_source(video_source) else "block"
+    if policy not in OVERFLOW_POLICIES:
+        raise ValueError(
+            f"capture overflow policy must be one of auto, {', '.join(OVERFLOW_POLICIES)}; got {policy!r}"
+        )
+    return policy
+
+
+class DirectCapture:
+    """Read frames synchronously on the calling thread.
+
+    With a scheduler, frames it declines are advanced with `grab()` only.
+    """
+
+    def __init__(
+        self,
+        cap: Any,
+        *,
+        max_frames: int | None = None,
+        scheduler: StrideScheduler | None = None,
+    ) -> None:
+        """Wrap an opened `cv2.VideoCapture`-like object."""
+        self._cap = cap
+        self._max_frames = max_frames
+        self._scheduler = scheduler
+        self._frame_idx = 0
+        self.stats = CaptureStats()
+
+    def start(self) -> None:
+        """No-op; present for interface parity with `ThreadedCapture`."""
+
+    def read(self) -> CapturedFrame | None:
+        """Return the next frame to process, or None at end of stream."""
+        while True:
+            if self._max_frames is not None and self._frame_idx >= self._max_frames:
+                return None
+
+            if self._scheduler is not None and not self._scheduler.should_process(self._frame_idx + 1):
+                if not self._cap.grab():
+                    return None
+                self._frame_idx += 1
+                self.stats.frames_skipped += 1
+                continue
+
+            ok, frame = self._cap.read()
+            if not ok:
+                return None
+
+            self._frame_idx += 1
+            self.stats.frames_read += 1
+            return CapturedFrame(frame_idx=self._frame_idx, frame=frame, captured_s=time.perf_counter())
+
+    def release(self) -> None:
+        """Release the underlying capture."""
+        self._cap.release()
+
+
+class ThreadedCapture:
+    """Decode frames on a background thread into a bounded queue.
+
+    The consumer calls `read()` from the processing thread. When the queue is
+    full the capture thread either blocks (`block`) or discards the oldest
+    queued frame (`drop_oldest`). Frame indices always reflect the position in
+    the source stream, so dropped frames leave gaps rather than shifting time.
+    With a scheduler, frames it declines are advanced with `grab()` only on the
+    capture thread and never enqueued.
+    """
+
+    _PUT_TIMEOUT_S = 0.1
+
+    def __init__(
+        self,
+        cap: Any,
+        *,
+        queue_size: int = 4,
+        overflow: str = "block",
+        max_frames: int | None = None,
+        scheduler: StrideScheduler | None = None,
+    ) -> None:
+        """Wrap an opened `cv2.VideoCapture`-like object."""
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(OVERFLOW_POLICIES)}; got {overflow!r}")
+
+        self._cap = cap
+        self._overflow = overflow
+        self._max_frames = max_frames
+        self._scheduler = scheduler
+        self._queue: queue.Queue[CapturedFrame | None] = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+        self._finished = False
+        self.stats = CaptureStats()
+
+    def start(self) -> None:
+        """Start the background capture thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="speed_monitor-capture", daemon=True)
+        self._thread.start()
+
+    def read(self) -> CapturedFrame | None:
+        """Return the next queued frame, or None once the stream has ended."""
+        if self._finished:
+            return None
+
+        item = self._queue.get()
+        if item is None:
+            self._finished = True
+            if self._error is not None:
+                raise RuntimeError("Capture thread failed") from self._error
+            return None
+        return item
+
+    def release(self) -> None:
+        """Stop the capture thread and release the underlying capture."""
+        self._stop.set()
+        # Unblock a producer waiting on a full queue.
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._cap.release()
+
+    def _run(self) -> None:
+        """Capture loop executed on the background thread."""
+        frame_idx = 0
+        try:
+            while not self._stop.is_set():
+                if self._max_frames is not None and frame_idx >= self._max_frames:
+                    break
+
+                if self._scheduler is not None and not self._scheduler.should_process(frame_idx + 1):
+                    if not self._cap.grab():
+                        break
+                    frame_idx += 1
+                    self.stats.frames_skipped += 1
+                    continue
+
+                ok, frame = self._cap.read()
+                if not ok:
+                    break
+
+                frame_idx += 1
+                self.stats.frames_read += 1
+                item = CapturedFrame(frame_idx=frame_idx, frame=frame, captured_s=time.perf_counter())
+                if self._overflow == "drop_oldest":
+                    self._put_drop_oldest(item)
+                else:
+                    self._put_blocking(item)
+        except BaseException as exc:  # surfaced to the consumer in read()
+            self._error = exc
+        finally:
+            self._put_blocking(None)
+
+    def _put_blocking(self, item: CapturedFrame | None) -> None:
+        """Enqueue an item, waiting for space unless the capture is stopping."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=self._PUT_TIMEOUT_S)
+                return
+            except queue.Full:
+                continue
+
+    def _put_drop_oldest(self, item: CapturedFrame) -> None:
+        """Enqueue an item, discarding the oldest queued frame if full."""
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.stats.frames_dropped += 1
+                except queue.Empty:
+                    pass
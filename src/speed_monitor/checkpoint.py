@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .tracker import Track, TrackerState, TrackHistory
+from .types import BBox
+
+CHECKPOINT_VERSION = 1
+# Track IDs reserved past the tracker's next ID at each save. A run restored
+# from the checkpoint starts numbering after the block, so IDs issued between
+# the last save and a crash are not issued again.
+CHECKPOINT_ID_BLOCK = 1000
+
+
+@dataclass
+class Checkpoint:
+    """Detector and tracker state saved by a running monitor.
+
+    `frame_idx` is the last processed frame in the saving run's numbering and
+    `saved_at_s` the wall-clock time (`time.time()`) it was written.
+    `background` is the detector's learned background at work resolution, as
+    returned by `ForegroundDetector.background_state`. `SpeedMonitor` saves
+    `tracker.next_id` as the end of the reserved block of IDs
+    (`CHECKPOINT_ID_BLOCK`), not the tracker's own next ID.
+    `tracks_summarized` is set when the saving run went on to summarize its
+    live tracks (a clean shutdown), so a resumed run must not summarize them
+    again.
+    """
+    frame_idx: int
+    saved_at_s: float
+    detector: str
+    background: np.ndarray | None
+    tracker: TrackerState
+    tracks_summarized: bool = False
+
+    def tracker_state_for_restart(
+        self,
+        *,
+        fps: float,
+        history_size: int,
+        now_s: float | None = None,
+    ) -> TrackerState:
+        """Return the tracker state renumbered for a run that starts at frame 1.
+
+        Frames are shifted so the checkpointed frame becomes frame 0, minus the
+        number of frames that elapsed (at `fps`) while no process was running.
+        Tracks therefore age across the downtime: those older than the tracker's
+        `max_age_frames` are closed on the first update, and surviving tracks
+        estimate speed with the true frame gap. Histories are rebuilt with
+        `history_size` samples of capacity, keeping the most recent.
+        """
+        now_s = time.time() if now_s is None else now_s
+        gap = max(0, int(round((now_s - self.saved_at_s) * float(fps))))
+        shift = -self.frame_idx - gap
+
+        tracks = []
+        for tr in self.tracker.tracks:
+            history = TrackHistory(history_size)
+            for f, x, y in tr.history:
+                history.append((f + shift, x, y))
+            tracks.append(
+                Track(
+                    track_id=tr.track_id,
+                    bbox=tr.bbox,
+                    last_seen_frame=tr.last_seen_frame + shift,
+                    history=history,
+                    velocity=tr.velocity,
+                )
+            )
+        return TrackerState(next_id=self.tracker.next_id, tracks=tracks)
+
+
+def save_checkpoint(path: str | Path, checkpoint: Checkpoint) -> None:
+    """Atomically replace `path` with `checkpoint` (a NumPy .npz archive)."""
+    path = Path(path)
+    tracks = checkpoint.tracker.tracks
+    histories = [tr.history.as_array() for tr in tracks]
+    meta = {
+        "version": CHECKPOINT_VERSION,
+        "frame_idx": int(checkpoint.frame_idx),
+        "saved_at_s": float(checkpoint.saved_at_s),
+        "detector": checkpoint.detector,
+        "next_id": int(checkpoint.tracker.next_id),
+        "tracks_summarized": bool(checkpoint.tracks_summarized),
+    }
+    arrays = {
+        "meta": np.array(json.dumps(meta)),
+        "track_ids": np.array([tr.track_id for tr in tracks], dtype=np.int64),
+        "track_boxes": np.array([(tr.bbox.x1, tr.bbox.y1, tr.bbox.x2, tr.bbox.y2) for tr in tracks],
+                                dtype=np.int64).reshape(-1, 4),
+        "track_last_seen": np.array([tr.last_seen_frame for tr in tracks], dtype=np.int64),
+        "track_velocity": np.array([tr.velocity if tr.velocity is not None else (np.nan, np.nan) for tr in tracks],
+                                   dtype=np.float64).reshape(-1, 2),
+        "history_lengths": np.array([len(h) for h in histories], dtype=np.int64),
+        "history": np.concatenate(histories) if histories else np.empty((0, 3)),
+    }
+    if checkpoint.background is not None:
+        arrays["background"] = checkpoint.background
+
+    # np.savez appends ".npz" to names without it, so write through a file object.
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tmp.open("wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: str | Path) -> Checkpoint | None:
+    """Read a checkpoint written by `save_checkpoint`; None if `path` does not exist.
+
+    Raises ValueError if the file is not a readable checkpoint of this version.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != CHECKPOINT_VERSION:
+                raise ValueError(f"unsupported checkpoint version {meta.get('version')!r}")
+            background = data["background"] if "background" in data.files else None
+            ids = data["track_ids"].tolist()
+            boxes = data["track_boxes"].tolist()
+            last_seen = data["track_last_seen"].tolist()
+            velocity = data["track_velocity"].tolist()
+            splits = np.cumsum(data["history_lengths"])[:-1]
+            histories = np.split(data["history"], splits) if ids else []
+    except (OSError, KeyError, json.JSONDecodeError, ValueError) as exc:
+        raise ValueError(f"Could not read checkpoint {path}: {exc}") from exc
+
+    tracks = []
+    for tid, box, seen, vel, samples in zip(ids, boxes, last_seen, velocity, histories):
+        history = TrackHistory(max(len(samples), 1))
+        for f, x, y in samples.tolist():
+            history.append((int(f), x, y))
+        tracks.append(
+            Track(
+                track_id=int(tid),
+                bbox=BBox(*box),
+                last_seen_frame=int(seen),
+                history=history,
+                velocity=None if np.isnan(vel[0]) else (vel[0], vel[1]),
+            )
+        )
+    return Checkpoint(
+        frame_idx=int(meta["frame_idx"]),
+        saved_at_s=float(meta["saved_at_s"]),
+        detector=str(meta["detector"]),
+        background=background,
+        tracker=TrackerState(next_id=int(meta["next_id"]), tracks=tracks),
+        tracks_summarized=bool(meta.get("tracks_summarized", False)),
+    )
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import csv
+import datetime as dt
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from .logger import CsvSpeedLogger, SpeedLogRow
+
+FORMAT_NAME = "speed_monitor.columnar"
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+# Fixed-width column layout (44 bytes per record).
+COLUMNS: tuple[tuple[str, str], ...] = (
+    ("timestamp_ns", "<i8"),
+    ("frame_idx", "<i8"),
+    ("track_id", "<i8"),
+    ("x1", "<i4"),
+    ("y1", "<i4"),
+    ("x2", "<i4"),
+    ("y2", "<i4"),
+    ("speed_mph", "<f4"),
+)
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def iso_to_epoch_ns(timestamp_iso: str) -> int:
+    """Convert an ISO-8601 timestamp (as logged) to integer nanoseconds since the epoch."""
+    ts = dt.datetime.fromisoformat(timestamp_iso)
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=dt.timezone.utc)
+    delta = ts - _EPOCH
+    return ((delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds) * 1_000
+
+
+def epoch_ns_to_iso(timestamp_ns: int) -> str:
+    """Convert nanoseconds since the epoch to the UTC ISO-8601 form used in CSV logs."""
+    return (_EPOCH + dt.timedelta(microseconds=int(timestamp_ns) // 1_000)).isoformat()
+
+
+class ColumnarSpeedLogger:
+    """Write speed measurements as chunked, fixed-width binary columns.
+
+    The output path is a directory holding `manifest.json` plus one
+    subdirectory per chunk with one `.npy` file per column, so readers can
+    memory-map any column without parsing. Rows are buffered in preallocated
+    arrays and written once `chunk_rows` are collected (and on close). The
+    manifest is rewritten atomically after every chunk, so a run that is cut
+    short still leaves a readable log.
+    """
+
+    def __init__(self, path: str | Path, *, chunk_rows: int = 65_536) -> None:
+        """Initialize the logger with an output directory."""
+        self._path = Path(path)
+        self._chunk_rows = max(1, int(chunk_rows))
+        self._buffers: dict[str, np.ndarray] | None = None
+        self._n = 0
+        self._chunks: list[dict[str, object]] = []
+        # Rows in a frame share one timestamp string; convert it once.
+        self._last_iso: str | None = None
+        self._last_ns = 0
+
+    def __enter__(self) -> "ColumnarSpeedLogger":
+        """Create the output directory and allocate the chunk buffers."""
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._buffers = {name: np.empty(self._chunk_rows, dtype=dtype) for name, dtype in COLUMNS}
+        self._n = 0
+        self._chunks = []
+        self._write_manifest()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Write the final partial chunk."""
+        if self._buffers is not None and self._n:
+            self._write_chunk()
+        self._buffers = None
+
+    def log(self, row: SpeedLogRow) -> None:
+        """Buffer a single speed measurement row."""
+        if self._buffers is None:
+            raise RuntimeError("ColumnarSpeedLogger must be used as a context manager")
+
+        if row.timestamp_iso != self._last_iso:
+            self._last_iso = row.timestamp_iso
+            self._last_ns = iso_to_epoch_ns(row.timestamp_iso)
+
+        i = self._n
+        b = self._buffers
+        b["timestamp_ns"][i] = self._last_ns
+        b["frame_idx"][i] = row.frame_idx
+        b["track_id"][i] = row.track_id
+        b["x1"][i] = row.x1
+        b["y1"][i] = row.y1
+        b["x2"][i] = row.x2
+        b["y2"][i] = row.y2
+        b["speed_mph"][i] = row.speed_mph
+        self._n += 1
+
+        if self._n == self._chunk_rows:
+            self._write_chunk()
+
+    def _write_chunk(self) -> None:
+        """Write buffered rows as a new chunk and update the manifest."""
+        name = f"chunk-{len(self._chunks):06d}"
+        chunk_dir = self._path / name
+        chunk_dir.mkdir(exist_ok=True)
+        for col, _dtype in COLUMNS:
+            np.save(chunk_dir / f"{col}.npy", self._buffers[col][: self._n])
+
+        self._chunks.append({"name": name, "rows": self._n})
+        self._n = 0
+        self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        """Atomically (re)write the manifest describing all complete chunks."""
+        manifest = {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "columns": [{"name": name, "dtype": dtype} for name, dtype in COLUMNS],
+            "chunks": self._chunks,
+        }
+        tmp = self._path / (MANIFEST_NAME + ".tmp")
+        tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp, self._path / MANIFEST_NAME)
+
+
+def _read_manifest(path: Path) -> dict:
+    """Load and validate a columnar log manifest."""
+    manifest = json.loads((path / MANIFEST_NAME).read_text(encoding="utf-8"))
+    if manifest.get("format") != FORMAT_NAME:
+        raise ValueError(f"{path} is not a {FORMAT_NAME} log")
+    if int(manifest.get("version", 0)) > FORMAT_VERSION:
+        raise ValueError(f"Unsupported {FORMAT_NAME} version: {manifest.get('version')}")
+    return manifest
+
+
+def iter_columnar_chunks(path: str | Path, *, mmap: bool = True) -> Iterator[dict[str, np.ndarray]]:
+    """Yield each chunk of a columnar log as a dict of column arrays.
+
+    With `mmap=True` the arrays are read-only memory maps, so scanning a large
+    log only touches the columns actually used.
+    """
+    root = Path(path)
+    manifest = _read_manifest(root)
+    mode = "r" if mmap else None
+    for chunk in manifest["chunks"]:
+        chunk_dir = root / str(chunk["name"])
+        yield {
+            col["name"]: np.load(chunk_dir / f"{col['name']}.npy", mmap_mode=mode)
+            for col in manifest["columns"]
+        }
+
+
+def read_columnar(path: str | Path) -> dict[str, np.ndarray]:
+    """Read a whole columnar log into one contiguous array per column."""
+    chunks = list(iter_columnar_chunks(path))
+    return {
+        name: (np.concatenate([c[name] for c in chunks]) if chunks else np.empty(0, dtype=dtype))
+        for name, dtype in COLUMNS
+    }
+
+
+def csv_to_columnar(csv_path: str | Path, out_path: str | Path, *, chunk_rows: int = 65_536) -> int:
+    """Convert a CSV speed log to the columnar format; return the row count."""
+    n = 0
+    with Path(csv_path).open(newline="", encoding="utf-8") as f, ColumnarSpeedLogger(
+        out_path, chunk_rows=chunk_rows
+    ) as logger:
+        for rec in csv.DictReader(f):
+            logger.log(
+                SpeedLogRow(
+                    timestamp_iso=rec["timestamp_iso"],
+                    frame_idx=int(rec["frame_idx"]),
+                    track_id=int(rec["track_id"]),
+                    x1=int(rec["x1"]),
+                    y1=int(rec["y1"]),
+                    x2=int(rec["x2"]),
+                    y2=int(rec["y2"]),
+                    speed_mph=float(rec["speed_mph"]),
+                )
+            )
+            n += 1
+    return n
+
+
+def columnar_to_csv(in_path: str | Path, csv_path: str | Path) -> int:
+    """Convert a columnar speed log back to the CSV schema; return the row count."""
+    n = 0
+    with CsvSpeedLogger(csv_path) as logger:
+        for chunk in iter_columnar_chunks(in_path):
+            cols = [chunk[name].tolist() for name, _dtype in COLUMNS]
+            for ts_ns, frame_idx, track_id, x1, y1, x2, y2, speed in zip(*cols):
+                logger.log(
+                    SpeedLogRow(
+                        timestamp_iso=epoch_ns_to_iso(ts_ns),
+                        frame_idx=frame_idx,
+                        track_id=track_id,
+                        x1=x1,
+                        y1=y1,
+                        x2=x2,
+                        y2=y2,
+                        speed_mph=speed,
+                    )
+                )
+                n += 1
+    return n
@@ -27,6 +27,25 @@ class CalibrationConfig:
     y_near: int | None = None
     y_far: int | None = None
 
+    # Optional 4-point homography: image pixels of four ground marks and their
+    # ground-plane positions in feet. When set, it replaces the feet-per-pixel
+    # model and corrects perspective in both axes.
+    homography_image_points: tuple[tuple[float, float], ...] | None = None
+    homography_ground_points_ft: tuple[tuple[float, float], ...] | None = None
+
+
+@dataclass(frozen=True)
+class CameraConfig:
+    """One video source in a multi-camera deployment.
+
+    `calibration` and `roi` override the top-level values for this camera.
+    """
+
+    camera_id: str
+    source: str | int
+    calibration: CalibrationConfig | None = None
+    roi: tuple[tuple[int, int], ...] | None = None
+
 
 @dataclass(frozen=True)
 class MonitorConfig:
@@ -35,13 +54,127 @@ class MonitorConfig:
     calibration: CalibrationConfig = CalibrationConfig()
 
     min_contour_area_px: int = 800
+    # Region of interest as polygon vertices in full-frame pixels. Detection is
+    # restricted to the polygon's bounding rectangle and masked to the polygon.
+    roi: tuple[tuple[int, int], ...] | None = None
+    # Run detection on a frame downscaled by this factor in (0, 1]; boxes are
+    # reported in native pixels.
+    detection_scale: float = 1.0
+    # Detector backend: "mog2" (MOG2 on BGR) or "frame_diff" (grayscale running
+    # average + absolute difference; much cheaper, for low-power hosts).
+    detector: str = "mog2"
+    frame_diff_alpha: float = 0.05
+    frame_diff_threshold: int = 25
     max_track_age_frames: int = 10
     match_max_distance_px: float = 80.0
+    # Tracker backend: "centroid" (nearest centroid) or "kalman" (constant
+    # velocity; matches against predicted positions and reports filtered speed).
+    tracker: str = "centroid"
+    kalman_process_noise: float = 1.0
+    kalman_measurement_noise: float = 4.0
+    # Track/detection assignment: "greedy" (nearest-first) or "optimal" (Hungarian).
+    match_assignment: str = "greedy"
+    # Hard cap on concurrently live tracks; least recently seen are evicted first.
+    max_tracks: int = 256
 
     speed_smoothing_window: int = 2
 
     speed_limit_mph: float | None = None
 
+    # Speed alerts: one per track, once `alert_min_samples` consecutive speed
+    # estimates exceed `speed_limit_mph`, plus an update with the peak speed
+    # when the track closes. Sent from a background thread to stdout, a
+    # JSON-lines file and/or a webhook (HTTP POST); at most
+    # `alert_max_per_minute` new alerts per minute.
+    alert_stdout: bool = True
+    alert_jsonl_file: str | None = None
+    alert_webhook_url: str | None = None
+    alert_webhook_timeout_s: float = 2.0
+    alert_min_samples: int = 5
+    alert_max_per_minute: float = 30.0
+    alert_queue_size: int = 256
+
+    # Streaming traffic statistics: one record per `traffic_intervals_s`
+    # bucket (vehicle count, mean, p50/p85, speed histogram) appended to
+    # `traffic_stats_file` as JSON lines. Each vehicle counts once, at its
+    # robust speed when the track closes.
+    traffic_stats_file: str | None = None
+    traffic_intervals_s: tuple[float, ...] = (60.0, 300.0, 900.0)
+    traffic_histogram_bin_mph: float = 5.0
+    traffic_max_speed_mph: float = 100.0
+
+    # Multi-camera mode: each camera runs in its own worker process; workers on
+    # live sources that exit (crash or stream end) are restarted up to
+    # `max_worker_restarts` times.
+    cameras: tuple[CameraConfig, ...] = ()
+    max_worker_restarts: int = 5
+
+    # Output content: "summary" writes one CSV row per vehicle when its track
+    # closes; "frames" writes a row per track per frame (debugging).
+    log_mode: str = "summary"
+
+    # Output format for per-frame rows: "csv" (one text row per measurement) or "columnar"
+    # (directory of chunked fixed-width binary columns, see `columnar`).
+    log_format: str = "csv"
+
+    # Background CSV writer (frames or summary rows): rows are queued and
+    # written in batches of up to `log_flush_rows` or every `log_flush_interval_s` seconds.
+    log_async: bool = False
+    log_flush_rows: int = 256
+    log_flush_interval_s: float = 1.0
+
+    # Capture pipeline: decode on a background thread into a bounded queue.
+    # Overflow policy is `block`, `drop_oldest`, or `auto` (block for files,
+    # drop oldest for live cameras).
+    capture_threaded: bool = False
+    capture_queue_size: int = 4
+    capture_overflow: str = "auto"
+
+    # Adaptive frame stride: when processing can't keep up, fully process only
+    # one frame in N (others are grabbed without decoding to BGR) so latency
+    # stays within the per-frame budget (default 1000 / calibration.fps ms).
+    adaptive_stride: bool = False
+    latency_budget_ms: float | None = None
+    max_frame_stride: int = 4
+
+    # Segmented processing of recorded videos: each worker decodes this many
+    # frames before its segment to warm up the background model and tracker.
+    segment_warmup_frames: int = 100
+
+    # Per-stage latency instrumentation. `metrics_enabled` prints a summary to
+    # stderr every `metrics_interval_s`; `metrics_file` (also enables
+    # instrumentation) is rewritten in Prometheus text format each interval.
+    metrics_enabled: bool = False
+    metrics_file: str | None = None
+    metrics_interval_s: float = 10.0
+    metrics_budget_ms: float = 100.0
+
+    # `--display` window: rendered on its own thread at most `display_max_fps`
+    # times per second, optionally downscaled by `display_scale` in (0, 1].
+    display_max_fps: float = 15.0
+    display_scale: float = 1.0
+
+    # Idle mode for quiet roads: after `idle_after_frames` frames with no
+    # detections or tracks, only a tiny thumbnail frame difference runs until
+    # motion is seen; the detector still runs every `idle_refresh_frames`.
+    idle_gate: bool = False
+    idle_after_frames: int = 150
+    idle_thumbnail_width: int = 64
+    idle_motion_threshold: int = 12
+    idle_motion_fraction: float = 0.002
+    idle_refresh_frames: int = 30
+
+    # Warm restarts: the background model and live tracks are saved to
+    # `checkpoint_file` every `checkpoint_interval_s` and on exit, and loaded
+    # from it at startup. Tracks survive only gaps shorter than their max age.
+    checkpoint_file: str | None = None
+    checkpoint_interval_s: float = 60.0
+
+    # With `--watch-config`, the config file is checked for changes every
+    # `config_poll_interval_s` (0: only on SIGHUP) and tunable fields are
+    # applied between frames; see `reload.RELOADABLE_FIELDS`.
+    config_poll_interval_s: float = 1.0
+
 
 def _coerce_calibration(data: dict[str, Any]) -> CalibrationConfig:
     """Normalize calibration values read from JSON."""
@@ -55,9 +188,71 @@ def _coerce_calibration(data: dict[str, Any]) -> CalibrationConfig:
         ),
         y_near=(None if data.get("y_near") is None else int(data["y_near"])),
         y_far=(None if data.get("y_far") is None else int(data["y_far"])),
+        **_coerce_homography(data.get("homography")),
     )
 
 
+def _coerce_homography(data: Any) -> dict[str, Any]:
+    """Normalize `{"image_points": [...], "ground_points_ft": [...]}` read from JSON."""
+    if data is None:
+        return {}
+
+    points = {}
+    for key in ("image_points", "ground_points_ft"):
+        pts = data.get(key)
+        if pts is None or len(pts) != 4 or any(len(p) != 2 for p in pts):
+            raise ValueError(f"homography.{key} must be four [x, y] points")
+        points[key] = tuple((float(p[0]), float(p[1])) for p in pts)
+    return {
+        "homography_image_points": points["image_points"],
+        "homography_ground_points_ft": points["ground_points_ft"],
+    }
+
+
+def _coerce_roi(data: Any) -> tuple[tuple[int, int], ...] | None:
+    """Normalize an ROI read from JSON.
+
+    Accepts either a rectangle `[x1, y1, x2, y2]` (x2/y2 exclusive, like BBox)
+    or a polygon `[[x, y], [x, y], [x, y], ...]` with at least three vertices.
+    """
+    if data is None:
+        return None
+
+    if len(data) == 4 and all(isinstance(v, (int, float)) for v in data):
+        x1, y1, x2, y2 = (int(v) for v in data)
+        if x2 <= x1 or y2 <= y1:
+            raise ValueError(f"roi rectangle must have x2 > x1 and y2 > y1; got {data!r}")
+        return ((x1, y1), (x2 - 1, y1), (x2 - 1, y2 - 1), (x1, y2 - 1))
+
+    points = tuple((int(p[0]), int(p[1])) for p in data)
+    if len(points) < 3:
+        raise ValueError(f"roi polygon needs at least 3 points; got {data!r}")
+    return points
+
+
+def _coerce_cameras(data: list[dict[str, Any]]) -> tuple[CameraConfig, ...]:
+    """Normalize the list of cameras read from JSON."""
+    cameras = []
+    for i, cam in enumerate(data):
+        if "source" not in cam:
+            raise ValueError(f"camera #{i} is missing 'source'")
+        cameras.append(
+            CameraConfig(
+                camera_id=str(cam.get("id", f"cam{i}")),
+                source=cam["source"] if isinstance(cam["source"], int) else str(cam["source"]),
+                calibration=(
+                    None if cam.get("calibration") is None else _coerce_calibration(cam["calibration"])
+                ),
+                roi=_coerce_roi(cam.get("roi")),
+            )
+        )
+
+    ids = [c.camera_id for c in cameras]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"camera ids must be unique; got {ids}")
+    return tuple(cameras)
+
+
 def load_config(path: str | Path) -> MonitorConfig:
     """Load monitor config from a JSON file."""
 
@@ -70,12 +265,66 @@ def load_config(path: str | Path) -> MonitorConfig:
     return MonitorConfig(
         calibration=calibration,
         min_contour_area_px=int(payload.get("min_contour_area_px", 800)),
+        roi=_coerce_roi(payload.get("roi")),
+        detection_scale=float(payload.get("detection_scale", 1.0)),
+        detector=str(payload.get("detector", "mog2")),
+        frame_diff_alpha=float(payload.get("frame_diff_alpha", 0.05)),
+        frame_diff_threshold=int(payload.get("frame_diff_threshold", 25)),
         max_track_age_frames=int(payload.get("max_track_age_frames", 10)),
         match_max_distance_px=float(payload.get("match_max_distance_px", 80.0)),
+        tracker=str(payload.get("tracker", "centroid")),
+        kalman_process_noise=float(payload.get("kalman_process_noise", 1.0)),
+        kalman_measurement_noise=float(payload.get("kalman_measurement_noise", 4.0)),
+        match_assignment=str(payload.get("match_assignment", "greedy")),
+        max_tracks=int(payload.get("max_tracks", 256)),
         speed_smoothing_window=int(payload.get("speed_smoothing_window", 2)),
         speed_limit_mph=(
             None
             if payload.get("speed_limit_mph") is None
             else float(payload["speed_limit_mph"])
         ),
+        alert_stdout=bool(payload.get("alert_stdout", True)),
+        alert_jsonl_file=None if payload.get("alert_jsonl_file") is None else str(payload["alert_jsonl_file"]),
+        alert_webhook_url=None if payload.get("alert_webhook_url") is None else str(payload["alert_webhook_url"]),
+        alert_webhook_timeout_s=float(payload.get("alert_webhook_timeout_s", 2.0)),
+        alert_min_samples=int(payload.get("alert_min_samples", 5)),
+        alert_max_per_minute=float(payload.get("alert_max_per_minute", 30.0)),
+        alert_queue_size=int(payload.get("alert_queue_size", 256)),
+        traffic_stats_file=None if payload.get("traffic_stats_file") is None else str(payload["traffic_stats_file"]),
+        traffic_intervals_s=tuple(float(v) for v in payload.get("traffic_intervals_s", (60.0, 300.0, 900.0))),
+        traffic_histogram_bin_mph=float(payload.get("traffic_histogram_bin_mph", 5.0)),
+        traffic_max_speed_mph=float(payload.get("traffic_max_speed_mph", 100.0)),
+        cameras=_coerce_cameras(payload.get("cameras", [])),
+        max_worker_restarts=int(payload.get("max_worker_restarts", 5)),
+        log_mode=str(payload.get("log_mode", "summary")),
+        log_format=str(payload.get("log_format", "csv")),
+        log_async=bool(payload.get("log_async", False)),
+        log_flush_rows=int(payload.get("log_flush_rows", 256)),
+        log_flush_interval_s=float(payload.get("log_flush_interval_s", 1.0)),
+        capture_threaded=bool(payload.get("capture_threaded", False)),
+        capture_queue_size=int(payload.get("capture_queue_size", 4)),
+        capture_overflow=str(payload.get("capture_overflow", "auto")),
+        adaptive_stride=bool(payload.get("adaptive_stride", False)),
+        latency_budget_ms=(
+            None
+            if payload.get("latency_budget_ms") is None
+            else float(payload["latency_budget_ms"])
+        ),
+        max_frame_stride=int(payload.get("max_frame_stride", 4)),
+        segment_warmup_frames=int(payload.get("segment_warmup_frames", 100)),
+        metrics_enabled=bool(payload.get("metrics_enabled", False)),
+        metrics_file=None if payload.get("metrics_file") is None else str(payload["metrics_file"]),
+        metrics_interval_s=float(payload.get("metrics_interval_s", 10.0)),
+        metrics_budget_ms=float(payload.get("metrics_budget_ms", 100.0)),
+        display_max_fps=float(payload.get("display_max_fps", 15.0)),
+        display_scale=float(payload.get("display_scale", 1.0)),
+        idle_gate=bool(payload.get("idle_gate", False)),
+        idle_after_frames=int(payload.get("idle_after_frames", 150)),
+        idle_thumbnail_width=int(payload.get("idle_thumbnail_width", 64)),
+        idle_motion_threshold=int(payload.get("idle_motion_threshold", 12)),
+        idle_motion_fraction=float(payload.get("idle_motion_fraction", 0.002)),
+        idle_refresh_frames=int(payload.get("idle_refresh_frames", 30)),
+        checkpoint_file=None if payload.get("checkpoint_file") is None else str(payload["checkpoint_file"]),
+        checkpoint_interval_s=float(payload.get("checkpoint_interval_s", 60.0)),
+        config_poll_interval_s=float(payload.get("config_poll_interval_s", 1.0)),
     )
@@ -1,21 +1,256 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from functools import partial
 
 import cv2
 import numpy as np
 
-from .types import BBox
+from .types import BBox, Detections
 
 
 @dataclass
 class DetectorResult:
-    bboxes: list[BBox]
-    foreground_mask: np.ndarray | None = None
+    """Detections for one frame.
 
+    `foreground_mask` covers only the detector's region of interest, at the
+    detection resolution; its top-left corner sits at `foreground_offset` in
+    full-frame coordinates and it is `foreground_scale` times the size of the
+    region it covers. `detections` are always in full-frame coordinates;
+    `bboxes` returns them as a list of `BBox` for callers that want objects.
 
-class BackgroundSubtractorDetector:
-    """Baseline vehicle detector using background subtraction.
+    The detector works in reused buffers, so the mask is copied out only when
+    `foreground_mask` is first read, which must happen before the detector's
+    next `detect` call.
+    """
+    detections: Detections
+    foreground_offset: tuple[int, int] = (0, 0)
+    foreground_scale: float = 1.0
+    _mask_source: Callable[[], np.ndarray] | None = field(default=None, repr=False, compare=False)
+    _mask: np.ndarray | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def bboxes(self) -> list[BBox]:
+        """The detections as `BBox` objects."""
+        return self.detections.to_bboxes()
+
+    @property
+    def foreground_mask(self) -> np.ndarray | None:
+        """Foreground mask of the region of interest, copied out on first read."""
+        if self._mask is None and self._mask_source is not None:
+            self._mask = self._mask_source()
+            self._mask_source = None
+        return self._mask
+
+
+@dataclass(frozen=True)
+class _WorkView:
+    """Crop and resize geometry resolved for a particular frame size."""
+    # Crop rectangle in full-frame pixels.
+    x: int
+    y: int
+    w: int
+    h: int
+    # Size the crop is resized to before detection.
+    work_w: int
+    work_h: int
+    # ROI polygon mask at work resolution, None if nothing is masked.
+    mask: np.ndarray | None
+
+
+def _scaled_kernel(size: int, scale: float) -> np.ndarray:
+    """Return an elliptical kernel scaled to the detection resolution (odd size)."""
+    k = max(1, int(round(size * scale)))
+    if k % 2 == 0:
+        k += 1
+    return cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (k, k))
+
+
+class ForegroundDetector:
+    """Shared crop/resize and mask post-processing for foreground detectors.
+
+    If a region of interest is given, every stage (foreground model,
+    morphology, contours) runs on the ROI's bounding rectangle only,
+    foreground outside the polygon is masked out, and boxes are translated
+    back to full-frame coordinates.
+
+    With `scale` < 1 the (cropped) frame is downscaled with INTER_AREA before
+    detection; the contour area threshold and morphology kernels are scaled to
+    match and boxes are mapped back to native pixels, so calibration and logs
+    stay in full-resolution units.
+
+    Subclasses implement `_foreground`, turning the work-resolution frame into
+    a binary (0/255) mask, and may override `_preprocess` to convert the crop
+    before it is resized.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_contour_area_px: int = 800,
+        roi: Sequence[tuple[int, int]] | None = None,
+        scale: float = 1.0,
+    ) -> None:
+        if not 0.0 < float(scale) <= 1.0:
+            raise ValueError(f"scale must be in (0, 1]; got {scale!r}")
+
+        self._scale = float(scale)
+        self._min_contour_area_px = int(min_contour_area_px)
+        # Area scales with the square of the linear factor.
+        self._min_area_work_px = float(min_contour_area_px) * self._scale * self._scale
+        self._roi = None if roi is None else np.array(roi, dtype=np.int32).reshape(-1, 2)
+        self._view: _WorkView | None = None
+        self._view_frame_shape: tuple[int, int] | None = None
+        # Work buffers reused across frames, keyed by name; see `_buffer`.
+        self._buffers: dict[str, np.ndarray] = {}
+        self._generation = 0
+        self._seed: np.ndarray | None = None
+
+        self._kernel_open = _scaled_kernel(5, self._scale)
+        self._kernel_close = _scaled_kernel(7, self._scale)
+
+    def _preprocess(self, crop: np.ndarray) -> np.ndarray:
+        """Convert the cropped frame before resizing (identity by default)."""
+        return crop
+
+    def configure(self, *, min_contour_area_px: int | None = None) -> None:
+        """Change tunable thresholds between frames; the background model is kept."""
+        if min_contour_area_px is not None:
+            self._min_contour_area_px = int(min_contour_area_px)
+            self._min_area_work_px = float(min_contour_area_px) * self._scale * self._scale
+
+    def background_state(self) -> np.ndarray | None:
+        """Return a copy of the learned background at work resolution, if any."""
+        return None
+
+    def seed_background(self, background: np.ndarray) -> None:
+        """Seed the background model from `background_state()` of an earlier run.
+
+        The seed is applied on the next `detect` call if its shape matches the
+        work resolution for that frame (same ROI, scale and frame size), and
+        dropped otherwise.
+        """
+        self._seed = np.asarray(background)
+
+    def _take_seed(self, shape: tuple[int, ...]) -> np.ndarray | None:
+        """Return the pending seed if it fits `shape`; the seed is consumed either way."""
+        seed, self._seed = self._seed, None
+        if seed is None or seed.shape != shape:
+            return None
+        return seed
+
+    def _foreground(self, work: np.ndarray) -> np.ndarray:
+        """Return the binary foreground mask for the work-resolution frame.
+
+        Implementations should write into `self._buffer("fg", work.shape[:2])`.
+        """
+        raise NotImplementedError
+
+    def _buffer(self, name: str, shape: tuple[int, ...], dtype: type = np.uint8) -> np.ndarray:
+        """Return the reusable work buffer `name`, reallocating only if its shape changed."""
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buf
+        return buf
+
+    def _copy_mask(self, generation: int) -> np.ndarray:
+        """Copy the foreground mask of frame `generation` out of the work buffer."""
+        if generation != self._generation:
+            raise RuntimeError("foreground_mask must be read before the next detect() call")
+        return self._buffers["fg"].copy()
+
+    def _resolve_view(self, frame_shape: tuple[int, int]) -> _WorkView:
+        """Clip the ROI to the frame and size the work buffers (cached per size)."""
+        if self._view is not None and self._view_frame_shape == frame_shape:
+            return self._view
+
+        frame_h, frame_w = frame_shape
+        if self._roi is None:
+            x1, y1, x2, y2 = 0, 0, frame_w, frame_h
+        else:
+            bx, by, bw, bh = cv2.boundingRect(self._roi)
+            x1, y1 = max(0, bx), max(0, by)
+            x2, y2 = min(frame_w, bx + bw), min(frame_h, by + bh)
+            if x2 <= x1 or y2 <= y1:
+                raise ValueError(f"ROI {self._roi.tolist()} lies outside the {frame_w}x{frame_h} frame")
+
+        w, h = x2 - x1, y2 - y1
+        work_w = max(1, int(round(w * self._scale)))
+        work_h = max(1, int(round(h * self._scale)))
+
+        mask = None
+        if self._roi is not None:
+            full_mask = np.zeros((h, w), dtype=np.uint8)
+            cv2.fillPoly(full_mask, [self._roi - np.array([x1, y1], dtype=np.int32)], 255)
+            # Axis-aligned rectangles need no masking, only cropping.
+            if not full_mask.all():
+                mask = full_mask
+                if (work_w, work_h) != (w, h):
+                    mask = cv2.resize(full_mask, (work_w, work_h), interpolation=cv2.INTER_NEAREST)
+
+        self._view = _WorkView(x=x1, y=y1, w=w, h=h, work_w=work_w, work_h=work_h, mask=mask)
+        self._view_frame_shape = frame_shape
+        return self._view
+
+    def detect(self, frame_bgr: np.ndarray) -> DetectorResult:
+        """Detect moving objects in a BGR frame."""
+        view = self._resolve_view(frame_bgr.shape[:2])
+        if self._roi is not None:
+            frame_bgr = frame_bgr[view.y : view.y + view.h, view.x : view.x + view.w]
+        frame_bgr = self._preprocess(frame_bgr)
+        if (view.work_w, view.work_h) != (view.w, view.h):
+            frame_bgr = cv2.resize(
+                frame_bgr,
+                (view.work_w, view.work_h),
+                dst=self._buffer("work", (view.work_h, view.work_w, *frame_bgr.shape[2:])),
+                interpolation=cv2.INTER_AREA,
+            )
+
+        fg = self._foreground(frame_bgr)
+
+        if view.mask is not None:
+            cv2.bitwise_and(fg, view.mask, dst=fg)
+
+        opened = self._buffer("morph", fg.shape)
+        cv2.morphologyEx(fg, cv2.MORPH_OPEN, self._kernel_open, dst=opened, iterations=1)
+        cv2.morphologyEx(opened, cv2.MORPH_CLOSE, self._kernel_close, dst=fg, iterations=2)
+        self._generation += 1
+
+        contours, _hier = cv2.findContours(fg, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        return DetectorResult(
+            detections=self._contours_to_detections(contours, view),
+            foreground_offset=(view.x, view.y),
+            foreground_scale=view.work_w / view.w,
+            _mask_source=partial(self._copy_mask, self._generation),
+        )
+
+    def _contours_to_detections(self, contours: Sequence[np.ndarray], view: _WorkView) -> Detections:
+        """Filter contours by area and map their bounding boxes to full-frame pixels."""
+        areas = [cv2.contourArea(c) for c in contours]
+        keep = [i for i, area in enumerate(areas) if area >= self._min_area_work_px]
+        if not keep:
+            return Detections(np.empty((0, 4), dtype=np.int64), np.empty(0))
+
+        boxes = np.array([cv2.boundingRect(contours[i]) for i in keep], dtype=np.int64)
+        boxes[:, 2:] += boxes[:, :2]  # (x, y, w, h) -> (x1, y1, x2, y2)
+        area = np.array([areas[i] for i in keep])
+        if (view.work_w, view.work_h) != (view.w, view.h):
+            # Work-resolution -> full-resolution factors (exact per axis after rounding).
+            f = np.array([view.w / view.work_w, view.h / view.work_h])
+            boxes = np.hstack((
+                np.floor(boxes[:, :2] * f),
+                np.minimum(np.ceil(boxes[:, 2:] * f), (view.w, view.h)),
+            )).astype(np.int64)
+            area *= f[0] * f[1]
+        boxes += (view.x, view.y, view.x, view.y)
+        return Detections(boxes, area)
+
+
+class BackgroundSubtractorDetector(ForegroundDetector):
+    """Baseline vehicle detector using MOG2 background subtraction on BGR frames.
 
     This works best with a fixed camera, which matches the SSD.
 
@@ -31,38 +266,126 @@ class BackgroundSubtractorDetector:
         history: int = 100,
         var_threshold: float = 32.0,
         detect_shadows: bool = False,
+        roi: Sequence[tuple[int, int]] | None = None,
+        scale: float = 1.0,
     ) -> None:
-        self._min_contour_area_px = int(min_contour_area_px)
+        """Initialize the detector and its MOG2 background model."""
+        super().__init__(min_contour_area_px=min_contour_area_px, roi=roi, scale=scale)
         self._bg = cv2.createBackgroundSubtractorMOG2(
             history=int(history),
             varThreshold=float(var_threshold),
             detectShadows=bool(detect_shadows),
         )
 
-        self._kernel_open = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        self._kernel_close = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (7, 7))
-
-    def detect(self, frame_bgr: np.ndarray) -> DetectorResult:
-        fg = self._bg.apply(frame_bgr)
+    def background_state(self) -> np.ndarray | None:
+        """Return MOG2's background image, or None before it has learned one."""
+        try:
+            return self._bg.getBackgroundImage()
+        except cv2.error:  # nothing learned yet
+            return None
 
+    def _foreground(self, work: np.ndarray) -> np.ndarray:
+        """Update the MOG2 model with `work` and return its foreground mask, shadows dropped."""
+        fg = self._buffer("fg", work.shape[:2])
+        seed = self._take_seed(work.shape)
+        if seed is not None:
+            # A learning rate of 1 reinitializes the model from the given image.
+            self._bg.apply(seed, fgmask=fg, learningRate=1.0)
+        self._bg.apply(work, fgmask=fg)
         # Drop shadow class (127) if enabled.
-        _, fg = cv2.threshold(fg, 200, 255, cv2.THRESH_BINARY)
+        cv2.threshold(fg, 200, 255, cv2.THRESH_BINARY, dst=fg)
+        return fg
 
-        fg = cv2.morphologyEx(fg, cv2.MORPH_OPEN, self._kernel_open, iterations=1)
-        fg = cv2.morphologyEx(fg, cv2.MORPH_CLOSE, self._kernel_close, iterations=2)
 
-        contours, _hier = cv2.findContours(fg, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+# Background learning rate for foreground pixels, relative to `alpha`.
+_FOREGROUND_RATE = 0.1
+
+
+class FrameDifferenceDetector(ForegroundDetector):
+    """Lightweight detector: grayscale running-average background and absolute difference.
+
+    The background is an exponential moving average of grayscale frames
+    (`cv2.accumulateWeighted` with rate `alpha`, a tenth of that for pixels
+    currently foreground); pixels differing from it by more than
+    `diff_threshold` grey levels are foreground. It does a fraction of MOG2's
+    per-pixel work, at the cost of a single-mode background (no swaying
+    trees, slower recovery from lighting changes) and slowly fading ghosts
+    where vehicles were present in the first frame.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_contour_area_px: int = 800,
+        alpha: float = 0.05,
+        diff_threshold: int = 25,
+        roi: Sequence[tuple[int, int]] | None = None,
+        scale: float = 1.0,
+    ) -> None:
+        """Initialize the detector; the background is taken from the first frame."""
+        if not 0.0 < float(alpha) <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1]; got {alpha!r}")
+        super().__init__(min_contour_area_px=min_contour_area_px, roi=roi, scale=scale)
+        self._alpha = float(alpha)
+        self._diff_threshold = int(diff_threshold)
+        self._background: np.ndarray | None = None
+
+    def _preprocess(self, crop: np.ndarray) -> np.ndarray:
+        """Convert the cropped frame to grayscale."""
+        # Convert before resizing so INTER_AREA works on one channel.
+        return cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY, dst=self._buffer("gray", crop.shape[:2]))
+
+    def configure(
+        self,
+        *,
+        min_contour_area_px: int | None = None,
+        alpha: float | None = None,
+        diff_threshold: int | None = None,
+    ) -> None:
+        """Change thresholds and the learning rate between frames; the background is kept."""
+        if alpha is not None and not 0.0 < float(alpha) <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1]; got {alpha!r}")
+        super().configure(min_contour_area_px=min_contour_area_px)
+        if alpha is not None:
+            self._alpha = float(alpha)
+        if diff_threshold is not None:
+            self._diff_threshold = int(diff_threshold)
+
+    def background_state(self) -> np.ndarray | None:
+        """Return a copy of the running-average background, or None before the first frame."""
+        return None if self._background is None else self._background.copy()
+
+    def _foreground(self, work: np.ndarray) -> np.ndarray:
+        """Threshold the difference from the running background, then update the background."""
+        fg = self._buffer("fg", work.shape)
+        seed = self._take_seed(work.shape)
+        if seed is not None:
+            self._background = seed.astype(np.float32)
+        if self._background is None or self._background.shape != work.shape:
+            self._background = work.astype(np.float32)
+            fg.fill(0)
+            return fg
+
+        background_u8 = cv2.convertScaleAbs(self._background, dst=self._buffer("background_u8", work.shape))
+        cv2.absdiff(work, background_u8, dst=fg)
+        cv2.threshold(fg, self._diff_threshold, 255, cv2.THRESH_BINARY, dst=fg)
+        # Selective update: foreground pixels blend in slowly, so passing
+        # vehicles leave no trail while stopped ones are still absorbed.
+        not_fg = cv2.bitwise_not(fg, dst=self._buffer("not_fg", work.shape))
+        cv2.accumulateWeighted(work, self._background, self._alpha, mask=not_fg)
+        cv2.accumulateWeighted(work, self._background, self._alpha * _FOREGROUND_RATE, mask=fg)
+        return fg
 
-        bboxes: list[BBox] = []
-        for c in contours:
-            area = cv2.contourArea(c)
-            if area < self._min_contour_area_px:
-                continue
 
-            x, y, w, h = cv2.boundingRect(c)
-            if w <= 0 or h <= 0:
-                continue
+DETECTOR_BACKENDS: dict[str, type[ForegroundDetector]] = {
+    "mog2": BackgroundSubtractorDetector,
+    "frame_diff": FrameDifferenceDetector,
+}
 
-            bboxes.append(BBox(x1=int(x), y1=int(y), x2=int(x + w), y2=int(y + h)))
 
-        return DetectorResult(bboxes=bboxes, foreground_mask=fg)
+def get_detector_class(name: str) -> type[ForegroundDetector]:
+    """Return the detector class registered under `name`."""
+    try:
+        return DETECTOR_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"detector must be one of {', '.join(DETECTOR_BACKENDS)}; got {name!r}") from None
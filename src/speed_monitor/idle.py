@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+MODES = ("active", "idle", "refresh")
+
+# Frame samples per thumbnail pixel along each axis.
+_SAMPLES_PER_AXIS = 4
+
+
+@dataclass
+class GateStats:
+    """Frames handled in each mode of the motion gate.
+
+    `active` frames ran the full detector, `idle` frames only the thumbnail
+    check, and `refresh` frames were idle frames that ran the detector anyway
+    to keep the background model current.
+    """
+    frames_active: int = 0
+    frames_idle: int = 0
+    frames_refresh: int = 0
+    wakeups: int = 0
+
+    @property
+    def frames_total(self) -> int:
+        """Frames seen by the gate in any mode."""
+        return self.frames_active + self.frames_idle + self.frames_refresh
+
+    def fractions(self) -> dict[str, float]:
+        """Fraction of frames handled in each mode (all zero before the first frame)."""
+        total = self.frames_total
+        counts = (self.frames_active, self.frames_idle, self.frames_refresh)
+        return {mode: (n / total if total else 0.0) for mode, n in zip(MODES, counts)}
+
+    def summary_line(self) -> str:
+        """One-line human-readable summary."""
+        frac = self.fractions()
+        return (
+            f"idle_gate frames={self.frames_total} "
+            + " ".join(f"{mode}={100.0 * frac[mode]:.1f}%" for mode in MODES)
+            + f" wakeups={self.wakeups}"
+        )
+
+
+class MotionGate:
+    """Skip full detection on quiet roads until something moves.
+
+    The gate starts active. After `idle_after_frames` consecutive frames with
+    no detections and no live tracks it goes idle: each frame is reduced to a
+    tiny grayscale thumbnail (a sparse sample grid averaged down, so the cost
+    is ~0.2 ms whatever the resolution) and compared with the previous one.
+    If more than `motion_fraction` of the thumbnail's pixels changed by more
+    than `motion_threshold` grey levels, the gate wakes and that same frame
+    gets full detection. While idle, every `refresh_interval` frames still
+    runs the detector so the background model keeps learning, at a low rate.
+
+    With an ROI only its bounding rectangle is watched.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_after_frames: int = 150,
+        thumbnail_width: int = 64,
+        motion_threshold: int = 12,
+        motion_fraction: float = 0.002,
+        refresh_interval: int = 30,
+        roi: Sequence[tuple[int, int]] | None = None,
+    ) -> None:
+        """Configure when to go idle, what counts as motion and the refresh rate."""
+        if idle_after_frames < 1:
+            raise ValueError("idle_after_frames must be >= 1")
+        if thumbnail_width < 8:
+            raise ValueError("thumbnail_width must be >= 8")
+        self._idle_after = int(idle_after_frames)
+        self._thumb_w = int(thumbnail_width)
+        self._threshold = int(motion_threshold)
+        self._fraction = float(motion_fraction)
+        self._refresh = max(0, int(refresh_interval))
+        self._roi_rect = None if roi is None else cv2.boundingRect(np.array(roi, dtype=np.int32).reshape(-1, 2))
+
+        self.idle = False
+        self._quiet_frames = 0
+        self._idle_frames = 0
+        self._prev: np.ndarray | None = None
+        self.stats = GateStats()
+
+    @property
+    def mode(self) -> str:
+        """Current mode, `active` or `idle`."""
+        return "idle" if self.idle else "active"
+
+    def should_detect(self, frame_bgr: np.ndarray) -> bool:
+        """Return True if this frame needs the full detector."""
+        if not self.idle:
+            self.stats.frames_active += 1
+            return True
+
+        self._idle_frames += 1
+        thumb = self._thumbnail(frame_bgr)
+        if self._prev is not None and self._moved(thumb):
+            self._wake()
+            self.stats.frames_active += 1
+            return True
+        self._prev = thumb
+
+        if self._refresh and self._idle_frames % self._refresh == 0:
+            self.stats.frames_refresh += 1
+            return True
+        self.stats.frames_idle += 1
+        return False
+
+    def observe(self, n_detections: int, n_tracks: int) -> None:
+        """Feed back the outcome of a detected frame."""
+        if n_detections or n_tracks:
+            if self.idle:
+                self._wake()  # a refresh frame found something
+            self._quiet_frames = 0
+            return
+
+        if not self.idle:
+            self._quiet_frames += 1
+            if self._quiet_frames >= self._idle_after:
+                self.idle = True
+                self._idle_frames = 0
+                self._prev = None
+
+    def _wake(self) -> None:
+        """Leave idle mode and restart the quiet-frame count."""
+        self.idle = False
+        self._quiet_frames = 0
+        self.stats.wakeups += 1
+
+    def _thumbnail(self, frame_bgr: np.ndarray) -> np.ndarray:
+        """Downscale the watched region to a small grayscale thumbnail."""
+        if self._roi_rect is not None:
+            x, y, w, h = self._roi_rect
+            frame_bgr = frame_bgr[max(0, y) : y + h, max(0, x) : x + w]
+        h, w = frame_bgr.shape[:2]
+        tw = min(self._thumb_w, w)
+        th = max(1, int(round(h * tw / w)))
+        # Sample a grid 4x the thumbnail size, then average it down: the cost
+        # does not grow with the frame, and each thumbnail pixel still averages
+        # 16 samples, which keeps sensor noise well below the threshold.
+        grid = cv2.resize(
+            frame_bgr,
+            (min(w, _SAMPLES_PER_AXIS * tw), min(h, _SAMPLES_PER_AXIS * th)),
+            interpolation=cv2.INTER_NEAREST,
+        )
+        small = cv2.resize(grid, (tw, th), interpolation=cv2.INTER_AREA)
+        return small if small.ndim == 2 else cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+    def _moved(self, thumb: np.ndarray) -> bool:
+        """True if enough thumbnail pixels changed since the previous idle frame."""
+        if self._prev.shape != thumb.shape:
+            return False
+        diff = cv2.absdiff(thumb, self._prev)
+        changed = int(np.count_nonzero(diff > self._threshold))
+        return changed > self._fraction * thumb.size
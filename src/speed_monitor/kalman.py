@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from .assignment import pairwise_distances
+from .tracker import DEFAULT_HISTORY_SIZE, CentroidTracker, Track, TrackerState, as_detections
+from .types import BBox, Detections
+
+# Measurement matrix: we observe the centroid (x, y) of the 4-D state.
+_H = np.array([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]])
+
+
+class KalmanTracker(CentroidTracker):
+    """
+    A constant-velocity Kalman tracker with the same interface as CentroidTracker.
+
+    The state of every live track is one row of stacked NumPy arrays: `_x`
+    holds (x, y, vx, vy) in pixels and pixels/frame, `_p` the 4x4 covariances.
+    Each `update` predicts all tracks to the current frame in a single batched
+    step (per-track time deltas, so tracks that missed detections or frames
+    skipped by the scheduler are extrapolated correctly), matches detections
+    against the predicted positions, and corrects the matched rows in a second
+    batched step. The filtered velocity is published on `Track.velocity`.
+
+    Attributes:
+        _process_noise: Acceleration noise standard deviation (px/frame^2).
+        _measurement_noise: Centroid measurement noise standard deviation (px).
+        _ids: Track ID for each state row.
+        _x: (N, 4) state vectors.
+        _p: (N, 4, 4) state covariances.
+        _t: (N,) frame index each state row is valid at.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_age_frames: int = 10,
+        match_max_distance_px: float = 80.0,
+        assignment: str = "greedy",
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        max_tracks: int = 256,
+        report_closed: bool = False,
+        process_noise: float = 1.0,
+        measurement_noise: float = 4.0,
+        initial_velocity_std: float = 20.0,
+    ) -> None:
+        """Initialize the tracker; the noise terms are standard deviations, in pixel units."""
+        super().__init__(
+            max_age_frames=max_age_frames,
+            match_max_distance_px=match_max_distance_px,
+            assignment=assignment,
+            history_size=history_size,
+            max_tracks=max_tracks,
+            report_closed=report_closed,
+        )
+        self._process_noise = float(process_noise)
+        self._measurement_noise = float(measurement_noise)
+        self._initial_velocity_std = float(initial_velocity_std)
+
+        self._ids = np.empty(0, dtype=np.int64)
+        self._x = np.empty((0, 4))
+        self._p = np.empty((0, 4, 4))
+        self._t = np.empty(0, dtype=np.int64)
+
+    def update(self, *, detections: Detections | Sequence[BBox], frame_idx: int) -> list[Track]:
+        """Predict every track to `frame_idx`, match `detections` and correct the filters."""
+        detections = as_detections(detections)
+        if self._drop_stale(frame_idx):
+            self._sync_state()
+
+        self._predict(frame_idx)
+
+        unmatched_dets = set(range(len(detections)))
+        if len(self._ids) and len(detections):
+            det_xy = detections.centers
+            dist = pairwise_distances(self._x[:, :2], det_xy)
+            pairs = self._assign(dist, self._match_max_distance_px)
+
+            if pairs:
+                rows = np.array([ti for ti, _ in pairs], dtype=np.int64)
+                dets = [di for _, di in pairs]
+                self._correct(rows, det_xy[dets])
+
+                for row, di in zip(rows.tolist(), dets):
+                    tr = self._tracks[int(self._ids[row])]
+                    tr.update(bbox=detections[di], frame_idx=frame_idx)
+                    tr.velocity = (float(self._x[row, 2]), float(self._x[row, 3]))
+                    unmatched_dets.remove(di)
+
+        new_tracks = [self._new_track(detections[di], frame_idx) for di in sorted(unmatched_dets)]
+        if new_tracks:
+            self._append_state(new_tracks, frame_idx)
+
+        if self._evict_excess():
+            self._sync_state()
+
+        return list(self._tracks.values())
+
+    def configure(
+        self,
+        *,
+        process_noise: float | None = None,
+        measurement_noise: float | None = None,
+        **kwargs,
+    ) -> None:
+        """Change matching and noise parameters; filter states are kept."""
+        super().configure(**kwargs)
+        if process_noise is not None:
+            self._process_noise = float(process_noise)
+        if measurement_noise is not None:
+            self._measurement_noise = float(measurement_noise)
+
+    def restore_state(self, state: TrackerState) -> None:
+        """Adopt tracks from an earlier run, starting each filter at its last position and velocity."""
+        super().restore_state(state)
+        if not state.tracks:
+            return
+        self._append_state(state.tracks, 0)
+        self._t[:] = [tr.last_seen_frame for tr in state.tracks]
+        self._x[:, 2:] = [tr.velocity if tr.velocity is not None else (0.0, 0.0) for tr in state.tracks]
+
+    def close_all(self) -> list[Track]:
+        """Remove every live track and its state rows."""
+        closed = super().close_all()
+        self._sync_state()
+        return closed
+
+    def _predict(self, frame_idx: int) -> None:
+        """Advance every state row to `frame_idx` with one batched step."""
+        n = len(self._ids)
+        if n == 0:
+            return
+
+        dt = (frame_idx - self._t).astype(np.float64)
+        if not dt.any():
+            return
+
+        f = np.broadcast_to(np.eye(4), (n, 4, 4)).copy()
+        f[:, 0, 2] = dt
+        f[:, 1, 3] = dt
+
+        # White-acceleration process noise, scaled per row by its time delta.
+        q = self._process_noise ** 2
+        dt2, dt3, dt4 = dt * dt, dt * dt * dt, dt * dt * dt * dt
+        qm = np.zeros((n, 4, 4))
+        qm[:, 0, 0] = qm[:, 1, 1] = q * dt4 / 4.0
+        qm[:, 0, 2] = qm[:, 2, 0] = qm[:, 1, 3] = qm[:, 3, 1] = q * dt3 / 2.0
+        qm[:, 2, 2] = qm[:, 3, 3] = q * dt2
+
+        self._x = np.einsum("nij,nj->ni", f, self._x)
+        self._p = f @ self._p @ f.transpose(0, 2, 1) + qm
+        self._t[:] = frame_idx
+
+    def _correct(self, rows: np.ndarray, z: np.ndarray) -> None:
+        """Apply centroid measurements `z` to the given state rows in one batch."""
+        x = self._x[rows]
+        p = self._p[rows]
+
+        r = np.eye(2) * (self._measurement_noise ** 2)
+        s = p[:, :2, :2] + r
+        k = p[:, :, :2] @ np.linalg.inv(s)
+
+        innovation = z - x[:, :2]
+        self._x[rows] = x + np.einsum("nij,nj->ni", k, innovation)
+        self._p[rows] = p - k @ (_H @ p)
+
+    def _append_state(self, tracks: list[Track], frame_idx: int) -> None:
+        """Add state rows for newly created tracks."""
+        m = len(tracks)
+        x = np.zeros((m, 4))
+        x[:, 0] = [tr.cx for tr in tracks]
+        x[:, 1] = [tr.cy for tr in tracks]
+
+        p = np.zeros((m, 4, 4))
+        p[:, 0, 0] = p[:, 1, 1] = self._measurement_noise ** 2
+        p[:, 2, 2] = p[:, 3, 3] = self._initial_velocity_std ** 2
+
+        self._ids = np.concatenate([self._ids, [tr.track_id for tr in tracks]])
+        self._x = np.concatenate([self._x, x])
+        self._p = np.concatenate([self._p, p])
+        self._t = np.concatenate([self._t, np.full(m, frame_idx, dtype=np.int64)])
+
+    def _sync_state(self) -> None:
+        """Drop state rows whose tracks were removed from `_tracks`."""
+        keep = np.array([int(tid) in self._tracks for tid in self._ids], dtype=bool)
+        self._ids = self._ids[keep]
+        self._x = self._x[keep]
+        self._p = self._p[keep]
+        self._t = self._t[keep]
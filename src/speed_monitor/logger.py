@@ -1,9 +1,25 @@
 from __future__ import annotations
 
 import csv
+import queue
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TextIO
+from typing import Any, TextIO
+
+from .summary import VehicleSummary
+
+_FIELDNAMES = [
+    "timestamp_iso",
+    "frame_idx",
+    "track_id",
+    "x1",
+    "y1",
+    "x2",
+    "y2",
+    "speed_mph",
+]
 
 
 @dataclass(frozen=True)
@@ -19,32 +35,38 @@ class SpeedLogRow:
     speed_mph: float
 
 
+def _format_row(row: SpeedLogRow) -> list[Any]:
+    """Return CSV field values for a row, in `_FIELDNAMES` order."""
+    return [
+        row.timestamp_iso,
+        row.frame_idx,
+        row.track_id,
+        row.x1,
+        row.y1,
+        row.x2,
+        row.y2,
+        f"{row.speed_mph:.3f}",
+    ]
+
+
 class CsvSpeedLogger:
     """Write speed measurements to a CSV file."""
+
+    _fieldnames = _FIELDNAMES
+    _format = staticmethod(_format_row)
+
     def __init__(self, path: str | Path) -> None:
         """Initialize the logger with an output path."""
         self._path = Path(path)
         self._file: TextIO | None = None
-        self._writer: csv.DictWriter[str] | None = None
+        self._writer: Any | None = None
 
     def __enter__(self) -> "CsvSpeedLogger":
         """Open the CSV file and write the header."""
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._file = self._path.open("w", newline="", encoding="utf-8")
-        self._writer = csv.DictWriter(
-            self._file,
-            fieldnames=[
-                "timestamp_iso",
-                "frame_idx",
-                "track_id",
-                "x1",
-                "y1",
-                "x2",
-                "y2",
-                "speed_mph",
-            ],
-        )
-        self._writer.writeheader()
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self._fieldnames)
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
@@ -58,15 +80,171 @@ class CsvSpeedLogger:
         """Write a single speed measurement row."""
         if self._writer is None:
             raise RuntimeError("CsvSpeedLogger must be used as a context manager")
-        self._writer.writerow(
-            {
-                "timestamp_iso": row.timestamp_iso,
-                "frame_idx": row.frame_idx,
-                "track_id": row.track_id,
-                "x1": row.x1,
-                "y1": row.y1,
-                "x2": row.x2,
-                "y2": row.y2,
-                "speed_mph": f"{row.speed_mph:.3f}",
-            }
-        )
+        self._writer.writerow(self._format(row))
+
+
+_SUMMARY_FIELDNAMES = [
+    "timestamp_iso",
+    "track_id",
+    "entry_frame",
+    "exit_frame",
+    "samples",
+    "path_length_px",
+    "median_speed_mph",
+    "max_speed_mph",
+    "robust_speed_mph",
+]
+
+
+def _format_summary(row: VehicleSummary) -> list[Any]:
+    """Return CSV field values for a vehicle summary, in `_SUMMARY_FIELDNAMES` order."""
+    return [
+        row.timestamp_iso,
+        row.track_id,
+        row.entry_frame,
+        row.exit_frame,
+        row.samples,
+        f"{row.path_length_px:.1f}",
+        f"{row.median_speed_mph:.3f}",
+        f"{row.max_speed_mph:.3f}",
+        f"{row.robust_speed_mph:.3f}",
+    ]
+
+
+class CsvSummaryLogger(CsvSpeedLogger):
+    """Write one CSV row per vehicle (see `VehicleSummary`)."""
+
+    _fieldnames = _SUMMARY_FIELDNAMES
+    _format = staticmethod(_format_summary)
+
+    def log(self, row: VehicleSummary) -> None:  # type: ignore[override]
+        """Write a single vehicle summary row."""
+        super().log(row)
+
+
+@dataclass
+class LoggerStats:
+    """Write-side counters for a background logger."""
+    rows_written: int = 0
+    batches_written: int = 0
+    last_write_s: float = 0.0
+    max_write_s: float = 0.0
+    total_write_s: float = 0.0
+    # Largest backlog (queued + batch being written) seen by the writer.
+    max_queue_depth: int = 0
+
+    @property
+    def mean_write_s(self) -> float:
+        """Mean time spent writing and flushing one batch."""
+        return self.total_write_s / self.batches_written if self.batches_written else 0.0
+
+
+class ThreadedCsvSpeedLogger(CsvSpeedLogger):
+    """Write speed measurements to a CSV file from a background thread.
+
+    `log()` only enqueues the row. A writer thread formats rows and writes them
+    in batches, flushing once `flush_rows` rows are pending or `flush_interval_s`
+    has elapsed, so a slow disk stalls the writer rather than the frame loop.
+    Everything queued is written and flushed on `__exit__`. When the queue
+    holds `max_queue_rows` rows, `log()` blocks rather than dropping data.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        flush_rows: int = 256,
+        flush_interval_s: float = 1.0,
+        max_queue_rows: int = 100_000,
+    ) -> None:
+        """Initialize the logger with an output path and batching policy."""
+        super().__init__(path)
+        self._flush_rows = max(1, int(flush_rows))
+        self._flush_interval_s = float(flush_interval_s)
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, int(max_queue_rows)))
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+        self.stats = LoggerStats()
+
+    @property
+    def queue_depth(self) -> int:
+        """Rows enqueued but not yet written."""
+        return self._queue.qsize()
+
+    def __enter__(self) -> "ThreadedCsvSpeedLogger":
+        """Open the CSV file, write the header and start the writer thread."""
+        super().__enter__()
+        self._thread = threading.Thread(target=self._run, name="speed_monitor-csv", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Write all queued rows, then close the CSV file."""
+        if self._thread is not None:
+            self._queue.put(self._SENTINEL)
+            self._thread.join()
+            self._thread = None
+        super().__exit__(exc_type, exc, tb)
+        if self._error is not None and exc is None:
+            raise RuntimeError("CSV writer thread failed") from self._error
+
+    def log(self, row: SpeedLogRow) -> None:
+        """Enqueue a single speed measurement row."""
+        if self._thread is None:
+            raise RuntimeError("ThreadedCsvSpeedLogger must be used as a context manager")
+        if self._error is not None:
+            raise RuntimeError("CSV writer thread failed") from self._error
+        self._queue.put(row)
+
+    def _run(self) -> None:
+        """Writer loop executed on the background thread."""
+        batch: list[SpeedLogRow] = []
+        deadline = time.monotonic() + self._flush_interval_s
+        done = False
+        while not done:
+            timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+                if item is self._SENTINEL:
+                    done = True
+                else:
+                    batch.append(item)
+            except queue.Empty:
+                pass
+
+            if done or len(batch) >= self._flush_rows or time.monotonic() >= deadline:
+                if batch and self._error is None:
+                    self._write_batch(batch)
+                batch = []
+                deadline = time.monotonic() + self._flush_interval_s
+
+    def _write_batch(self, batch: list[SpeedLogRow]) -> None:
+        """Format, write and flush one batch, recording its latency."""
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, len(batch) + self._queue.qsize())
+        t0 = time.perf_counter()
+        try:
+            self._writer.writerows(self._format(row) for row in batch)
+            self._file.flush()
+        except BaseException as exc:  # surfaced to the producer in log()/__exit__
+            self._error = exc
+            return
+
+        elapsed = time.perf_counter() - t0
+        self.stats.rows_written += len(batch)
+        self.stats.batches_written += 1
+        self.stats.last_write_s = elapsed
+        self.stats.max_write_s = max(self.stats.max_write_s, elapsed)
+        self.stats.total_write_s += elapsed
+
+
+class ThreadedCsvSummaryLogger(ThreadedCsvSpeedLogger):
+    """Write one CSV row per vehicle from a background thread (see `VehicleSummary`)."""
+
+    _fieldnames = _SUMMARY_FIELDNAMES
+    _format = staticmethod(_format_summary)
+
+    def log(self, row: VehicleSummary) -> None:  # type: ignore[override]
+        """Enqueue a single vehicle summary row."""
+        super().log(row)
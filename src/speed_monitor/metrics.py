@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import TextIO
+
+from .capture import CaptureStats
+from .idle import MODES, GateStats
+from .logger import ThreadedCsvSpeedLogger
+
+# Histogram bucket upper bounds in seconds (Prometheus `le` labels).
+DEFAULT_BUCKETS_S = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Per-frame pipeline stages, in order. "decode" is the time spent waiting for
+# the next frame: decoding for direct capture, queue wait for threaded capture.
+STAGES = ("decode", "detect", "track", "speed", "log")
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (cumulative count, sum and max)."""
+
+    __slots__ = ("bounds", "counts", "count", "sum_s", "max_s")
+
+    def __init__(self, buckets_s: tuple[float, ...] = DEFAULT_BUCKETS_S) -> None:
+        """Initialize an empty histogram with the given bucket upper bounds."""
+        self.bounds = tuple(sorted(float(b) for b in buckets_s))
+        self.counts = [0] * (len(self.bounds) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.sum_s = 0.0
+        self.max_s = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency sample."""
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum_s += seconds
+        if seconds > self.max_s:
+            self.max_s = seconds
+
+    @property
+    def mean_s(self) -> float:
+        """Mean latency in seconds (0 before the first sample)."""
+        return self.sum_s / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile by linear interpolation within its bucket."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for i, n in enumerate(self.counts):
+            upper = self.bounds[i] if i < len(self.bounds) else self.max_s
+            if n and seen + n >= rank:
+                return min(self.max_s, lower + (upper - lower) * (rank - seen) / n)
+            seen += n
+            lower = upper
+        return self.max_s
+
+
+class PipelineMetrics:
+    """Per-stage latency, end-to-end latency and throughput for `SpeedMonitor.run`.
+
+    `record_frame` is called once per processed frame. Every `interval_s`,
+    `maybe_report` prints a one-line summary of the last interval to `stream`
+    (if set) and rewrites `prometheus_path` (if set) in Prometheus text
+    exposition format, atomically, for a node_exporter textfile collector or
+    any scraper that reads files.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval_s: float = 10.0,
+        budget_s: float = 0.1,
+        prometheus_path: str | Path | None = None,
+        stream: TextIO | None = sys.stderr,
+    ) -> None:
+        """Initialize empty metrics."""
+        self._interval_s = float(interval_s)
+        self._budget_s = float(budget_s)
+        self._prometheus_path = Path(prometheus_path) if prometheus_path is not None else None
+        self._stream = stream
+
+        self.stages = {stage: LatencyHistogram() for stage in STAGES}
+        self.frame_latency = LatencyHistogram()
+        self.frames_processed = 0
+        self.frames_over_budget = 0
+        self.active_tracks = 0
+        self.fps = 0.0
+        # Set by the monitor when the idle-mode motion gate is enabled.
+        self.gate_stats: GateStats | None = None
+        # Set by the monitor when rows are written from a background thread.
+        self.logger: ThreadedCsvSpeedLogger | None = None
+
+        self._interval = {stage: LatencyHistogram() for stage in (*STAGES, "frame")}
+        self._interval_frames = 0
+        self._last_report_s = time.perf_counter()
+
+    def record_frame(
+        self,
+        *,
+        decode_s: float,
+        detect_s: float,
+        track_s: float,
+        speed_s: float,
+        log_s: float,
+        latency_s: float,
+        active_tracks: int,
+    ) -> None:
+        """Record stage durations and end-to-end latency for one processed frame."""
+        for stage, seconds in (
+            ("decode", decode_s),
+            ("detect", detect_s),
+            ("track", track_s),
+            ("speed", speed_s),
+            ("log", log_s),
+            ("frame", latency_s),
+        ):
+            (self.frame_latency if stage == "frame" else self.stages[stage]).observe(seconds)
+            self._interval[stage].observe(seconds)
+
+        self.frames_processed += 1
+        self._interval_frames += 1
+        if latency_s > self._budget_s:
+            self.frames_over_budget += 1
+        self.active_tracks = int(active_tracks)
+
+    def maybe_report(self, capture_stats: CaptureStats, now_s: float | None = None) -> bool:
+        """Report if the interval has elapsed; return True if a report was made."""
+        now_s = time.perf_counter() if now_s is None else now_s
+        if now_s - self._last_report_s < self._interval_s:
+            return False
+        self.report(capture_stats, now_s)
+        return True
+
+    def report(self, capture_stats: CaptureStats, now_s: float | None = None) -> None:
+        """Emit the stderr summary and Prometheus file, then start a new interval."""
+        now_s = time.perf_counter() if now_s is None else now_s
+        elapsed = now_s - self._last_report_s
+        self.fps = self._interval_frames / elapsed if elapsed > 0 else 0.0
+
+        if self._stream is not None:
+            print(self.summary_line(capture_stats), file=self._stream, flush=True)
+        if self._prometheus_path is not None:
+            self.write_prometheus(self._prometheus_path, capture_stats)
+
+        self._interval = {stage: LatencyHistogram() for stage in self._interval}
+        self._interval_frames = 0
+        self._last_report_s = now_s
+
+    def summary_line(self, capture_stats: CaptureStats) -> str:
+        """One-line human-readable summary of the current interval."""
+        e2e = self._interval["frame"]
+        parts = [
+            f"metrics frames={self._interval_frames} fps={self.fps:.1f}",
+            f"latency_ms p50={1e3 * e2e.quantile(0.5):.1f} p95={1e3 * e2e.quantile(0.95):.1f} "
+            f"max={1e3 * e2e.max_s:.1f}",
+            f"over_budget={self.frames_over_budget} tracks={self.active_tracks}",
+            f"dropped={capture_stats.frames_dropped} skipped={capture_stats.frames_skipped}",
+            "stage_ms " + " ".join(f"{s}={1e3 * self._interval[s].mean_s:.2f}" for s in STAGES),
+        ]
+        if self.gate_stats is not None:
+            frac = self.gate_stats.fractions()
+            parts.append("mode " + " ".join(f"{m}={100.0 * frac[m]:.1f}%" for m in MODES))
+        if self.logger is not None:
+            stats = self.logger.stats
+            parts.append(
+                f"log_queue={self.logger.queue_depth} log_write_ms mean={1e3 * stats.mean_write_s:.2f} "
+                f"max={1e3 * stats.max_write_s:.2f}"
+            )
+        return " ".join(parts)
+
+    def render_prometheus(self, capture_stats: CaptureStats) -> str:
+        """Render cumulative metrics in Prometheus text exposition format."""
+        lines = [
+            "# HELP speed_monitor_stage_latency_seconds Per-frame latency of each pipeline stage.",
+            "# TYPE speed_monitor_stage_latency_seconds histogram",
+        ]
+        for stage in STAGES:
+            lines += _histogram_lines(
+                "speed_monitor_stage_latency_seconds", self.stages[stage], f'stage="{stage}"'
+            )
+        lines += [
+            "# HELP speed_monitor_frame_latency_seconds End-to-end latency from decoded frame to logged output.",
+            "# TYPE speed_monitor_frame_latency_seconds histogram",
+            *_histogram_lines("speed_monitor_frame_latency_seconds", self.frame_latency, ""),
+        ]
+        for name, kind, help_text, value in (
+            ("frames_processed_total", "counter", "Frames run through the pipeline.", self.frames_processed),
+            ("frames_read_total", "counter", "Frames decoded from the source.", capture_stats.frames_read),
+            ("frames_dropped_total", "counter", "Frames dropped by the capture queue.", capture_stats.frames_dropped),
+            ("frames_skipped_total", "counter", "Frames skipped by the adaptive stride.", capture_stats.frames_skipped),
+            ("frames_over_budget_total", "counter", "Frames whose end-to-end latency exceeded the budget.",
+             self.frames_over_budget),
+            ("latency_budget_seconds", "gauge", "End-to-end latency budget.", self._budget_s),
+            ("active_tracks", "gauge", "Live tracks after the last frame.", self.active_tracks),
+            ("fps", "gauge", "Processed frames per second over the last report interval.", self.fps),
+        ):
+            lines += [
+                f"# HELP speed_monitor_{name} {help_text}",
+                f"# TYPE speed_monitor_{name} {kind}",
+                f"speed_monitor_{name} {_format_value(value)}",
+            ]
+        if self.gate_stats is not None:
+            gate = self.gate_stats
+            lines += [
+                "# HELP speed_monitor_frames_by_mode_total Frames handled in each idle-gate mode.",
+                "# TYPE speed_monitor_frames_by_mode_total counter",
+            ]
+            for mode, n in zip(MODES, (gate.frames_active, gate.frames_idle, gate.frames_refresh)):
+                lines.append(f'speed_monitor_frames_by_mode_total{{mode="{mode}"}} {n}')
+            lines += [
+                "# HELP speed_monitor_idle_wakeups_total Times motion ended idle mode.",
+                "# TYPE speed_monitor_idle_wakeups_total counter",
+                f"speed_monitor_idle_wakeups_total {gate.wakeups}",
+            ]
+        if self.logger is not None:
+            stats = self.logger.stats
+            for name, kind, help_text, value in (
+                ("log_queue_depth", "gauge", "Rows queued for the background writer.", self.logger.queue_depth),
+                ("log_rows_written_total", "counter", "Rows written by the background writer.", stats.rows_written),
+                ("log_batches_written_total", "counter", "Batches written by the background writer.",
+                 stats.batches_written),
+                ("log_write_seconds_total", "counter", "Time spent writing and flushing batches.", stats.total_write_s),
+                ("log_write_seconds_max", "gauge", "Slowest batch write so far.", stats.max_write_s),
+            ):
+                lines += [
+                    f"# HELP speed_monitor_{name} {help_text}",
+                    f"# TYPE speed_monitor_{name} {kind}",
+                    f"speed_monitor_{name} {_format_value(value)}",
+                ]
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | Path, capture_stats: CaptureStats) -> None:
+        """Atomically replace `path` with the current Prometheus text."""
+        path = Path(path)
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(self.render_prometheus(capture_stats))
+        os.replace(tmp, path)
+
+
+def _histogram_lines(name: str, hist: LatencyHistogram, labels: str) -> list[str]:
+    """Prometheus `_bucket`, `_sum` and `_count` lines for one histogram."""
+    sep = "," if labels else ""
+    lines = []
+    cumulative = 0
+    for bound, n in zip((*hist.bounds, float("inf")), hist.counts):
+        cumulative += n
+        le = "+Inf" if bound == float("inf") else _format_value(bound)
+        lines.append(f'{name}_bucket{{{labels}{sep}le="{le}"}} {cumulative}')
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{suffix} {_format_value(hist.sum_s)}")
+    lines.append(f"{name}_count{suffix} {hist.count}")
+    return lines
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus clients do."""
+    return repr(float(value)) if isinstance(value, float) else str(value)
@@ -1,150 +1,642 @@
 from __future__ import annotations
 
+import contextlib
+import dataclasses
 import datetime as dt
-from dataclasses import dataclass
+import sys
+import time
+from pathlib import Path
+from typing import Any
 
 import cv2
 import numpy as np
 
+from .alerts import (
+    AlertDispatcher,
+    AlertSink,
+    AlertStats,
+    JsonLinesAlertSink,
+    StdoutAlertSink,
+    WebhookAlertSink,
+)
+from .assignment import get_assignment_solver
+from .capture import CaptureStats, DirectCapture, ThreadedCapture, is_live_source, resolve_overflow_policy
+from .checkpoint import CHECKPOINT_ID_BLOCK, Checkpoint, load_checkpoint, save_checkpoint
+from .columnar import ColumnarSpeedLogger
 from .config import MonitorConfig
-from .detector import BackgroundSubtractorDetector
-from .logger import CsvSpeedLogger, SpeedLogRow
-from .speed import speed_mph_from_pixel_displacement
-from .tracker import CentroidTracker, Track
+from .detector import DetectorResult, ForegroundDetector, FrameDifferenceDetector, get_detector_class
+from .display import DisplayRenderer, DisplayStats
+from .idle import GateStats, MotionGate
+from .kalman import KalmanTracker
+from .logger import (
+    CsvSpeedLogger,
+    CsvSummaryLogger,
+    LoggerStats,
+    SpeedLogRow,
+    ThreadedCsvSpeedLogger,
+    ThreadedCsvSummaryLogger,
+)
+from .metrics import PipelineMetrics
+from .reload import RELOADABLE_FIELDS, ConfigWatcher, changed_fields
+from .scheduler import StrideScheduler
+from .speed import GroundPlane
+from .summary import VehicleSummarizer
+from .tracker import CentroidTracker, Track, TrackerState
+from .traffic import TrafficStats, TrafficStatsLogger
 
 
-@dataclass(frozen=True)
-class SpeedAlert:
-    """Speed alert metadata for a single tracked object."""
-    timestamp_iso: str
-    frame_idx: int
-    track_id: int
-    speed_mph: float
-    speed_limit_mph: float
+def make_logger(config: MonitorConfig, output_path: str) -> CsvSpeedLogger | ColumnarSpeedLogger:
+    """Build the logger for the configured output mode and format.
+
+    The columnar format only holds per-frame rows, so it requires frames mode.
+    """
+    if config.log_format not in ("csv", "columnar"):
+        raise ValueError(f"log_format must be one of csv, columnar; got {config.log_format!r}")
+    if config.log_format == "columnar" and config.log_mode != "frames":
+        raise ValueError(f"log_format 'columnar' requires log_mode 'frames'; got {config.log_mode!r}")
+
+    if config.log_mode == "summary":
+        if not config.log_async:
+            return CsvSummaryLogger(output_path)
+        return ThreadedCsvSummaryLogger(
+            output_path,
+            flush_rows=config.log_flush_rows,
+            flush_interval_s=config.log_flush_interval_s,
+        )
+    if config.log_mode != "frames":
+        raise ValueError(f"log_mode must be one of summary, frames; got {config.log_mode!r}")
+
+    if config.log_format == "columnar":
+        if config.log_async:
+            print("log_async is ignored with log_format=columnar (it already writes in chunks)", file=sys.stderr)
+        return ColumnarSpeedLogger(output_path)
+    if not config.log_async:
+        return CsvSpeedLogger(output_path)
+    return ThreadedCsvSpeedLogger(
+        output_path,
+        flush_rows=config.log_flush_rows,
+        flush_interval_s=config.log_flush_interval_s,
+    )
 
 
 class SpeedMonitor:
     """Coordinate detection, tracking, speed estimation, and logging."""
-    def __init__(self, *, config: MonitorConfig) -> None:
-        """Initialize the speed monitor with a runtime configuration."""
+    def __init__(self, *, config: MonitorConfig, config_path: str | Path | None = None) -> None:
+        """Initialize the speed monitor with a runtime configuration.
+
+        With `config_path`, `run` watches that JSON file and applies changes to
+        tunable fields between frames (see `apply_config`).
+        """
         self._config = config
+        self._watcher = (
+            None
+            if config_path is None
+            else ConfigWatcher(config_path, poll_interval_s=config.config_poll_interval_s)
+        )
 
-        self._detector = BackgroundSubtractorDetector(
+        self._detector = self._make_detector(config)
+        self._tracker = self._make_tracker(config)
+        self._ground = GroundPlane(config.calibration)
+        self.capture_stats = CaptureStats()
+        self.scheduler: StrideScheduler | None = None
+        self.logger_stats: LoggerStats | None = None
+        self.metrics: PipelineMetrics | None = None
+        self.display_stats: DisplayStats | None = None
+        self.gate_stats: GateStats | None = None
+        self.alert_stats: AlertStats | None = None
+        self.traffic_stats: TrafficStats | None = None
+        self._stream_start_s = 0.0
+        # Live sources only: (frame_idx, epoch time) of the newest frame, from the monotonic clock.
+        self._live_clock: tuple[int, float] | None = None
+        self._reserved_next_id = 1
+        self._summarizer = VehicleSummarizer()
+        # Tracks resumed from a checkpoint that the saving run already summarized.
+        self._restored_track_ids: set[int] = set()
+
+    @staticmethod
+    def _make_detector(config: MonitorConfig) -> ForegroundDetector:
+        """Build the detector backend selected in the config."""
+        kwargs = dict(
             min_contour_area_px=config.min_contour_area_px,
+            roi=config.roi,
+            scale=config.detection_scale,
         )
-        self._tracker = CentroidTracker(
+        if config.detector == "frame_diff":
+            return FrameDifferenceDetector(
+                **kwargs,
+                alpha=config.frame_diff_alpha,
+                diff_threshold=config.frame_diff_threshold,
+            )
+        return get_detector_class(config.detector)(**kwargs)
+
+    @staticmethod
+    def _make_tracker(config: MonitorConfig) -> CentroidTracker:
+        """Build the tracker backend selected in the config."""
+        kwargs = dict(
             max_age_frames=config.max_track_age_frames,
             match_max_distance_px=config.match_max_distance_px,
+            assignment=config.match_assignment,
+            # Speed estimation fits a line through the last `speed_smoothing_window` samples.
+            history_size=max(2, int(config.speed_smoothing_window)),
+            max_tracks=config.max_tracks,
+            # `run` drains closed tracks every frame to summarize them.
+            report_closed=True,
         )
+        if config.tracker == "centroid":
+            return CentroidTracker(**kwargs)
+        if config.tracker == "kalman":
+            return KalmanTracker(
+                **kwargs,
+                process_noise=config.kalman_process_noise,
+                measurement_noise=config.kalman_measurement_noise,
+            )
+        raise ValueError(f"tracker must be one of centroid, kalman; got {config.tracker!r}")
 
-    def _estimate_track_speed_mph(self, tr: Track) -> float | None:
-        """Estimate track speed in mph using recent track history."""
-        window = max(2, int(self._config.speed_smoothing_window))
-        if len(tr.history) < window:
-            return None
+    @property
+    def config(self) -> MonitorConfig:
+        """The configuration in effect, including reloaded changes."""
+        return self._config
 
-        f0, x0, y0 = tr.history[-window]
-        f1, x1, y1 = tr.history[-1]
-        frames_delta = int(f1 - f0)
-        if frames_delta <= 0:
-            return None
+    @property
+    def tracker(self) -> CentroidTracker:
+        """The tracking backend; it queues closed tracks for `pop_closed_tracks`."""
+        return self._tracker
+
+    def apply_config(self, config: MonitorConfig) -> list[str]:
+        """Swap tunable parameters from `config` into the running pipeline.
+
+        The capture, background model and live tracks are kept. Returns the
+        names of the fields that changed. Raises ValueError, leaving the
+        pipeline unchanged, if a field outside `RELOADABLE_FIELDS` differs or
+        a new value is invalid.
+        """
+        changed = changed_fields(self._config, config)
+        fixed = [name for name in changed if name not in RELOADABLE_FIELDS]
+        if fixed:
+            raise ValueError(f"changing {', '.join(fixed)} requires a restart")
+        if not changed:
+            return []
+
+        # Build everything that can fail before touching the running pipeline.
+        ground = GroundPlane(config.calibration) if "calibration" in changed else self._ground
+        get_assignment_solver(config.match_assignment)
+        if isinstance(self._detector, FrameDifferenceDetector) and not 0.0 < config.frame_diff_alpha <= 1.0:
+            raise ValueError(f"frame_diff_alpha must be in (0, 1]; got {config.frame_diff_alpha!r}")
 
-        pixel_distance = float(((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5)
-        return speed_mph_from_pixel_displacement(
-            pixel_distance=pixel_distance,
-            frames_delta=frames_delta,
-            calibration=self._config.calibration,
-            y_for_scale=float(y1),
+        if isinstance(self._detector, FrameDifferenceDetector):
+            self._detector.configure(
+                min_contour_area_px=config.min_contour_area_px,
+                alpha=config.frame_diff_alpha,
+                diff_threshold=config.frame_diff_threshold,
+            )
+        else:
+            self._detector.configure(min_contour_area_px=config.min_contour_area_px)
+        tracker_kwargs = dict(
+            max_age_frames=config.max_track_age_frames,
+            match_max_distance_px=config.match_max_distance_px,
+            assignment=config.match_assignment,
+            max_tracks=config.max_tracks,
         )
+        if isinstance(self._tracker, KalmanTracker):
+            tracker_kwargs.update(
+                process_noise=config.kalman_process_noise,
+                measurement_noise=config.kalman_measurement_noise,
+            )
+        self._tracker.configure(**tracker_kwargs)
+        if ground is not self._ground:
+            self._ground = ground
+            for tr in self._tracker.state().tracks:
+                tr.speed_mph = tr.speed_frame = None  # cached under the old calibration
+        self._config = config
+        return changed
+
+    def request_config_reload(self) -> None:
+        """Re-read the watched config file before the next frame (e.g. on SIGHUP)."""
+        if self._watcher is not None:
+            self._watcher.request_reload()
+
+    def estimate_speeds_mph(self, tracks: list[Track]) -> list[float | None]:
+        """Estimate speeds in mph for all tracks in one vectorized call.
+
+        Once a track has `speed_smoothing_window` observations, tracks with a
+        filtered velocity (Kalman tracker) use it directly; otherwise speed
+        comes from a least-squares line through the window, maintained
+        incrementally by the track history. Tracks without enough history get
+        None. Results are cached on the track and reused until it is next
+        matched to a detection.
+        """
+        window = max(2, int(self._config.speed_smoothing_window))
+        rows = []
+        moves: list[float] = []  # flat (x0, y0, x1, y1, frames_delta) per row
+        speeds: list[float | None] = [None] * len(tracks)
+        for i, tr in enumerate(tracks):
+            if tr.speed_frame == tr.last_seen_frame:
+                speeds[i] = tr.speed_mph
+                continue
+            history = tr.history
+            if len(history) < window:
+                continue
+            if tr.velocity is not None:
+                _, x1, y1 = history[-1]
+                vx, vy = tr.velocity
+                moves += (x1 - vx, y1 - vy, x1, y1, 1.0)
+            else:
+                segment = history.fitted_segment()
+                if segment is None:
+                    continue
+                moves += segment
+            rows.append(i)
+
+        if rows:
+            m = np.array(moves).reshape(-1, 5)
+            mph = self._ground.speeds_mph(m[:, 0:2], m[:, 2:4], m[:, 4])
+            for i, v in zip(rows, mph.tolist()):
+                tr = tracks[i]
+                tr.speed_mph = speeds[i] = v
+                tr.speed_frame = tr.last_seen_frame
+        return speeds
+
+    def process_frame(self, frame: np.ndarray, frame_idx: int) -> tuple[DetectorResult, list[Track]]:
+        """Run detection and tracking on one frame; return detections and live tracks."""
+        det = self._detector.detect(frame)
+        tracks = self._tracker.update(detections=det.detections, frame_idx=frame_idx)
+        return det, tracks
 
     def run(
         self,
         *,
         video_source: str | int,
-        output_csv: str,
+        output_csv: str | None = None,
         display: bool = False,
         max_frames: int | None = None,
+        logger: Any | None = None,
     ) -> None:
-        """Run the monitor against a live camera or video file."""
+        """Run the monitor against a live camera or video file.
+
+        Rows go to `output_csv` through the logger selected by the config, or
+        to `logger` if given (any context manager with a `log(row)` method).
+        """
+        if logger is None:
+            if output_csv is None:
+                raise ValueError("either output_csv or logger is required")
+            logger = make_logger(self._config, output_csv)
+
         cap = cv2.VideoCapture(video_source)
         if not cap.isOpened():
             raise RuntimeError(f"Could not open video source: {video_source}")
 
-        frame_idx = 0
-        with CsvSpeedLogger(output_csv) as logger:
-            while True:
-                ok, frame = cap.read()
-                if not ok:
-                    break
+        # Everything built from here on is released by the `finally` below,
+        # including the capture if a later step fails.
+        source: DirectCapture | ThreadedCapture | None = None
+        renderer: DisplayRenderer | None = None
+        last_frame_idx: int | None = None
+        try:
+            self.scheduler = self._make_scheduler()
+            self.metrics = metrics = self._make_metrics()
+            gate = self._make_gate()
+            self.gate_stats = None if gate is None else gate.stats
+            threaded_logger = logger if isinstance(logger, ThreadedCsvSpeedLogger) else None
+            self.logger_stats = None if threaded_logger is None else threaded_logger.stats
+            if metrics is not None:
+                metrics.gate_stats = self.gate_stats
+                metrics.logger = threaded_logger
+            traffic = self._make_traffic_log()
+            self.traffic_stats = None if traffic is None else traffic.stats
+            per_frame = self._config.log_mode == "frames"
+            # The alert sinks open their files, so build them once the logger is open.
+            with logger, self._make_alerts() as alerts, traffic or contextlib.nullcontext():
+                self.alert_stats = alerts.stats
+                self._stream_start_s = time.time()
+                stream_start_perf_s = time.perf_counter()
+                live = is_live_source(video_source)
+                self._live_clock = None
+                self._restore_checkpoint()
+                # Nothing is reserved yet, so the first frame saves a checkpoint.
+                self._reserved_next_id = self._tracker.state().next_id
+                next_checkpoint_s = time.monotonic() + self._config.checkpoint_interval_s
+                source = self._make_frame_source(cap, video_source=video_source, max_frames=max_frames)
+                source.start()
+                if display:
+                    renderer = self._make_renderer()
+                    renderer.start()
+                while True:
+                    t_read = time.perf_counter()
+                    captured = source.read()
+                    if captured is None:
+                        break
+
+                    frame_idx = last_frame_idx = captured.frame_idx
+                    frame = captured.frame
+                    if live:
+                        self._live_clock = (frame_idx, self._stream_start_s + captured.captured_s - stream_start_perf_s)
+                    t_start = time.perf_counter()
 
-                frame_idx += 1
-                if max_frames is not None and frame_idx > max_frames:
-                    break
+                    if gate is None or gate.should_detect(frame):
+                        det = self._detector.detect(frame)
+                        t_detect = time.perf_counter()
+                        tracks = self._tracker.update(detections=det.detections, frame_idx=frame_idx)
+                        t_track = time.perf_counter()
+                        speeds = self.estimate_speeds_mph(tracks)
+                        t_speed = time.perf_counter()
+                        if gate is not None:
+                            gate.observe(len(det.detections), len(tracks))
+                    else:
+                        # Idle: no live tracks, and the thumbnail check saw no motion.
+                        det, tracks, speeds = None, [], []
+                        t_detect = t_track = t_speed = time.perf_counter()
 
-                det = self._detector.detect(frame)
-                tracks = self._tracker.update(detections=det.bboxes, frame_idx=frame_idx)
+                    timestamp_iso = dt.datetime.now(dt.timezone.utc).isoformat()
 
-                timestamp_iso = dt.datetime.now(dt.timezone.utc).isoformat()
+                    for tr, speed_mph in zip(tracks, speeds):
+                        if tr.last_seen_frame == frame_idx and tr.track_id not in self._restored_track_ids:
+                            self._summarizer.observe(tr, frame_idx, speed_mph)
+                            if speed_mph is not None:
+                                alerts.observe(tr, frame_idx, speed_mph, self._config.speed_limit_mph, timestamp_iso)
+                        if speed_mph is None:
+                            continue
 
-                for tr in tracks:
-                    speed_mph = self._estimate_track_speed_mph(tr)
-                    if speed_mph is None:
-                        continue
-
-                    logger.log(
-                        SpeedLogRow(
-                            timestamp_iso=timestamp_iso,
-                            frame_idx=frame_idx,
-                            track_id=tr.track_id,
-                            x1=tr.bbox.x1,
-                            y1=tr.bbox.y1,
-                            x2=tr.bbox.x2,
-                            y2=tr.bbox.y2,
-                            speed_mph=float(speed_mph),
-                        )
-                    )
+                        if per_frame:
+                            logger.log(
+                                SpeedLogRow(
+                                    timestamp_iso=timestamp_iso,
+                                    frame_idx=frame_idx,
+                                    track_id=tr.track_id,
+                                    x1=tr.bbox.x1,
+                                    y1=tr.bbox.y1,
+                                    x2=tr.bbox.x2,
+                                    y2=tr.bbox.y2,
+                                    speed_mph=float(speed_mph),
+                                )
+                            )
+
+                    self._close_tracks(self._tracker.pop_closed_tracks(), timestamp_iso, logger, alerts, traffic, per_frame)
+                    if traffic is not None:
+                        # Vehicles are counted at their exit frame, but a track only closes
+                        # `max_track_age_frames` later; hold buckets open until then.
+                        lag = self._config.max_track_age_frames + 1
+                        traffic.advance(self._stream_time_s(max(0, frame_idx - lag)))
 
-                    if self._config.speed_limit_mph is not None and speed_mph > self._config.speed_limit_mph:
-                        print(
-                            f"ALERT track={tr.track_id} speed={speed_mph:.1f}mph "
-                            f"limit={self._config.speed_limit_mph:.1f}mph frame={frame_idx}"
+                    if metrics is not None:
+                        t_log = time.perf_counter()
+                        metrics.record_frame(
+                            decode_s=t_start - t_read,
+                            detect_s=t_detect - t_start,
+                            track_s=t_track - t_detect,
+                            speed_s=t_speed - t_track,
+                            log_s=t_log - t_speed,
+                            latency_s=t_log - captured.captured_s,
+                            active_tracks=len(tracks),
                         )
+                        metrics.maybe_report(source.stats, t_log)
 
-                if display:
-                    overlay = frame.copy()
-                    self._draw_overlay(overlay, tracks)
-                    if det.foreground_mask is not None:
-                        mask_bgr = cv2.cvtColor(det.foreground_mask, cv2.COLOR_GRAY2BGR)
-                        stacked = np.hstack([overlay, mask_bgr])
-                    else:
-                        stacked = overlay
+                    if renderer is not None:
+                        renderer.submit(frame_idx, frame, tracks, speeds, det)
+                        if renderer.quit_requested:
+                            break
 
-                    cv2.imshow("speed_monitor", stacked)
-                    # 1ms wait keeps UI responsive.
-                    if cv2.waitKey(1) & 0xFF == ord("q"):
-                        break
+                    if self.scheduler is not None:
+                        # Reading and decoding a file is load that a stride relieves. A live
+                        # read mostly waits for the camera's next frame, so it is left out.
+                        self.scheduler.record(time.perf_counter() - (t_start if live else t_read))
 
-        cap.release()
-        if display:
-            cv2.destroyAllWindows()
-
-    def _draw_overlay(self, frame: np.ndarray, tracks: list[Track]) -> None:
-        """Draw bounding boxes and speed labels onto a frame."""
-        for tr in tracks:
-            x1, y1, x2, y2 = tr.bbox.x1, tr.bbox.y1, tr.bbox.x2, tr.bbox.y2
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-            speed_mph = self._estimate_track_speed_mph(tr)
-            label = f"id={tr.track_id}"
-            if speed_mph is not None:
-                label += f" {speed_mph:.1f} mph"
-
-            cv2.putText(
-                frame,
-                label,
-                (x1, max(0, y1 - 6)),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.5,
-                (0, 255, 0),
-                1,
-                cv2.LINE_AA,
-            )
+                    if self._watcher is not None:
+                        self._reload_config()
+
+                    if self._config.checkpoint_file is not None and (
+                        time.monotonic() >= next_checkpoint_s
+                        # Renew the reserved ID block before this run can run past it.
+                        or self._tracker.state().next_id > self._reserved_next_id - CHECKPOINT_ID_BLOCK // 2
+                    ):
+                        self._save_checkpoint(frame_idx)
+                        next_checkpoint_s = time.monotonic() + self._config.checkpoint_interval_s
+
+                # Save before closing the live tracks so a restart can resume them.
+                self._save_checkpoint(last_frame_idx, tracks_summarized=True)
+                last_frame_idx = None
+                timestamp_iso = dt.datetime.now(dt.timezone.utc).isoformat()
+                self._close_tracks(self._tracker.close_all(), timestamp_iso, logger, alerts, traffic, per_frame)
+
+            if metrics is not None:
+                metrics.report(source.stats)
+            if gate is not None:
+                print(gate.stats.summary_line(), file=sys.stderr)
+        finally:
+            # Interrupted mid-stream: the tracks are still live.
+            self._save_checkpoint(last_frame_idx)
+            if source is None:
+                cap.release()
+            else:
+                source.release()
+                self.capture_stats = source.stats
+            if renderer is not None:
+                renderer.close()
+                self.display_stats = renderer.stats
+
+    def _reload_config(self) -> None:
+        """Apply changes to the watched config file, logging them to stderr."""
+        changes = self._watcher.poll()
+        if not changes:
+            return
+        fixed = [name for name in changes if name not in RELOADABLE_FIELDS]
+        if fixed:
+            print(f"Config reload: ignoring {', '.join(fixed)} (requires a restart)", file=sys.stderr)
+        updates = {name: value for name, value in changes.items() if name in RELOADABLE_FIELDS}
+        if not updates:
+            return
+        old = self._config
+        try:
+            applied = self.apply_config(dataclasses.replace(old, **updates))
+        except ValueError as exc:
+            print(f"Config reload rejected, keeping current settings: {exc}", file=sys.stderr)
+            return
+        if applied:
+            changes = ", ".join(f"{name} {getattr(old, name)!r} -> {getattr(self._config, name)!r}" for name in applied)
+            print(f"Config reloaded: {changes}", file=sys.stderr)
+
+    def _restore_checkpoint(self) -> None:
+        """Warm-start the detector and tracker from the configured checkpoint, if any.
+
+        If the saving run summarized the restored tracks when it shut down, they
+        are kept out of this run's summaries.
+        """
+        path = self._config.checkpoint_file
+        if path is None:
+            return
+        try:
+            checkpoint = load_checkpoint(path)
+        except ValueError as exc:
+            print(f"Ignoring checkpoint: {exc}", file=sys.stderr)
+            return
+        if checkpoint is None:
+            return
+
+        if checkpoint.background is not None and checkpoint.detector == self._config.detector:
+            self._detector.seed_background(checkpoint.background)
+        state = checkpoint.tracker_state_for_restart(
+            fps=self._config.calibration.fps,
+            history_size=self._tracker.history_size,
+        )
+        self._tracker.restore_state(state)
+        if checkpoint.tracks_summarized:
+            self._restored_track_ids = {tr.track_id for tr in state.tracks}
+
+    def _save_checkpoint(self, frame_idx: int | None, *, tracks_summarized: bool = False) -> None:
+        """Write the configured checkpoint for the last processed `frame_idx`.
+
+        The saved next ID is `CHECKPOINT_ID_BLOCK` past the tracker's, and `run`
+        saves again before the tracker reaches it.
+        """
+        path = self._config.checkpoint_file
+        if path is None or frame_idx is None:
+            return
+        state = self._tracker.state()
+        reserved_next_id = state.next_id + CHECKPOINT_ID_BLOCK
+        checkpoint = Checkpoint(
+            frame_idx=frame_idx,
+            saved_at_s=time.time(),
+            detector=self._config.detector,
+            background=self._detector.background_state(),
+            tracker=TrackerState(next_id=reserved_next_id, tracks=state.tracks),
+            tracks_summarized=tracks_summarized,
+        )
+        try:
+            save_checkpoint(path, checkpoint)
+        except OSError as exc:
+            print(f"Could not write checkpoint {path}: {exc}", file=sys.stderr)
+        # On failure too, so a broken disk is retried at the interval, not every frame.
+        self._reserved_next_id = reserved_next_id
+
+    def _make_frame_source(
+        self,
+        cap: cv2.VideoCapture,
+        *,
+        video_source: str | int,
+        max_frames: int | None,
+    ) -> DirectCapture | ThreadedCapture:
+        """Wrap an opened capture in the configured frame source."""
+        if not self._config.capture_threaded:
+            return DirectCapture(cap, max_frames=max_frames, scheduler=self.scheduler)
+
+        return ThreadedCapture(
+            cap,
+            queue_size=self._config.capture_queue_size,
+            overflow=resolve_overflow_policy(self._config.capture_overflow, video_source),
+            max_frames=max_frames,
+            scheduler=self.scheduler,
+        )
+
+    def _close_tracks(
+        self,
+        closed: list[Track],
+        timestamp_iso: str,
+        logger: Any,
+        alerts: AlertDispatcher,
+        traffic: TrafficStatsLogger | None,
+        per_frame: bool,
+    ) -> None:
+        """Summarize tracks the tracker has closed, logging them in summary mode.
+
+        Each vehicle is counted in the traffic statistics at its exit frame;
+        `run` holds the statistics clock back so those times never go backwards.
+        """
+        exits: list[tuple[int, float]] = []
+        for tr in closed:
+            alerts.close(tr, self._config.speed_limit_mph, timestamp_iso)
+            summary = self._summarizer.close(tr, timestamp_iso)
+            if summary is None:
+                continue
+            exits.append((summary.exit_frame, summary.robust_speed_mph))
+            if not per_frame:
+                logger.log(summary)
+
+        if traffic is not None:
+            # Stale and evicted tracks close in no particular order of exit.
+            for exit_frame, speed_mph in sorted(exits):
+                traffic.observe(speed_mph, self._stream_time_s(exit_frame), self._config.speed_limit_mph)
+
+    def _stream_time_s(self, frame_idx: int) -> float:
+        """Epoch time of `frame_idx`.
+
+        For a file this is the run start plus the frame's offset at the calibrated
+        FPS. A live camera seldom delivers exactly that rate and drops frames, so
+        its time is the monotonic wall time at which the newest frame was read,
+        stepped back to `frame_idx` at the calibrated FPS.
+        """
+        fps = float(self._config.calibration.fps)
+        if self._live_clock is None:
+            return self._stream_start_s + frame_idx / fps
+        clock_frame_idx, clock_s = self._live_clock
+        # A burst of buffered frames at startup would otherwise step back before the run began.
+        return max(self._stream_start_s, clock_s - (clock_frame_idx - frame_idx) / fps)
+
+    def _make_scheduler(self) -> StrideScheduler | None:
+        """Build the adaptive stride scheduler if enabled in the config."""
+        if not self._config.adaptive_stride:
+            return None
+
+        budget_ms = self._config.latency_budget_ms
+        if budget_ms is None:
+            budget_ms = 1000.0 / float(self._config.calibration.fps)
+        return StrideScheduler(
+            budget_s=budget_ms / 1000.0,
+            max_stride=self._config.max_frame_stride,
+        )
+
+    def _make_metrics(self) -> PipelineMetrics | None:
+        """Build the latency/throughput instrumentation if enabled in the config."""
+        if not self._config.metrics_enabled and self._config.metrics_file is None:
+            return None
+        return PipelineMetrics(
+            interval_s=self._config.metrics_interval_s,
+            budget_s=self._config.metrics_budget_ms / 1000.0,
+            prometheus_path=self._config.metrics_file,
+            stream=sys.stderr if self._config.metrics_enabled else None,
+        )
+
+    def _make_gate(self) -> MotionGate | None:
+        """Build the idle-mode motion gate if enabled in the config."""
+        if not self._config.idle_gate:
+            return None
+        return MotionGate(
+            idle_after_frames=self._config.idle_after_frames,
+            thumbnail_width=self._config.idle_thumbnail_width,
+            motion_threshold=self._config.idle_motion_threshold,
+            motion_fraction=self._config.idle_motion_fraction,
+            refresh_interval=self._config.idle_refresh_frames,
+            roi=self._config.roi,
+        )
+
+    def _make_alerts(self) -> AlertDispatcher:
+        """Build the alert dispatcher and the sinks enabled in the config."""
+        sinks: list[AlertSink] = []
+        if self._config.alert_stdout:
+            sinks.append(StdoutAlertSink())
+        if self._config.alert_jsonl_file is not None:
+            sinks.append(JsonLinesAlertSink(self._config.alert_jsonl_file))
+        if self._config.alert_webhook_url is not None:
+            sinks.append(WebhookAlertSink(self._config.alert_webhook_url, timeout_s=self._config.alert_webhook_timeout_s))
+        return AlertDispatcher(
+            sinks,
+            min_samples=self._config.alert_min_samples,
+            max_per_minute=self._config.alert_max_per_minute,
+            queue_size=self._config.alert_queue_size,
+        )
+
+    def _make_traffic_log(self) -> TrafficStatsLogger | None:
+        """Build the streaming traffic statistics log if enabled in the config."""
+        if self._config.traffic_stats_file is None:
+            return None
+        stats = TrafficStats(
+            intervals_s=self._config.traffic_intervals_s,
+            histogram_bin_mph=self._config.traffic_histogram_bin_mph,
+            max_speed_mph=self._config.traffic_max_speed_mph,
+        )
+        return TrafficStatsLogger(self._config.traffic_stats_file, stats)
+
+    def _make_renderer(self) -> DisplayRenderer:
+        """Build the background display renderer."""
+        return DisplayRenderer(
+            max_fps=self._config.display_max_fps,
+            scale=self._config.display_scale,
+            roi=self._config.roi,
+        )
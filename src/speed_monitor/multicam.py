@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import dataclasses
+import multiprocessing as mp
+import queue
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .capture import is_live_source
+from .config import CameraConfig, MonitorConfig
+from .logger import CsvSpeedLogger, CsvSummaryLogger, ThreadedCsvSpeedLogger
+from .monitor import SpeedMonitor
+from .tracker import TrackerState
+
+
+# Rows written per supervision pass; the loop goes back to `_supervise` after each batch.
+_DRAIN_BATCH_ROWS = 1_000
+
+
+class QueueLogger:
+    """Logger that forwards rows, tagged with a camera ID, to a shared queue.
+
+    When `last_track_id` (a shared integer) is given, it is raised to each
+    row's track ID before the row is queued, so the parent knows which IDs
+    this camera has already used.
+    """
+
+    def __init__(self, out_queue: Any, camera_id: str, last_track_id: Any = None) -> None:
+        """Initialize the logger with the parent's queue and this camera's ID."""
+        self._queue = out_queue
+        self._camera_id = camera_id
+        self._last_track_id = last_track_id
+
+    def __enter__(self) -> "QueueLogger":
+        """No-op; the queue is owned by the parent process."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """No-op; the queue is owned by the parent process."""
+
+    def log(self, row: Any) -> None:
+        """Forward a single row to the aggregating process."""
+        if self._last_track_id is not None and row.track_id > self._last_track_id.value:
+            self._last_track_id.value = row.track_id
+        self._queue.put((self._camera_id, row))
+
+
+class CameraTaggedCsvLogger(CsvSpeedLogger):
+    """Write rows from several cameras to one CSV, prefixed with a camera_id column."""
+
+    def __init__(self, path: str | Path, *, base: type[CsvSpeedLogger]) -> None:
+        """Initialize the logger; `base` defines the per-row schema."""
+        super().__init__(path)
+        _tag_schema(self, base)
+
+
+class ThreadedCameraTaggedCsvLogger(ThreadedCsvSpeedLogger):
+    """`CameraTaggedCsvLogger` that writes from a background thread (`log_async`)."""
+
+    def __init__(self, path: str | Path, *, base: type[CsvSpeedLogger]) -> None:
+        """Initialize the logger; `base` defines the per-row schema."""
+        super().__init__(path)
+        _tag_schema(self, base)
+
+
+def _tag_schema(logger: CsvSpeedLogger, base: type[CsvSpeedLogger]) -> None:
+    """Give `logger` the schema of `base` with a leading camera_id column."""
+    logger._fieldnames = ["camera_id", *base._fieldnames]
+    base_format = base._format
+    logger._format = lambda tagged: [tagged[0], *base_format(tagged[1])]
+
+
+@dataclass
+class WorkerStatus:
+    """Supervisor bookkeeping for one camera worker."""
+    camera: CameraConfig
+    last_track_id: Any = None
+    process: Any = None
+    restarts: int = 0
+    next_start: float = 0.0
+    done: bool = False
+    failed: bool = False
+
+
+def camera_monitor_config(config: MonitorConfig, camera: CameraConfig) -> MonitorConfig:
+    """Return the single-camera config for `camera`, applying its overrides.
+
+    Per-camera files get the camera ID before the suffix: a checkpoint file
+    `state.npz` becomes `state.<camera_id>.npz`, likewise the alert and traffic logs.
+    """
+    return dataclasses.replace(
+        config,
+        calibration=camera.calibration if camera.calibration is not None else config.calibration,
+        roi=camera.roi if camera.roi is not None else config.roi,
+        cameras=(),
+        checkpoint_file=_camera_path(config.checkpoint_file, camera.camera_id),
+        alert_jsonl_file=_camera_path(config.alert_jsonl_file, camera.camera_id),
+        traffic_stats_file=_camera_path(config.traffic_stats_file, camera.camera_id),
+    )
+
+
+def _camera_path(path: str | None, camera_id: str) -> str | None:
+    """Insert `camera_id` before the suffix of `path` (None stays None)."""
+    if path is None:
+        return None
+    p = Path(path)
+    return str(p.with_name(f"{p.stem}.{camera_id}{p.suffix}"))
+
+
+def _camera_worker(
+    camera: CameraConfig,
+    config: MonitorConfig,
+    out_queue: Any,
+    max_frames: int | None,
+    last_track_id: Any,
+) -> None:
+    """Worker process entry point: run one camera and forward its rows.
+
+    Track IDs continue after `last_track_id`, so a restarted worker does not
+    reuse IDs logged by the one before it.
+    """
+    monitor = SpeedMonitor(config=camera_monitor_config(config, camera))
+    monitor.tracker.restore_state(TrackerState(next_id=last_track_id.value + 1, tracks=[]))
+    monitor.run(
+        video_source=camera.source,
+        logger=QueueLogger(out_queue, camera.camera_id, last_track_id),
+        max_frames=max_frames,
+    )
+
+
+class MultiCameraRunner:
+    """Run one `SpeedMonitor` per camera in separate processes.
+
+    The parent process supervises the workers and aggregates their rows into a
+    single CSV tagged with `camera_id`, written from a background thread when
+    `config.log_async` is set. A worker on a video file is finished when it
+    exits cleanly and is not restarted after a crash, since it would start
+    over and log its rows twice. A worker on a live source is restarted after
+    an exponential backoff whenever it exits, including cleanly after a
+    network drop, up to `config.max_worker_restarts` times; only a run bounded
+    by `max_frames` ends it. A restarted worker numbers its tracks after the
+    highest track ID its camera has logged, so `(camera_id, track_id)` stays
+    unique across restarts.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: MonitorConfig,
+        cameras: Sequence[CameraConfig],
+        restart_backoff_s: float = 1.0,
+        max_backoff_s: float = 30.0,
+    ) -> None:
+        """Initialize the runner for the given cameras."""
+        if not cameras:
+            raise ValueError("at least one camera is required")
+        ids = [c.camera_id for c in cameras]
+        if len(set(ids)) != len(ids):
+            raise ValueError(f"camera ids must be unique; got {ids}")
+        if config.log_format != "csv":
+            raise ValueError(f"log_format {config.log_format!r} is not supported with multiple cameras; use csv")
+        self._config = config
+        self._restart_backoff_s = float(restart_backoff_s)
+        self._max_backoff_s = float(max_backoff_s)
+        self._ctx = mp.get_context()
+        self._workers = [WorkerStatus(camera=c, last_track_id=self._ctx.RawValue("q", 0)) for c in cameras]
+
+    @property
+    def workers(self) -> list[WorkerStatus]:
+        """Per-camera worker status, in camera order."""
+        return self._workers
+
+    def run(self, *, output_csv: str, max_frames: int | None = None) -> None:
+        """Run all cameras until every worker has finished or given up."""
+        out_queue = self._ctx.Queue(maxsize=10_000)
+        base = CsvSummaryLogger if self._config.log_mode == "summary" else CsvSpeedLogger
+        tagged = ThreadedCameraTaggedCsvLogger if self._config.log_async else CameraTaggedCsvLogger
+
+        try:
+            with tagged(output_csv, base=base) as logger:
+                while True:
+                    self._supervise(out_queue, max_frames)
+                    self._drain(out_queue, logger, timeout_s=0.2, max_rows=_DRAIN_BATCH_ROWS)
+                    if all(w.done for w in self._workers):
+                        break
+                # Workers have exited, so everything they queued is readable.
+                self._drain(out_queue, logger, timeout_s=0.0)
+        finally:
+            for w in self._workers:
+                if w.process is not None and w.process.is_alive():
+                    w.process.terminate()
+                    w.process.join()
+
+    def _supervise(self, out_queue: Any, max_frames: int | None) -> None:
+        """Start pending workers and handle exited ones."""
+        now = time.monotonic()
+        for w in self._workers:
+            if w.done:
+                continue
+
+            if w.process is None:
+                if now >= w.next_start:
+                    w.process = self._ctx.Process(
+                        target=_camera_worker,
+                        args=(w.camera, self._config, out_queue, max_frames, w.last_track_id),
+                        name=f"speed_monitor-{w.camera.camera_id}",
+                        daemon=True,
+                    )
+                    w.process.start()
+                continue
+
+            if w.process.is_alive():
+                continue
+
+            exitcode = w.process.exitcode
+            w.process.join()
+            w.process = None
+            live = is_live_source(w.camera.source)
+            if exitcode == 0 and (not live or max_frames is not None):
+                w.done = True
+            elif not live:
+                print(
+                    f"camera={w.camera.camera_id} worker exited with code {exitcode}; "
+                    "not restarting a file source",
+                    file=sys.stderr,
+                )
+                w.done = True
+                w.failed = True
+            elif w.restarts >= self._config.max_worker_restarts:
+                print(
+                    f"camera={w.camera.camera_id} worker exited with code {exitcode}; giving up "
+                    f"after {w.restarts} restarts",
+                    file=sys.stderr,
+                )
+                w.done = True
+                w.failed = True
+            else:
+                backoff = min(self._max_backoff_s, self._restart_backoff_s * (2 ** w.restarts))
+                w.restarts += 1
+                w.next_start = now + backoff
+                print(
+                    f"camera={w.camera.camera_id} worker exited with code {exitcode}; "
+                    f"restart {w.restarts}/{self._config.max_worker_restarts} in {backoff:.1f}s",
+                    file=sys.stderr,
+                )
+
+    @staticmethod
+    def _drain(out_queue: Any, logger: CsvSpeedLogger, *, timeout_s: float, max_rows: int | None = None) -> None:
+        """Write rows available on the queue, at most `max_rows` of them (None: all).
+
+        Bounding the batch keeps a busy queue from starving `_supervise`, which
+        must still notice crashed workers while cameras are producing rows.
+        """
+        try:
+            item = out_queue.get(timeout=timeout_s) if timeout_s > 0 else out_queue.get_nowait()
+        except queue.Empty:
+            return
+        n = 0
+        while True:
+            logger.log(item)
+            n += 1
+            if max_rows is not None and n >= max_rows:
+                return
+            try:
+                item = out_queue.get_nowait()
+            except queue.Empty:
+                return
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import sys
+import time
+from pathlib import Path
+
+from .config import MonitorConfig, load_config
+
+# Fields `SpeedMonitor.apply_config` can change while running. Everything else
+# sizes buffers, selects backends or opens outputs, and needs a restart.
+RELOADABLE_FIELDS = frozenset(
+    {
+        "calibration",
+        "min_contour_area_px",
+        "frame_diff_alpha",
+        "frame_diff_threshold",
+        "max_track_age_frames",
+        "match_max_distance_px",
+        "match_assignment",
+        "max_tracks",
+        "kalman_process_noise",
+        "kalman_measurement_noise",
+        "speed_limit_mph",
+    }
+)
+
+
+def changed_fields(old: MonitorConfig, new: MonitorConfig) -> list[str]:
+    """Names of top-level fields whose values differ, in declaration order."""
+    return [f.name for f in dataclasses.fields(MonitorConfig) if getattr(old, f.name) != getattr(new, f.name)]
+
+
+class ConfigWatcher:
+    """Reload a JSON config file when it changes or when asked to.
+
+    `poll` stats the file at most every `poll_interval_s` seconds (0 disables
+    polling) and re-reads it when its modification time or size changed, or
+    unconditionally after `request_reload`, which is safe to call from a
+    signal handler. Only fields that changed *in the file* are reported, so
+    command-line overrides of the running config survive reloads that do not
+    touch them.
+    """
+
+    def __init__(self, path: str | Path, *, poll_interval_s: float = 1.0) -> None:
+        """Remember the file's current contents and stat signature."""
+        self._path = Path(path)
+        self._interval_s = float(poll_interval_s)
+        self._signature = self._stat()
+        self._file_config = load_config(self._path)
+        self._next_poll_s = time.monotonic() + self._interval_s
+        self._requested = False
+
+    def request_reload(self) -> None:
+        """Re-read the file on the next `poll`, whether or not it changed."""
+        self._requested = True
+
+    def poll(self, now_s: float | None = None) -> dict[str, object] | None:
+        """Return {field: new value} for fields changed in the file, or None.
+
+        An unreadable or invalid file is reported on stderr and skipped; the
+        previous contents stay the reference for the next reload.
+        """
+        requested, self._requested = self._requested, False
+        if not requested:
+            if self._interval_s <= 0:
+                return None
+            now_s = time.monotonic() if now_s is None else now_s
+            if now_s < self._next_poll_s:
+                return None
+            self._next_poll_s = now_s + self._interval_s
+            signature = self._stat()
+            if signature == self._signature:
+                return None
+            self._signature = signature
+        else:
+            self._signature = self._stat()
+
+        try:
+            new = load_config(self._path)
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            # json.JSONDecodeError is a ValueError.
+            print(f"Config reload failed, keeping current settings: {exc}", file=sys.stderr)
+            return None
+        old, self._file_config = self._file_config, new
+        return {name: getattr(new, name) for name in changed_fields(old, new)}
+
+    def _stat(self) -> tuple[int, int] | None:
+        """Return the file's (mtime_ns, size), or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(self._path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import math
+
+
+class StrideScheduler:
+    """Decide which frames get full processing so latency stays within budget.
+
+    The scheduler keeps an exponential moving average of per-frame processing
+    time. A frame stride of N means one frame in N is processed; the others
+    are only grabbed (demuxed, never retrieved/converted to BGR). The stride is
+    raised immediately when processing exceeds `budget_s * stride` and lowered
+    one step at a time once there is comfortable headroom, up to `max_stride`.
+
+    Frame indices passed to `should_process` are positions in the source
+    stream, so skipped frames leave gaps that speed estimation already accounts
+    for through `frames_delta`.
+    """
+
+    def __init__(
+        self,
+        *,
+        budget_s: float,
+        max_stride: int = 4,
+        smoothing: float = 0.2,
+        headroom: float = 0.8,
+    ) -> None:
+        """Configure the per-source-frame latency budget and adaptation."""
+        if budget_s <= 0:
+            raise ValueError("budget_s must be > 0")
+        self._budget_s = float(budget_s)
+        self._max_stride = max(1, int(max_stride))
+        self._smoothing = float(smoothing)
+        self._headroom = float(headroom)
+
+        self._ema_s: float | None = None
+        self._last_processed: int | None = None
+        self.stride = 1
+
+    @property
+    def latency_ema_s(self) -> float | None:
+        """Smoothed processing time per processed frame, in seconds."""
+        return self._ema_s
+
+    def should_process(self, frame_idx: int) -> bool:
+        """Return True if the frame at `frame_idx` should be fully processed."""
+        if self._last_processed is None or frame_idx - self._last_processed >= self.stride:
+            self._last_processed = frame_idx
+            return True
+        return False
+
+    def record(self, latency_s: float) -> None:
+        """Feed back the processing time of one processed frame."""
+        if self._ema_s is None:
+            self._ema_s = float(latency_s)
+        else:
+            self._ema_s += self._smoothing * (float(latency_s) - self._ema_s)
+
+        needed = max(1, math.ceil(self._ema_s / self._budget_s))
+        if needed > self.stride:
+            self.stride = min(self._max_stride, needed)
+        elif self.stride > 1 and self._ema_s < self._headroom * self._budget_s * (self.stride - 1):
+            self.stride -= 1
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import contextlib
+import csv
+import dataclasses
+import datetime as dt
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+import cv2
+import numpy as np
+
+from .assignment import greedy_assignment, pairwise_distances
+from .config import MonitorConfig
+from .logger import CsvSpeedLogger, SpeedLogRow
+from .monitor import SpeedMonitor, make_logger
+from .summary import VehicleSummarizer, VehicleSummary
+from .tracker import Track
+from .types import BBox
+
+
+@dataclass(frozen=True)
+class Segment:
+    """A slice of a recorded video processed by one worker.
+
+    Frames `warmup_start .. start - 1` are only used to learn the background
+    model and seed the tracker; measurements cover `start .. end` (inclusive,
+    `end=None` meaning end of stream). Frame indices are 1-based positions in
+    the whole video, as in a sequential run.
+    """
+    index: int
+    warmup_start: int
+    start: int
+    end: int | None
+
+
+class TrackEdge(NamedTuple):
+    """A track live at a segment edge, as reported by a segment worker."""
+    track_id: int  # local to the worker
+    bbox: BBox
+    last_seen_frame: int
+    timestamp_iso: str
+    # `VehicleSummarizer.detach` state from the measured frames (summary mode).
+    state: object | None = None
+
+
+@dataclass
+class SegmentResult:
+    """What one segment worker hands back; it grows with vehicles, not frames.
+
+    Track IDs are local to the worker. `boundary` holds the tracks live at the
+    last warm-up frame, which may continue tracks of the previous segment, and
+    `tail` those still live after the last measured frame. `closed` lists, in
+    close order, the summary of each vehicle seen only in this segment and a
+    `TrackEdge` for each closed boundary track, whose summary may still need
+    the previous segment's part. In frames mode, rows are in `log_path`.
+    """
+    segment: Segment
+    # Local track IDs in order of their first measured frame.
+    track_ids: list[int] = field(default_factory=list)
+    boundary: dict[int, TrackEdge] = field(default_factory=dict)
+    tail: dict[int, TrackEdge] = field(default_factory=dict)
+    closed: list[VehicleSummary | TrackEdge] = field(default_factory=list)
+    log_path: str | None = None
+
+
+def plan_segments(total_frames: int, n_segments: int, warmup_frames: int) -> list[Segment]:
+    """Split `total_frames` into `n_segments` contiguous measured ranges."""
+    if total_frames <= 0:
+        raise ValueError("total_frames must be > 0")
+    n = max(1, min(int(n_segments), int(total_frames)))
+    bounds = np.linspace(0, total_frames, n + 1).round().astype(int).tolist()
+
+    segments = []
+    for i in range(n):
+        start = bounds[i] + 1
+        segments.append(
+            Segment(
+                index=i,
+                warmup_start=max(1, start - int(warmup_frames)),
+                start=start,
+                # The last segment runs to the real end of stream, since
+                # container frame counts can be approximate.
+                end=None if i == n - 1 else bounds[i + 1],
+            )
+        )
+    return segments
+
+
+def process_segment(video_path: str, config: MonitorConfig, segment: Segment, log_dir: str) -> SegmentResult:
+    """Process one segment of a video file (runs in a worker process).
+
+    Tracks are summarized as the tracker closes them and, in frames mode, rows
+    stream to a CSV file in `log_dir`, so memory stays flat however long the
+    segment is.
+    """
+    monitor = SpeedMonitor(config=config)
+    tracker = monitor.tracker
+    summarizer = VehicleSummarizer()
+    result = SegmentResult(segment=segment)
+    per_frame = config.log_mode == "frames"
+    if per_frame:
+        result.log_path = os.path.join(log_dir, f"segment-{segment.index:04d}.csv")
+    seen: set[int] = set()
+
+    def close(tracks: list[Track], timestamp_iso: str) -> None:
+        """Summarize closed tracks; boundary tracks are handed back unsummarized."""
+        for tr in tracks:
+            if tr.track_id in result.boundary:
+                result.closed.append(_edge(tr, timestamp_iso, summarizer.detach(tr.track_id)))
+                continue
+            summary = summarizer.close(tr, timestamp_iso)
+            if summary is not None:
+                result.closed.append(summary)
+
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Could not open video source: {video_path}")
+    try:
+        with CsvSpeedLogger(result.log_path) if per_frame else contextlib.nullcontext() as logger:
+            if segment.warmup_start > 1:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, segment.warmup_start - 1)
+
+            frame_idx = segment.warmup_start - 1
+            while segment.end is None or frame_idx < segment.end:
+                ok, frame = cap.read()
+                if not ok:
+                    break
+                frame_idx += 1
+
+                _det, tracks = monitor.process_frame(frame, frame_idx)
+                closed = tracker.pop_closed_tracks()
+                timestamp_iso = dt.datetime.now(dt.timezone.utc).isoformat()
+                if frame_idx < segment.start:
+                    if frame_idx == segment.start - 1:
+                        result.boundary = {tr.track_id: _edge(tr, timestamp_iso) for tr in tracks}
+                    continue
+
+                for tr, speed_mph in zip(tracks, monitor.estimate_speeds_mph(tracks)):
+                    if tr.track_id not in seen:
+                        seen.add(tr.track_id)
+                        result.track_ids.append(tr.track_id)
+                    if not per_frame:
+                        if tr.last_seen_frame == frame_idx:
+                            summarizer.observe(tr, frame_idx, speed_mph)
+                    elif speed_mph is not None:
+                        logger.log(
+                            SpeedLogRow(
+                                timestamp_iso=timestamp_iso,
+                                frame_idx=frame_idx,
+                                track_id=tr.track_id,
+                                x1=tr.bbox.x1,
+                                y1=tr.bbox.y1,
+                                x2=tr.bbox.x2,
+                                y2=tr.bbox.y2,
+                                speed_mph=float(speed_mph),
+                            )
+                        )
+                close(closed, timestamp_iso)
+    finally:
+        cap.release()
+
+    timestamp_iso = dt.datetime.now(dt.timezone.utc).isoformat()
+    if segment.end is not None and frame_idx == segment.end:
+        # The next segment continues these tracks.
+        result.tail = {
+            tr.track_id: _edge(tr, timestamp_iso, summarizer.detach(tr.track_id)) for tr in tracker.close_all()
+        }
+    else:
+        close(tracker.close_all(), timestamp_iso)
+    return result
+
+
+def _edge(tr: Track, timestamp_iso: str, state: object | None = None) -> TrackEdge:
+    """Snapshot a track at a segment edge."""
+    return TrackEdge(tr.track_id, tr.bbox, tr.last_seen_frame, timestamp_iso, state)
+
+
+def _centroids(edges: list[TrackEdge]) -> np.ndarray:
+    """(N, 2) bounding-box centers of edge tracks."""
+    return np.array([((e.bbox.x1 + e.bbox.x2) / 2.0, (e.bbox.y1 + e.bbox.y2) / 2.0) for e in edges])
+
+
+def stitch_segments(results: list[SegmentResult], *, match_max_distance_px: float) -> list[dict[int, int]]:
+    """Map each segment's local track IDs to globally unique IDs, in segment order.
+
+    A track live at a segment's last warm-up frame is linked to the nearest
+    track the previous segment still had live after its last measured frame
+    (the same frame), so a vehicle crossing a boundary keeps one ID. Both
+    sides only drop a track after `max_track_age_frames` without a match, so
+    a vehicle missed by the detector around the cut is still linked, by its
+    last seen positions. Other tracks get new IDs in order of first appearance.
+    """
+    global_ids: list[dict[int, int]] = []
+    next_id = 1
+    prev_tail: list[TrackEdge] = []
+    prev_ids: dict[int, int] = {}
+
+    for res in results:
+        ids: dict[int, int] = {}
+        cur = list(res.boundary.values())
+        prev = [e for e in prev_tail if e.track_id in prev_ids]
+        if cur and prev:
+            dist = pairwise_distances(_centroids(cur), _centroids(prev))
+            for ci, pi in greedy_assignment(dist, match_max_distance_px):
+                ids[cur[ci].track_id] = prev_ids[prev[pi].track_id]
+
+        for track_id in res.track_ids:
+            if track_id not in ids:
+                ids[track_id] = next_id
+                next_id += 1
+        global_ids.append(ids)
+        prev_tail = list(res.tail.values())
+        prev_ids = ids
+
+    return global_ids
+
+
+def write_segment_results(
+    config: MonitorConfig,
+    results: list[SegmentResult],
+    global_ids: list[dict[int, int]],
+    output_path: str,
+) -> None:
+    """Write stitched segment results in the configured log mode and format.
+
+    Frames-mode rows are streamed from each worker's log with their IDs
+    renumbered. In summary mode, the parts of a vehicle that crossed segment
+    boundaries are merged before it is summarized.
+    """
+    with make_logger(config, output_path) as logger:
+        if config.log_mode == "frames":
+            for res, ids in zip(results, global_ids):
+                with open(res.log_path, newline="") as f:
+                    for rec in csv.DictReader(f):
+                        logger.log(
+                            SpeedLogRow(
+                                timestamp_iso=rec["timestamp_iso"],
+                                frame_idx=int(rec["frame_idx"]),
+                                track_id=ids[int(rec["track_id"])],
+                                x1=int(rec["x1"]),
+                                y1=int(rec["y1"]),
+                                x2=int(rec["x2"]),
+                                y2=int(rec["y2"]),
+                                speed_mph=float(rec["speed_mph"]),
+                            )
+                        )
+            return
+
+        summarizer = VehicleSummarizer()
+        # Global ID -> the last part of a vehicle still live at a segment end.
+        pending: dict[int, TrackEdge] = {}
+
+        def close(gid: int, edge: TrackEdge) -> None:
+            """Summarize the merged parts of one vehicle."""
+            summary = summarizer.close(Track(gid, edge.bbox, edge.last_seen_frame), edge.timestamp_iso)
+            if summary is not None:
+                logger.log(summary)
+
+        for res, ids in zip(results, global_ids):
+            continued = {ids[t] for t in res.boundary if t in ids}
+            for gid in [gid for gid in pending if gid not in continued]:
+                close(gid, pending.pop(gid))  # ended in the cut
+
+            for item in res.closed:
+                if isinstance(item, VehicleSummary):
+                    logger.log(dataclasses.replace(item, track_id=ids[item.track_id]))
+                elif item.track_id in ids:
+                    gid = ids[item.track_id]
+                    pending.pop(gid, None)
+                    summarizer.attach(gid, item.state)
+                    close(gid, item)
+
+            for edge in res.tail.values():
+                if edge.track_id in ids:
+                    gid = ids[edge.track_id]
+                    summarizer.attach(gid, edge.state)
+                    pending[gid] = edge
+
+        for gid, edge in pending.items():
+            close(gid, edge)
+
+
+def run_segmented(
+    *,
+    config: MonitorConfig,
+    video_path: str,
+    output_path: str,
+    n_segments: int,
+    warmup_frames: int,
+    max_workers: int | None = None,
+    max_frames: int | None = None,
+) -> None:
+    """Process a recorded video in parallel segments and write stitched results."""
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Could not open video source: {video_path}")
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    if total_frames <= 0:
+        raise ValueError(f"Cannot determine frame count of {video_path}; segmented mode needs a video file")
+
+    if max_frames is not None:
+        total_frames = min(total_frames, int(max_frames))
+    segments = plan_segments(total_frames, n_segments, warmup_frames)
+    if max_frames is not None:
+        segments[-1] = dataclasses.replace(segments[-1], end=total_frames)
+    workers = max_workers or min(len(segments), os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory(prefix="speed_monitor-segments-") as log_dir:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            jobs = [(video_path, config, seg, log_dir) for seg in segments]
+            results = list(pool.map(process_segment, *zip(*jobs)))
+
+        global_ids = stitch_segments(results, match_max_distance_px=config.match_max_distance_px)
+        write_segment_results(config, results, global_ids, output_path)
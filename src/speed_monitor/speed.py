@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import math
 
+import cv2
+import numpy as np
+
 from .config import CalibrationConfig
 
 
@@ -54,3 +57,69 @@ def speed_mph_from_pixel_displacement(
 
     feet_per_second = feet / seconds
     return feet_per_second * 3600.0 / 5280.0
+
+
+class GroundPlane:
+    """Vectorized pixel-to-ground conversion for all tracks in a frame.
+
+    Built once from the calibration. With a 4-point homography
+    (`homography_image_points` -> `homography_ground_points_ft`), pixel
+    positions are projected onto the ground plane and speed is the ground
+    distance travelled, so perspective is corrected in both axes. Otherwise
+    the near/far feet-per-pixel interpolation of `feet_per_pixel_at_y` is
+    applied, evaluated at the later point.
+    """
+
+    def __init__(self, calibration: CalibrationConfig) -> None:
+        """Precompute the projection for `calibration`."""
+        self._fps = float(calibration.fps)
+        self._homography: np.ndarray | None = None
+        if calibration.homography_image_points is not None:
+            src = np.asarray(calibration.homography_image_points, dtype=np.float32)
+            dst = np.asarray(calibration.homography_ground_points_ft, dtype=np.float32)
+            self._homography = cv2.getPerspectiveTransform(src, dst).astype(np.float64)
+
+        self._near = float(calibration.feet_per_pixel_near)
+        self._far = self._near
+        self._y0 = self._dy = 0.0
+        if (
+            calibration.feet_per_pixel_far is not None
+            and calibration.y_near is not None
+            and calibration.y_far is not None
+            and not math.isclose(float(calibration.y_near), float(calibration.y_far))
+        ):
+            self._far = float(calibration.feet_per_pixel_far)
+            self._y0 = float(calibration.y_near)
+            self._dy = float(calibration.y_far) - self._y0
+
+    @property
+    def has_homography(self) -> bool:
+        """True if the calibration has a homography; otherwise the near/far scale is used."""
+        return self._homography is not None
+
+    def to_ground(self, points: np.ndarray) -> np.ndarray:
+        """Project (N, 2) pixel positions to (N, 2) ground coordinates in feet."""
+        if self._homography is None:
+            raise ValueError("ground projection requires a homography calibration")
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        h = self._homography
+        w = pts @ h[2, :2] + h[2, 2]
+        return (pts @ h[:2, :2].T + h[:2, 2]) / w[:, None]
+
+    def feet_per_pixel(self, y: np.ndarray) -> np.ndarray:
+        """Vectorized `feet_per_pixel_at_y` for the near/far model."""
+        y = np.asarray(y, dtype=np.float64)
+        if self._dy == 0.0:
+            return np.full(y.shape, self._near)
+        t = (y - self._y0) * (1.0 / self._dy)
+        np.clip(t, 0.0, 1.0, out=t)
+        return self._near + t * (self._far - self._near)
+
+    def speeds_mph(self, p0: np.ndarray, p1: np.ndarray, frames_delta: np.ndarray) -> np.ndarray:
+        """Speeds in mph for moves from `p0` to `p1` ((N, 2) pixels) over `frames_delta` (> 0) frames."""
+        if self._homography is not None:
+            d = self.to_ground(p1) - self.to_ground(p0)
+            feet = np.hypot(d[:, 0], d[:, 1])
+        else:
+            feet = np.hypot(p1[:, 0] - p0[:, 0], p1[:, 1] - p0[:, 1]) * self.feet_per_pixel(p1[:, 1])
+        return feet * (self._fps * 3600.0 / 5280.0) / frames_delta
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .tracker import Track
+
+
+@dataclass(frozen=True)
+class VehicleSummary:
+    """One record per vehicle, emitted when its track closes."""
+    timestamp_iso: str
+    track_id: int
+    entry_frame: int
+    exit_frame: int
+    samples: int
+    path_length_px: float
+    median_speed_mph: float
+    max_speed_mph: float
+    robust_speed_mph: float
+
+
+@dataclass
+class _VehicleAccumulator:
+    """Running per-track state collected while a track is live."""
+    entry_frame: int
+    last_x: float
+    last_y: float
+    path_length_px: float = 0.0
+    speeds: list[float] = field(default_factory=list)
+
+
+class VehicleSummarizer:
+    """Collect per-frame speed samples per track and summarize on track close.
+
+    `observe` is called for tracks that were matched in the current frame;
+    `close` is called with tracks the tracker has dropped and returns a
+    `VehicleSummary` (or None if the track never produced a speed estimate).
+    At most `max_samples` speeds are kept per track so memory stays bounded
+    for long-lived tracks.
+    """
+
+    def __init__(self, *, max_samples: int = 1024) -> None:
+        """Initialize an empty summarizer."""
+        self._max_samples = max(1, int(max_samples))
+        self._acc: dict[int, _VehicleAccumulator] = {}
+
+    def observe(self, tr: Track, frame_idx: int, speed_mph: float | None) -> None:
+        """Record the track's position and speed estimate for this frame."""
+        acc = self._acc.get(tr.track_id)
+        if acc is None:
+            acc = _VehicleAccumulator(entry_frame=frame_idx, last_x=tr.cx, last_y=tr.cy)
+            self._acc[tr.track_id] = acc
+        else:
+            dx = tr.cx - acc.last_x
+            dy = tr.cy - acc.last_y
+            acc.path_length_px += (dx * dx + dy * dy) ** 0.5
+            acc.last_x, acc.last_y = tr.cx, tr.cy
+
+        if speed_mph is not None and len(acc.speeds) < self._max_samples:
+            acc.speeds.append(float(speed_mph))
+
+    def detach(self, track_id: int) -> _VehicleAccumulator | None:
+        """Remove and return a live track's state without summarizing it."""
+        return self._acc.pop(track_id, None)
+
+    def attach(self, track_id: int, state: _VehicleAccumulator | None) -> None:
+        """Continue `track_id` with state detached from a later stretch of the same vehicle.
+
+        Used to summarize vehicles whose track was split, e.g. by a segment
+        boundary. The gap between the two stretches is not added to the path.
+        """
+        if state is None:
+            return
+        acc = self._acc.get(track_id)
+        if acc is None:
+            self._acc[track_id] = state
+            return
+        acc.path_length_px += state.path_length_px
+        acc.last_x, acc.last_y = state.last_x, state.last_y
+        acc.speeds.extend(state.speeds[: self._max_samples - len(acc.speeds)])
+
+    def close(self, tr: Track, timestamp_iso: str) -> VehicleSummary | None:
+        """Summarize and forget a closed track."""
+        acc = self._acc.pop(tr.track_id, None)
+        if acc is None or not acc.speeds:
+            return None
+
+        speeds = np.asarray(acc.speeds)
+        q25, median, q75 = np.percentile(speeds, [25.0, 50.0, 75.0])
+        # Interquartile mean: ignores start-up and occlusion outliers.
+        core = speeds[(speeds >= q25) & (speeds <= q75)]
+        if core.size == 0:
+            # Two samples interpolate quartiles strictly between them.
+            core = np.asarray([median])
+        return VehicleSummary(
+            timestamp_iso=timestamp_iso,
+            track_id=tr.track_id,
+            entry_frame=int(acc.entry_frame),
+            exit_frame=int(tr.last_seen_frame),
+            samples=int(speeds.size),
+            path_length_px=float(acc.path_length_px),
+            median_speed_mph=float(median),
+            max_speed_mph=float(speeds.max()),
+            robust_speed_mph=float(core.mean()),
+        )
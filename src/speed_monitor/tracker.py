@@ -1,17 +1,153 @@
 from __future__ import annotations
 
+import heapq
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 
-from .types import BBox
+import numpy as np
 
+from .assignment import get_assignment_solver, pairwise_distances
+from .types import BBox, Detections
 
-def _euclidean(a: tuple[float, float], b: tuple[float, float]) -> float:
-    dx = a[0] - b[0]
-    dy = a[1] - b[1]
-    return (dx * dx + dy * dy) ** 0.5
+DEFAULT_HISTORY_SIZE = 32
 
 
-@dataclass
+def as_detections(detections: Detections | Sequence[BBox]) -> Detections:
+    """Accept either a `Detections` batch or a sequence of `BBox` objects."""
+    if isinstance(detections, Detections):
+        return detections
+    return Detections.from_bboxes(detections)
+
+
+class TrackHistory:
+    """
+    Fixed-capacity ring buffer of (frame_idx, center_x, center_y) samples.
+
+    Backed by a single preallocated NumPy array, so memory per track is constant
+    no matter how long the track lives. Once full, appending overwrites the
+    oldest sample. Indexing follows list semantics over the retained samples
+    (`history[-1]` is the newest) and returns plain Python tuples.
+
+    The buffer also keeps running least-squares sums over the retained samples,
+    updated in O(1) per append (the overwritten sample is subtracted), so
+    `fitted_segment` is O(1) whatever the capacity. Frame indices are taken
+    relative to an origin that is moved to the oldest sample, with the sums
+    recomputed from scratch, every `_REBASE_SPAN` frames; this keeps them small
+    and stops rounding error from accumulating on long-lived tracks.
+    """
+
+    _REBASE_SPAN = 4096
+
+    __slots__ = ("_buf", "_next", "_len", "_t0", "_st", "_stt", "_sx", "_sy", "_stx", "_sty")
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_SIZE) -> None:
+        """Initialize an empty history holding at most `capacity` samples."""
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self._buf = np.empty((int(capacity), 3), dtype=np.float64)
+        self._next = 0
+        self._len = 0
+        self._t0 = 0.0
+        self._st = self._stt = self._sx = self._sy = self._stx = self._sty = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples retained."""
+        return self._buf.shape[0]
+
+    def append(self, sample: tuple[int, float, float]) -> None:
+        """Append a sample, overwriting the oldest one when full."""
+        f, x, y = sample
+        buf = self._buf
+        i = self._next
+        if self._len == 0:
+            self._t0 = float(f)
+        elif self._len == buf.shape[0]:
+            # Remove the sample about to be overwritten from the running sums.
+            t = buf.item(i, 0) - self._t0
+            ox, oy = buf.item(i, 1), buf.item(i, 2)
+            self._st -= t
+            self._stt -= t * t
+            self._sx -= ox
+            self._sy -= oy
+            self._stx -= t * ox
+            self._sty -= t * oy
+
+        buf[i] = sample
+        t = f - self._t0
+        self._st += t
+        self._stt += t * t
+        self._sx += x
+        self._sy += y
+        self._stx += t * x
+        self._sty += t * y
+
+        self._next = (i + 1) % buf.shape[0]
+        if self._len < buf.shape[0]:
+            self._len += 1
+        if t > self._REBASE_SPAN:
+            self._rebase()
+
+    def fitted_segment(self) -> tuple[float, float, float, float, float] | None:
+        """Least-squares line through the retained samples, evaluated at both ends.
+
+        Returns `(x0, y0, x1, y1, frames)`: the fitted centers at the oldest and
+        newest retained frame and the number of frames between them, or None
+        with fewer than two distinct frames. With two samples this is exactly
+        the displacement between them.
+        """
+        n = self._len
+        if n < 2:
+            return None
+        denom = n * self._stt - self._st * self._st
+        if denom <= 0.0:
+            return None
+        bx = (n * self._stx - self._st * self._sx) / denom
+        by = (n * self._sty - self._st * self._sy) / denom
+        ax = (self._sx - bx * self._st) / n
+        ay = (self._sy - by * self._st) / n
+        t0 = self._buf.item((self._next - n) % self.capacity, 0) - self._t0
+        t1 = self._buf.item(self._next - 1, 0) - self._t0
+        return (ax + bx * t0, ay + by * t0, ax + bx * t1, ay + by * t1, t1 - t0)
+
+    def _rebase(self) -> None:
+        """Move the frame origin to the oldest sample and recompute the sums exactly."""
+        # The sums do not depend on order, so the ring can be read as stored.
+        samples = self._buf[: self._len]
+        self._t0 = float(self._buf[(self._next - self._len) % self.capacity, 0])
+        t = samples[:, 0] - self._t0
+        self._st = float(t.sum())
+        self._stt = float(t @ t)
+        self._sx = float(samples[:, 1].sum())
+        self._sy = float(samples[:, 2].sum())
+        self._stx = float(t @ samples[:, 1])
+        self._sty = float(t @ samples[:, 2])
+
+    def as_array(self) -> np.ndarray:
+        """Return the retained samples, oldest first, as an (N, 3) array copy."""
+        start = (self._next - self._len) % self.capacity
+        return np.roll(self._buf, -start, axis=0)[: self._len].copy()
+
+    def __len__(self) -> int:
+        """Number of samples retained."""
+        return self._len
+
+    def __getitem__(self, index: int) -> tuple[int, float, float]:
+        """Return sample `index`, counted from the oldest (negative from the newest)."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("track history index out of range")
+        f, x, y = self._buf[(self._next - self._len + index) % self.capacity].tolist()
+        return int(f), x, y
+
+    def __iter__(self) -> Iterator[tuple[int, float, float]]:
+        """Iterate over the samples, oldest first."""
+        for i in range(self._len):
+            yield self[i]
+
+
+@dataclass(slots=True)
 class Track:
     """
     A class that represents a tracked object across multiple frames.
@@ -20,8 +156,13 @@ class Track:
         track_id (int): Unique identifier for this track.
         bbox (BBox): Current bounding box of the tracked object.
         last_seen_frame (int): Frame index where the object was last detected.
-        history (list[tuple[int, float, float]]): List of (frame_idx, center_x, center_y) tuples
-            representing the object's position history across frames.
+        history (TrackHistory): Bounded ring buffer of the most recent
+            (frame_idx, center_x, center_y) samples.
+        velocity (tuple[float, float] | None): Filtered (vx, vy) in pixels per
+            frame when the tracker has a motion model, otherwise None.
+        speed_mph (float | None): Last speed estimate, cached by the monitor.
+        speed_frame (int | None): `last_seen_frame` when `speed_mph` was
+            computed; the cache is valid while the two are equal.
 
     Methods:
         update: Updates the track with a new bounding box and frame index.
@@ -31,7 +172,10 @@ class Track:
     track_id: int
     bbox: BBox
     last_seen_frame: int
-    history: list[tuple[int, float, float]] = field(default_factory=list)
+    history: TrackHistory = field(default_factory=TrackHistory)
+    velocity: tuple[float, float] | None = None
+    speed_mph: float | None = None
+    speed_frame: int | None = None
 
     def update(self, *, bbox: BBox, frame_idx: int) -> None:
         self.bbox = bbox
@@ -47,21 +191,43 @@ class Track:
         return self.bbox.cy
 
 
+@dataclass
+class TrackerState:
+    """Tracker state carried across restarts: the next track ID and the live tracks."""
+    next_id: int
+    tracks: list[Track]
+
+
 class CentroidTracker:
     """
     A centroid-based tracker for matching detections across frames.
 
-    Uses centroid distance to greedily match detections to existing tracks.
-    Tracks that are not updated for a configurable number of frames are removed.
+    Builds the track x detection centroid distance matrix in one NumPy
+    broadcast and matches it either greedily or optimally (see `assignment`).
+    Tracks that are not updated for a configurable number of frames are removed,
+    and at most `max_tracks` are kept alive at once: beyond that the least
+    recently seen tracks (oldest ID first on ties) are evicted. With
+    `report_closed`, removed tracks are queued until collected with
+    `pop_closed_tracks`; the caller must then drain the queue every frame.
+    Off by default, so standalone use keeps flat memory.
 
     Attributes:
         _max_age_frames: Maximum number of frames a track can exist without updates.
         _match_max_distance_px: Maximum centroid distance in pixels for a valid match.
+        _assign: Assignment solver selected by name ("greedy" or "optimal").
+        _history_size: Number of centroid samples retained per track.
+        _max_tracks: Hard cap on concurrently live tracks.
         _next_id: Counter for generating unique track IDs.
         _tracks: Dictionary mapping track IDs to Track objects.
+        _report_closed: Whether removed tracks are queued for `pop_closed_tracks`.
+        _closed: Tracks removed since the last `pop_closed_tracks` call.
 
     Methods:
         update: Updates tracks with new detections and returns all active tracks.
+        configure: Changes matching parameters while tracking.
+        state / restore_state: Export and adopt the next ID and live tracks.
+        pop_closed_tracks: Returns and clears tracks removed as stale or evicted.
+        close_all: Closes every live track (e.g. at end of stream).
     """
 
     def __init__(
@@ -69,61 +235,141 @@ class CentroidTracker:
         *,
         max_age_frames: int = 10,
         match_max_distance_px: float = 80.0,
+        assignment: str = "greedy",
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        max_tracks: int = 256,
+        report_closed: bool = False,
     ) -> None:
         self._max_age_frames = int(max_age_frames)
         self._match_max_distance_px = float(match_max_distance_px)
+        self._assign = get_assignment_solver(assignment)
+        self._history_size = max(2, int(history_size))
+        self._max_tracks = max(1, int(max_tracks))
+        self._report_closed = bool(report_closed)
 
         self._next_id = 1
         self._tracks: dict[int, Track] = {}
+        self._closed: list[Track] = []
 
-    def update(self, *, detections: list[BBox], frame_idx: int) -> list[Track]:
-        # Drop stale tracks.
-        stale_ids = [
-            tid
-            for tid, tr in self._tracks.items()
-            if (frame_idx - tr.last_seen_frame) > self._max_age_frames
-        ]
-        for tid in stale_ids:
-            self._tracks.pop(tid, None)
+    def update(self, *, detections: Detections | Sequence[BBox], frame_idx: int) -> list[Track]:
+        """Match `detections` to tracks for `frame_idx` and return the live tracks."""
+        detections = as_detections(detections)
+        self._drop_stale(frame_idx)
 
         unmatched_dets = set(range(len(detections)))
-        unmatched_tracks = set(self._tracks.keys())
-
-        # Greedy matching: for each track, find nearest detection.
-        matches: list[tuple[int, int, float]] = []  # (track_id, det_idx, dist)
-        for tid, tr in self._tracks.items():
-            best_det = None
-            best_dist = None
-            for di, det in enumerate(detections):
-                if di not in unmatched_dets:
-                    continue
-                dist = _euclidean((tr.cx, tr.cy), (det.cx, det.cy))
-                if best_dist is None or dist < best_dist:
-                    best_dist = dist
-                    best_det = di
-            if best_det is not None and best_dist is not None:
-                matches.append((tid, best_det, best_dist))
-
-        # Apply matches in order of increasing distance.
-        matches.sort(key=lambda t: t[2])
-        for tid, di, dist in matches:
-            if tid not in unmatched_tracks or di not in unmatched_dets:
-                continue
-            if dist > self._match_max_distance_px:
-                continue
-
-            self._tracks[tid].update(bbox=detections[di], frame_idx=frame_idx)
-            unmatched_tracks.remove(tid)
-            unmatched_dets.remove(di)
+
+        track_ids = list(self._tracks.keys())
+        if track_ids and len(detections):
+            track_xy = np.array([(self._tracks[tid].cx, self._tracks[tid].cy) for tid in track_ids])
+            dist = pairwise_distances(track_xy, detections.centers)
+
+            for ti, di in self._assign(dist, self._match_max_distance_px):
+                self._tracks[track_ids[ti]].update(bbox=detections[di], frame_idx=frame_idx)
+                unmatched_dets.remove(di)
 
         # Create new tracks for unmatched detections.
         for di in sorted(unmatched_dets):
-            det = detections[di]
-            tid = self._next_id
-            self._next_id += 1
-
-            tr = Track(track_id=tid, bbox=det, last_seen_frame=frame_idx)
-            tr.history.append((frame_idx, det.cx, det.cy))
-            self._tracks[tid] = tr
+            self._new_track(detections[di], frame_idx)
 
+        self._evict_excess()
         return list(self._tracks.values())
+
+    def configure(
+        self,
+        *,
+        max_age_frames: int | None = None,
+        match_max_distance_px: float | None = None,
+        assignment: str | None = None,
+        max_tracks: int | None = None,
+    ) -> None:
+        """Change matching parameters between frames; live tracks are kept."""
+        if assignment is not None:
+            self._assign = get_assignment_solver(assignment)
+        if max_age_frames is not None:
+            self._max_age_frames = int(max_age_frames)
+        if match_max_distance_px is not None:
+            self._match_max_distance_px = float(match_max_distance_px)
+        if max_tracks is not None:
+            self._max_tracks = max(1, int(max_tracks))
+
+    @property
+    def history_size(self) -> int:
+        """Capacity of each track's history ring buffer."""
+        return self._history_size
+
+    def state(self) -> TrackerState:
+        """Return the next track ID and the live tracks (shared, not copied)."""
+        return TrackerState(next_id=self._next_id, tracks=list(self._tracks.values()))
+
+    def restore_state(self, state: TrackerState) -> None:
+        """Adopt tracks from an earlier run, keeping new IDs above any ID it issued.
+
+        Must be called before the first `update`. Frame indices of the restored
+        tracks must already be in this run's numbering.
+        """
+        if self._tracks:
+            raise RuntimeError("restore_state must be called before tracking starts")
+        self._next_id = max(self._next_id, int(state.next_id))
+        for tr in state.tracks:
+            self._tracks[tr.track_id] = tr
+            self._next_id = max(self._next_id, tr.track_id + 1)
+
+    def pop_closed_tracks(self) -> list[Track]:
+        """Return tracks removed since the last call, in removal order.
+
+        Always empty unless the tracker was built with `report_closed=True`.
+        """
+        closed, self._closed = self._closed, []
+        return closed
+
+    def close_all(self) -> list[Track]:
+        """Remove every live track and return them after any closed tracks not yet popped."""
+        closed = self.pop_closed_tracks()
+        closed.extend(self._tracks.values())
+        self._tracks.clear()
+        return closed
+
+    def _drop_stale(self, frame_idx: int) -> list[Track]:
+        """Remove and return tracks not seen for more than `max_age_frames`."""
+        stale = [
+            tr
+            for tr in self._tracks.values()
+            if (frame_idx - tr.last_seen_frame) > self._max_age_frames
+        ]
+        for tr in stale:
+            self._tracks.pop(tr.track_id, None)
+        if self._report_closed:
+            self._closed.extend(stale)
+        return stale
+
+    def _new_track(self, det: BBox, frame_idx: int) -> Track:
+        """Start a new track from an unmatched detection."""
+        tid = self._next_id
+        self._next_id += 1
+
+        tr = Track(
+            track_id=tid,
+            bbox=det,
+            last_seen_frame=frame_idx,
+            history=TrackHistory(self._history_size),
+        )
+        tr.history.append((frame_idx, det.cx, det.cy))
+        self._tracks[tid] = tr
+        return tr
+
+    def _evict_excess(self) -> list[Track]:
+        """Remove and return the least recently seen tracks beyond `max_tracks`."""
+        excess = len(self._tracks) - self._max_tracks
+        if excess <= 0:
+            return []
+
+        evict = heapq.nsmallest(
+            excess,
+            self._tracks.values(),
+            key=lambda t: (t.last_seen_frame, t.track_id),
+        )
+        for tr in evict:
+            self._tracks.pop(tr.track_id, None)
+        if self._report_closed:
+            self._closed.extend(evict)
+        return evict
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import json
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+
+import numpy as np
+
+# Width of the internal speed bins used for quantiles; quantiles are exact to
+# within half a bin for speeds below `max_speed_mph`.
+_RESOLUTION_MPH = 0.25
+
+
+@dataclass(frozen=True)
+class TrafficRecord:
+    """Traffic statistics for one time bucket of one interval length.
+
+    Speeds are one per vehicle (its robust speed at track close). `complete`
+    is False for buckets the run did not cover entirely (the first and the
+    last). `histogram` counts vehicles in `histogram_bin_mph` bins from 0;
+    the last bin also holds every speed above its lower edge.
+    """
+    interval_s: float
+    start_iso: str
+    end_iso: str
+    complete: bool
+    count: int
+    over_limit: int
+    mean_mph: float | None
+    p50_mph: float | None
+    p85_mph: float | None
+    max_mph: float | None
+    histogram_bin_mph: float
+    histogram: tuple[int, ...]
+
+
+class _Bucket:
+    """Running statistics for the current bucket of one interval length."""
+
+    __slots__ = ("start_s", "end_s", "complete", "count", "over_limit", "sum", "max", "fine")
+
+    def __init__(self, start_s: float, end_s: float, complete: bool, n_fine: int) -> None:
+        """Start an empty bucket covering `[start_s, end_s)` with `n_fine` speed bins."""
+        self.start_s = start_s
+        self.end_s = end_s
+        self.complete = complete
+        self.count = 0
+        self.over_limit = 0
+        self.sum = 0.0
+        self.max = -math.inf
+        self.fine = np.zeros(n_fine, dtype=np.int64)
+
+
+class TrafficStats:
+    """Per-interval vehicle counts, mean, histogram and quantiles in bounded memory.
+
+    For each length in `intervals_s`, vehicles are grouped into buckets aligned
+    to multiples of that length (so 900 s buckets start at :00, :15, ... for
+    wall-clock times). Each bucket keeps a count, a sum, a maximum and a
+    fixed-resolution speed histogram; the reported histogram and the
+    p50/p85 quantiles are derived from it. Memory per interval is constant,
+    whatever the run length or traffic volume.
+
+    `observe` adds one vehicle; `advance` moves the clock and returns records
+    for buckets that have ended (including empty ones, so quiet periods are
+    reported as zero counts); `flush` returns the partial current buckets.
+    Times are seconds since the epoch and must not go backwards.
+    """
+
+    def __init__(
+        self,
+        *,
+        intervals_s: Sequence[float] = (60.0, 300.0, 900.0),
+        histogram_bin_mph: float = 5.0,
+        max_speed_mph: float = 100.0,
+    ) -> None:
+        """Configure bucket lengths and the histogram range."""
+        if not intervals_s or min(intervals_s) <= 0:
+            raise ValueError("intervals_s must be a non-empty list of positive lengths")
+        ratio = histogram_bin_mph / _RESOLUTION_MPH
+        if histogram_bin_mph <= 0 or abs(ratio - round(ratio)) > 1e-9:
+            raise ValueError(f"histogram_bin_mph must be a positive multiple of {_RESOLUTION_MPH}")
+        if max_speed_mph < histogram_bin_mph:
+            raise ValueError("max_speed_mph must be at least one histogram bin")
+
+        self._intervals = tuple(float(i) for i in intervals_s)
+        self._bin_mph = float(histogram_bin_mph)
+        self._fine_per_bin = int(round(ratio))
+        self._n_bins = int(math.ceil(max_speed_mph / histogram_bin_mph))
+        # The last fine bin is the overflow bin.
+        self._n_fine = self._n_bins * self._fine_per_bin
+        self._buckets: list[_Bucket | None] = [None] * len(self._intervals)
+        self._next_end_s = -math.inf
+
+    def observe(self, speed_mph: float, t_s: float, speed_limit_mph: float | None = None) -> list[TrafficRecord]:
+        """Count one vehicle at time `t_s`; returns records for buckets that ended first."""
+        records = self.advance(t_s)
+        speed_mph = float(speed_mph)
+        fine = min(self._n_fine - 1, max(0, int(speed_mph / _RESOLUTION_MPH)))
+        over = speed_limit_mph is not None and speed_mph > speed_limit_mph
+        for bucket in self._buckets:
+            bucket.count += 1
+            bucket.sum += speed_mph
+            bucket.max = max(bucket.max, speed_mph)
+            bucket.fine[fine] += 1
+            bucket.over_limit += over
+        return records
+
+    def advance(self, t_s: float) -> list[TrafficRecord]:
+        """Move the clock to `t_s`, returning records for buckets that ended."""
+        if t_s < self._next_end_s:
+            return []  # fast path: called every frame
+        records = []
+        for i, interval in enumerate(self._intervals):
+            bucket = self._buckets[i]
+            if bucket is None:
+                start = math.floor(t_s / interval) * interval
+                # A run that starts mid-bucket does not cover it completely.
+                self._buckets[i] = _Bucket(start, start + interval, start == t_s, self._n_fine)
+                continue
+            while t_s >= bucket.end_s:
+                records.append(self._record(interval, bucket))
+                bucket = _Bucket(bucket.end_s, bucket.end_s + interval, True, self._n_fine)
+            self._buckets[i] = bucket
+        self._next_end_s = min(b.end_s for b in self._buckets)
+        return records
+
+    def flush(self) -> list[TrafficRecord]:
+        """Return records for the current, partial buckets and reset them."""
+        records = []
+        for interval, bucket in zip(self._intervals, self._buckets):
+            if bucket is not None:
+                bucket.complete = False
+                records.append(self._record(interval, bucket))
+        self._buckets = [None] * len(self._intervals)
+        self._next_end_s = -math.inf
+        return records
+
+    def _record(self, interval: float, bucket: _Bucket) -> TrafficRecord:
+        """Build the record for `bucket`, deriving the quantiles and the coarse histogram."""
+        n = bucket.count
+        p50 = p85 = None
+        if n:
+            cum = np.cumsum(bucket.fine)
+            p50, p85 = (self._quantile(cum, q) for q in (0.50, 0.85))
+        return TrafficRecord(
+            interval_s=interval,
+            start_iso=_iso(bucket.start_s),
+            end_iso=_iso(bucket.end_s),
+            complete=bucket.complete,
+            count=n,
+            over_limit=bucket.over_limit,
+            mean_mph=bucket.sum / n if n else None,
+            p50_mph=p50,
+            p85_mph=p85,
+            max_mph=bucket.max if n else None,
+            histogram_bin_mph=self._bin_mph,
+            histogram=tuple(bucket.fine.reshape(self._n_bins, self._fine_per_bin).sum(axis=1).tolist()),
+        )
+
+    @staticmethod
+    def _quantile(cum: np.ndarray, q: float) -> float:
+        """Quantile from cumulative fine-bin counts, interpolating within the bin."""
+        target = q * cum[-1]
+        i = int(np.searchsorted(cum, target))
+        below = cum[i - 1] if i else 0
+        inside = cum[i] - below
+        frac = (target - below) / inside if inside else 0.5
+        return (i + frac) * _RESOLUTION_MPH
+
+
+def _iso(t_s: float) -> str:
+    """UTC ISO 8601 string for an epoch time in seconds."""
+    return dt.datetime.fromtimestamp(t_s, dt.timezone.utc).isoformat()
+
+
+class TrafficStatsLogger:
+    """Append `TrafficStats` records to a JSON-lines file as buckets end.
+
+    Use as a context manager; `__exit__` writes the partial final buckets.
+    """
+
+    def __init__(self, path: str | Path, stats: TrafficStats) -> None:
+        """Wrap `stats`, writing its records to `path` (appended)."""
+        self._path = Path(path)
+        self.stats = stats
+        self._file: TextIO | None = None
+
+    def __enter__(self) -> "TrafficStatsLogger":
+        """Open the output file for appending."""
+        self._file = self._path.open("a", encoding="utf-8")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Write the partial current buckets, then close the file."""
+        if self._file is None:
+            return
+        self._write(self.stats.flush())
+        self._file.close()
+        self._file = None
+
+    def observe(self, speed_mph: float, t_s: float, speed_limit_mph: float | None = None) -> None:
+        """Count one vehicle."""
+        self._write(self.stats.observe(speed_mph, t_s, speed_limit_mph))
+
+    def advance(self, t_s: float) -> None:
+        """Write records for buckets that ended before `t_s`."""
+        records = self.stats.advance(t_s)
+        if records:
+            self._write(records)
+
+    def _write(self, records: list[TrafficRecord]) -> None:
+        """Append one JSON line per record and flush."""
+        if not records:
+            return
+        self._file.writelines(json.dumps(dataclasses.asdict(r)) + "\n" for r in records)
+        self._file.flush()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BBox:
     x1: int
     y1: int
@@ -29,3 +32,64 @@ class BBox:
     @property
     def cy(self) -> float:
         return (self.y1 + self.y2) / 2.0
+
+
+class Detections:
+    """
+    Struct-of-arrays detections for one frame.
+
+    `boxes` is an (N, 4) int array of (x1, y1, x2, y2) in full-frame pixels and
+    `areas` the blob areas in full-frame square pixels. Consumers that work on
+    all detections at once (the trackers' distance matrices) read the arrays
+    directly; indexing or iterating yields `BBox` views, built on demand
+    (all at once, then cached).
+    """
+
+    __slots__ = ("boxes", "areas", "_bboxes")
+
+    def __init__(self, boxes: np.ndarray, areas: np.ndarray | None = None) -> None:
+        """Wrap `boxes`; `areas` default to the box areas."""
+        self.boxes = np.asarray(boxes, dtype=np.int64).reshape(-1, 4)
+        if areas is None:
+            areas = np.prod(self.boxes[:, 2:] - self.boxes[:, :2], axis=1)
+        self.areas = np.asarray(areas, dtype=np.float64)
+        if len(self.areas) != len(self.boxes):
+            raise ValueError("boxes and areas must have the same length")
+        self._bboxes: list[BBox] | None = None
+
+    @classmethod
+    def from_bboxes(cls, bboxes: Iterable[BBox]) -> Detections:
+        """Pack `BBox` objects (areas default to the box areas)."""
+        bboxes = list(bboxes)
+        packed = cls(np.array([(b.x1, b.y1, b.x2, b.y2) for b in bboxes], dtype=np.int64))
+        packed._bboxes = bboxes
+        return packed
+
+    @property
+    def centers(self) -> np.ndarray:
+        """(N, 2) float array of box centers, matching `BBox.cx` / `BBox.cy`."""
+        return (self.boxes[:, :2] + self.boxes[:, 2:]) / 2.0
+
+    def to_bboxes(self) -> list[BBox]:
+        """Return every detection as a `BBox`."""
+        if self._bboxes is None:
+            self._bboxes = [BBox(*row) for row in self.boxes.tolist()]
+        return list(self._bboxes)
+
+    def __len__(self) -> int:
+        """Number of detections."""
+        return len(self.boxes)
+
+    def __getitem__(self, index: int) -> BBox:
+        """Return detection `index` as a `BBox`."""
+        if self._bboxes is None:
+            self._bboxes = [BBox(*row) for row in self.boxes.tolist()]
+        return self._bboxes[index]
+
+    def __iter__(self) -> Iterator[BBox]:
+        """Iterate over the detections as `BBox` objects."""
+        return iter(self.to_bboxes())
+
+    def __repr__(self) -> str:
+        """Show the detections as a list of `BBox` objects."""
+        return f"Detections({self.to_bboxes()!r})"
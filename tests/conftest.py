@@ -1,6 +1,99 @@
+import csv
+import datetime as dt
 import sys
 from pathlib import Path
 
+import cv2
+import numpy as np
+
 # Ensure imports work with the common "src/" layout when running pytest from the repo root.
 SRC_DIR = Path(__file__).resolve().parents[1] / "src"
 sys.path.insert(0, str(SRC_DIR))
+
+from speed_monitor.logger import SpeedLogRow  # noqa: E402
+
+# Shared fakes and builders, imported by the test modules as `from conftest import ...`.
+
+
+class FakeCapture:
+    """Minimal stand-in for cv2.VideoCapture yielding N tiny frames; counts grab-only reads."""
+
+    def __init__(self, n_frames: int) -> None:
+        self._remaining = n_frames
+        self.grabs = 0
+        self.released = False
+
+    def _advance(self) -> bool:
+        if self._remaining <= 0:
+            return False
+        self._remaining -= 1
+        return True
+
+    def grab(self) -> bool:
+        ok = self._advance()
+        self.grabs += ok
+        return ok
+
+    def read(self):
+        if not self._advance():
+            return False, None
+        return True, np.zeros((2, 2, 3), dtype=np.uint8)
+
+    def release(self) -> None:
+        self.released = True
+
+
+def noisy_frame(seed, box=None, shape=(240, 320), noise=8):
+    """Textured background with sensor noise of +/- `noise` and an optional bright box (x1, y1, x2, y2)."""
+    base = np.random.default_rng(0).integers(40, 90, (*shape, 3), dtype=np.int16)
+    jitter = np.random.default_rng(seed).integers(-noise, noise + 1, base.shape, dtype=np.int16)
+    frame = (base + jitter).astype(np.uint8)
+    if box is not None:
+        x1, y1, x2, y2 = box
+        frame[y1:y2, x1:x2] = 230
+    return frame
+
+
+def write_traffic_clip(path, n_frames=360, spacing=60, hidden_frames=()):
+    """MJPG clip of 30x30 boxes crossing a textured 320x120 road at 4 px/frame, one every `spacing` frames.
+
+    Nothing is drawn in the (1-based) `hidden_frames`, as if the detector missed every vehicle.
+    """
+    rng = np.random.default_rng(0)
+    background = rng.integers(40, 90, (120, 320, 3), dtype=np.uint8)
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30.0, (320, 120))
+    for i in range(n_frames):
+        frame = background.copy()
+        if i + 1 in hidden_frames:
+            writer.write(frame)
+            continue
+        for k, t0 in enumerate(range(0, n_frames, spacing)):
+            x = -30 + 4 * (i - t0)
+            if -30 < x < 320:
+                frame[40:70, max(0, x) : max(0, x + 30)] = 200 + 10 * k
+        writer.write(frame)
+    writer.release()
+
+
+def read_csv_rows(path):
+    """Rows of a CSV file as dicts keyed by the header."""
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def speed_rows(n: int) -> list[SpeedLogRow]:
+    """`n` speed rows for two tracks, two rows per frame at 30 FPS."""
+    t0 = dt.datetime(2024, 5, 1, 12, 0, 0, tzinfo=dt.timezone.utc)
+    return [
+        SpeedLogRow(
+            timestamp_iso=(t0 + dt.timedelta(microseconds=33_333 * (i // 2))).isoformat(),
+            frame_idx=i // 2,
+            track_id=i % 2 + 1,
+            x1=i,
+            y1=2 * i,
+            x2=i + 40,
+            y2=2 * i + 30,
+            speed_mph=25.0 + i * 0.125,
+        )
+        for i in range(n)
+    ]
@@ -0,0 +1,168 @@
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import cv2
+import pytest
+
+from conftest import FakeCapture
+from speed_monitor.alerts import AlertDispatcher, JsonLinesAlertSink, StdoutAlertSink, WebhookAlertSink
+from speed_monitor.config import CalibrationConfig, MonitorConfig
+from speed_monitor.monitor import SpeedMonitor
+from speed_monitor.synthetic import SyntheticScene, SyntheticVehicle, write_scene_video
+from speed_monitor.tracker import Track
+from speed_monitor.types import BBox
+
+
+class _ListSink:
+    def __init__(self, delay_s=0.0):
+        self.alerts = []
+        self.closed = False
+        self._delay_s = delay_s
+
+    def send(self, alert):
+        time.sleep(self._delay_s)
+        self.alerts.append(alert)
+
+    def close(self):
+        self.closed = True
+
+
+def _track(track_id, frame_idx=1):
+    return Track(track_id=track_id, bbox=BBox(0, 0, 10, 10), last_seen_frame=frame_idx)
+
+
+def test_one_alert_per_track_once_stable_then_peak_at_close():
+    sink = _ListSink()
+    with AlertDispatcher([sink], min_samples=3) as alerts:
+        tr = _track(1)
+        for f, mph in enumerate([40, 41, 20, 42, 43, 44, 50, 45], start=1):
+            alerts.observe(tr, f, mph, 30.0, f"t{f}")
+        tr.last_seen_frame = 8
+        alerts.close(tr, 30.0, "t9")
+
+        quiet = _track(2)
+        for f in range(1, 10):
+            alerts.observe(quiet, f, 25.0, 30.0, "t")
+        alerts.close(quiet, 30.0, "t")
+    assert sink.closed
+
+    first, update = sink.alerts
+    # The dip below the limit at frame 3 restarted the count.
+    assert (first.event, first.frame_idx, first.speed_mph, first.speed_limit_mph) == ("speeding", 6, 44.0, 30.0)
+    assert (update.event, update.frame_idx, update.speed_mph) == ("closed", 8, 50.0)
+    assert alerts.stats.raised == 1 and alerts.stats.updated == 1 and alerts.stats.delivered == 2
+
+
+def test_rate_limit_suppresses_new_alerts():
+    sink = _ListSink()
+    with AlertDispatcher([sink], min_samples=1, max_per_minute=2) as alerts:
+        for tid in range(1, 5):
+            alerts.observe(_track(tid), 1, 60.0, 30.0, "t")
+            alerts.observe(_track(tid), 2, 70.0, 30.0, "t")
+            alerts.close(_track(tid), 30.0, "t")
+    assert [(a.track_id, a.event) for a in sink.alerts] == [(1, "speeding"), (1, "closed"), (2, "speeding"), (2, "closed")]
+    assert alerts.stats.suppressed == 2
+
+
+def test_slow_or_failing_sink_does_not_block_the_caller(capsys):
+    class Failing:
+        def send(self, alert):
+            raise OSError("disk full")
+
+        def close(self):
+            pass
+
+    slow = _ListSink(delay_s=0.2)
+    alerts = AlertDispatcher([Failing(), slow], min_samples=1, max_per_minute=1000, queue_size=2)
+    with alerts:
+        t0 = time.perf_counter()
+        for tid in range(10):
+            alerts.observe(_track(tid), 1, 60.0, 30.0, "t")
+        assert time.perf_counter() - t0 < 0.1
+    assert alerts.stats.raised == 10
+    assert len(slow.alerts) + alerts.stats.dropped == 10
+    assert alerts.stats.dropped >= 7
+    assert alerts.stats.sink_errors == len(slow.alerts)
+    assert "Alert sink Failing failed: disk full" in capsys.readouterr().err
+
+
+def test_stdout_jsonl_and_webhook_sinks(tmp_path):
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append((self.headers["Content-Type"], json.loads(body)))
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        out = io.StringIO()
+        sinks = [
+            StdoutAlertSink(out),
+            JsonLinesAlertSink(tmp_path / "alerts.jsonl"),
+            WebhookAlertSink(f"http://127.0.0.1:{server.server_port}/alerts"),
+        ]
+        with AlertDispatcher(sinks, min_samples=1) as alerts:
+            alerts.observe(_track(7), 12, 42.25, 30.0, "2024-01-01T00:00:00+00:00")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    expected = {
+        "timestamp_iso": "2024-01-01T00:00:00+00:00",
+        "frame_idx": 12,
+        "track_id": 7,
+        "speed_mph": 42.25,
+        "speed_limit_mph": 30.0,
+        "event": "speeding",
+    }
+    assert out.getvalue() == "ALERT track=7 speed=42.2mph limit=30.0mph frame=12\n"
+    assert [json.loads(line) for line in (tmp_path / "alerts.jsonl").read_text().splitlines()] == [expected]
+    assert received == [("application/json", expected)]
+    assert alerts.stats.delivered == 3
+
+
+def test_monitor_alerts_once_per_speeding_vehicle(tmp_path, capsys):
+    vehicles = (SyntheticVehicle(vehicle_id=1, entry_frame=5, x0=-60.0, y0=150.0, width=60, height=30, vx_px=8.0),)
+    scene = SyntheticScene(width=320, height=240, n_frames=60, vehicles=vehicles)
+    video = write_scene_video(scene, tmp_path / "road.avi")
+    # 8 px/frame at 0.05 ft/px and 30 FPS is about 8.2 mph.
+    config = MonitorConfig(
+        calibration=CalibrationConfig(fps=30.0, feet_per_pixel_near=0.05),
+        min_contour_area_px=300,
+        speed_limit_mph=5.0,
+        alert_min_samples=10,  # wait until the vehicle is fully in view
+        alert_jsonl_file=str(tmp_path / "alerts.jsonl"),
+    )
+    monitor = SpeedMonitor(config=config)
+    monitor.run(video_source=str(video), output_csv=str(tmp_path / "out.csv"))
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if line.startswith("ALERT ")]
+    assert len(lines) == 1
+    (record, *_) = [json.loads(line) for line in (tmp_path / "alerts.jsonl").read_text().splitlines()]
+    assert record["event"] == "speeding"
+    assert record["speed_mph"] == pytest.approx(8.2, abs=0.5)
+    assert monitor.alert_stats.raised == 1
+
+
+def test_monitor_releases_capture_when_alert_setup_fails(tmp_path, monkeypatch):
+    class OpenedCapture(FakeCapture):
+        def isOpened(self):
+            return True
+
+    cap = OpenedCapture(5)
+    monkeypatch.setattr(cv2, "VideoCapture", lambda source: cap)
+    config = MonitorConfig(alert_jsonl_file=str(tmp_path / "missing" / "alerts.jsonl"))
+    with pytest.raises(FileNotFoundError):
+        SpeedMonitor(config=config).run(video_source=0, output_csv=str(tmp_path / "out.csv"))
+    assert cap.released
@@ -0,0 +1,72 @@
+import itertools
+
+import numpy as np
+
+from speed_monitor.assignment import greedy_assignment, optimal_assignment, pairwise_distances
+from speed_monitor.tracker import CentroidTracker
+from speed_monitor.types import BBox
+
+
+def _reference_greedy(track_xy, det_xy, max_dist):
+    """Scalar nearest-first matching as originally implemented in CentroidTracker."""
+    matches = []
+    for ti, (tx, ty) in enumerate(track_xy):
+        best = None
+        for di, (dx, dy) in enumerate(det_xy):
+            d = ((tx - dx) ** 2 + (ty - dy) ** 2) ** 0.5
+            if best is None or d < best[1]:
+                best = (di, d)
+        if best is not None:
+            matches.append((ti, best[0], best[1]))
+    matches.sort(key=lambda m: m[2])
+
+    used_t, used_d, pairs = set(), set(), []
+    for ti, di, d in matches:
+        if ti in used_t or di in used_d or d > max_dist:
+            continue
+        used_t.add(ti)
+        used_d.add(di)
+        pairs.append((ti, di))
+    return sorted(pairs)
+
+
+def test_greedy_matches_reference_on_random_scenes():
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        n_t, n_d = rng.integers(0, 12, size=2)
+        # Integer coordinates create plenty of exact ties.
+        track_xy = rng.integers(0, 100, size=(n_t, 2)).astype(float)
+        det_xy = rng.integers(0, 100, size=(n_d, 2)).astype(float)
+
+        dist = pairwise_distances(track_xy, det_xy)
+        got = sorted(greedy_assignment(dist, 30.0))
+        assert got == _reference_greedy(track_xy.tolist(), det_xy.tolist(), 30.0)
+
+
+def test_optimal_matches_brute_force():
+    rng = np.random.default_rng(1)
+    for _ in range(100):
+        n_t, n_d = (int(n) for n in rng.integers(1, 6, size=2))
+        dist = rng.uniform(0.0, 50.0, size=(n_t, n_d))
+        pairs = optimal_assignment(dist, 40.0)
+
+        best = None
+        k = min(n_t, n_d)
+        for rows in itertools.permutations(range(n_t), k):
+            for cols in itertools.permutations(range(n_d), k):
+                valid = [(r, c) for r, c in zip(rows, cols) if dist[r, c] <= 40.0]
+                key = (-len(valid), sum(dist[r, c] for r, c in valid))
+                if best is None or key < best:
+                    best = key
+        got = (-len(pairs), sum(dist[r, c] for r, c in pairs))
+        assert got[0] == best[0]
+        assert abs(got[1] - best[1]) < 1e-9
+
+
+def test_optimal_resolves_conflict_that_greedy_loses():
+    tr = CentroidTracker(max_age_frames=5, match_max_distance_px=10.0, assignment="optimal")
+    tr.update(detections=[BBox(0, 0, 10, 10), BBox(12, 0, 22, 10)], frame_idx=1)
+
+    # Both tracks are nearest to the middle detection; only optimal keeps both IDs.
+    tracks = tr.update(detections=[BBox(6, 0, 16, 10), BBox(20, 0, 30, 10)], frame_idx=2)
+    assert sorted(t.track_id for t in tracks) == [1, 2]
@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from conftest import FakeCapture
+from speed_monitor.capture import DirectCapture, ThreadedCapture, resolve_overflow_policy
+
+
+def _drain(source) -> list[int]:
+    source.start()
+    idxs = []
+    while True:
+        item = source.read()
+        if item is None:
+            break
+        idxs.append(item.frame_idx)
+    source.release()
+    return idxs
+
+
+def test_direct_capture_respects_max_frames():
+    src = DirectCapture(FakeCapture(10), max_frames=3)
+    assert _drain(src) == [1, 2, 3]
+
+
+def test_threaded_capture_block_delivers_every_frame():
+    cap = FakeCapture(50)
+    src = ThreadedCapture(cap, queue_size=2, overflow="block")
+    assert _drain(src) == list(range(1, 51))
+    assert src.stats.frames_read == 50
+    assert src.stats.frames_dropped == 0
+    assert cap.released
+
+
+def test_threaded_capture_drop_oldest_keeps_true_indices():
+    cap = FakeCapture(20)
+    src = ThreadedCapture(cap, queue_size=2, overflow="drop_oldest")
+    src.start()
+    # Let the producer run ahead of the consumer so the queue overflows.
+    deadline = time.monotonic() + 5.0
+    while src.stats.frames_dropped < 18 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    idxs = []
+    while (item := src.read()) is not None:
+        idxs.append(item.frame_idx)
+    src.release()
+
+    assert idxs == [19, 20]
+    assert src.stats.frames_dropped == 18
+
+
+def test_resolve_overflow_policy():
+    assert resolve_overflow_policy("auto", 0) == "drop_oldest"
+    assert resolve_overflow_policy("auto", "rtsp://cam/stream") == "drop_oldest"
+    assert resolve_overflow_policy("auto", "clip.mp4") == "block"
+    with pytest.raises(ValueError):
+        resolve_overflow_policy("sometimes", "clip.mp4")
@@ -0,0 +1,157 @@
+import numpy as np
+import pytest
+
+from conftest import noisy_frame, read_csv_rows
+from speed_monitor.checkpoint import CHECKPOINT_ID_BLOCK, Checkpoint, load_checkpoint, save_checkpoint
+from speed_monitor.config import MonitorConfig
+from speed_monitor.detector import BackgroundSubtractorDetector, FrameDifferenceDetector
+from speed_monitor.kalman import KalmanTracker
+from speed_monitor.monitor import SpeedMonitor
+from speed_monitor.synthetic import SyntheticScene, SyntheticVehicle, write_scene_video
+from speed_monitor.tracker import CentroidTracker, TrackerState
+from speed_monitor.types import BBox
+
+
+def _moving_box(frame_idx):
+    x = 10 + 8 * frame_idx
+    return BBox(x, 100, x + 40, 130)
+
+
+def test_checkpoint_round_trip(tmp_path):
+    tracker = KalmanTracker(history_size=4)
+    for f in range(1, 6):
+        tracker.update(detections=[_moving_box(f)], frame_idx=f)
+    background = np.full((24, 32, 3), 77, dtype=np.uint8)
+    path = tmp_path / "state.npz"
+    save_checkpoint(path, Checkpoint(frame_idx=5, saved_at_s=100.0, detector="mog2",
+                                     background=background, tracker=tracker.state()))
+
+    loaded = load_checkpoint(path)
+    assert loaded.frame_idx == 5 and loaded.saved_at_s == 100.0 and loaded.detector == "mog2"
+    np.testing.assert_array_equal(loaded.background, background)
+    assert loaded.tracker.next_id == 2
+    (original,), (restored,) = tracker.state().tracks, loaded.tracker.tracks
+    assert restored.track_id == original.track_id
+    assert restored.bbox == original.bbox
+    assert restored.last_seen_frame == 5
+    assert restored.velocity == pytest.approx(original.velocity)
+    assert list(restored.history) == list(original.history)
+    assert not list(tmp_path.glob(".*tmp"))
+
+
+def test_load_checkpoint_missing_or_corrupt(tmp_path):
+    assert load_checkpoint(tmp_path / "missing.npz") is None
+    (tmp_path / "bad.npz").write_bytes(b"not a checkpoint")
+    with pytest.raises(ValueError, match="Could not read checkpoint"):
+        load_checkpoint(tmp_path / "bad.npz")
+
+
+def test_restart_shifts_frames_by_elapsed_time():
+    tracker = CentroidTracker(history_size=3)
+    for f in (98, 99, 100):
+        tracker.update(detections=[_moving_box(f)], frame_idx=f)
+    checkpoint = Checkpoint(frame_idx=100, saved_at_s=10.0, detector="mog2", background=None,
+                            tracker=tracker.state())
+
+    state = checkpoint.tracker_state_for_restart(fps=30.0, history_size=3, now_s=10.1)
+    (tr,) = state.tracks
+    assert tr.last_seen_frame == -3  # 100 -> 0, then 3 frames of downtime
+    assert [f for f, _, _ in tr.history] == [-5, -4, -3]
+
+    resumed = CentroidTracker(max_age_frames=10, history_size=3)
+    resumed.restore_state(state)
+    (cont,) = resumed.update(detections=[_moving_box(104)], frame_idx=1)
+    assert cont.track_id == 1
+    (new,) = resumed.update(detections=[BBox(200, 10, 240, 40)], frame_idx=2)[1:]
+    assert new.track_id == 2
+
+    stale = checkpoint.tracker_state_for_restart(fps=30.0, history_size=3, now_s=20.0)
+    resumed = CentroidTracker(max_age_frames=10, report_closed=True)
+    resumed.restore_state(stale)
+    (tr,) = resumed.update(detections=[_moving_box(400)], frame_idx=1)
+    assert tr.track_id == 2  # the old track aged out, but its ID is not reused
+    assert [t.track_id for t in resumed.pop_closed_tracks()] == [1]
+
+
+def test_restore_state_requires_fresh_tracker():
+    tracker = CentroidTracker()
+    tracker.update(detections=[_moving_box(1)], frame_idx=1)
+    with pytest.raises(RuntimeError):
+        tracker.restore_state(TrackerState(next_id=5, tracks=[]))
+
+
+def test_kalman_restore_continues_prediction():
+    tracker = KalmanTracker(match_max_distance_px=30.0)
+    for f in range(1, 11):
+        tracker.update(detections=[_moving_box(f)], frame_idx=f)
+    resumed = KalmanTracker(match_max_distance_px=30.0)
+    resumed.restore_state(tracker.state())
+    # 3 frames later the box is 24 px ahead: only the restored velocity gets it matched.
+    (tr,) = resumed.update(detections=[_moving_box(13)], frame_idx=13)
+    assert tr.track_id == 1
+    assert tr.velocity[0] == pytest.approx(8.0, abs=0.5)
+
+
+@pytest.mark.parametrize("detector_cls", [BackgroundSubtractorDetector, FrameDifferenceDetector])
+def test_seeded_detector_finds_vehicle_on_first_frame(detector_cls):
+    warm = detector_cls(min_contour_area_px=300)
+    for seed in range(60):
+        warm.detect(noisy_frame(seed, noise=4))
+
+    cold = detector_cls(min_contour_area_px=300)
+    restarted = detector_cls(min_contour_area_px=300)
+    restarted.seed_background(warm.background_state())
+    frame = noisy_frame(99, box=(100, 100, 160, 140), noise=4)
+
+    assert restarted.detect(frame).bboxes == [BBox(100, 100, 160, 140)]
+    assert cold.detect(frame).bboxes != [BBox(100, 100, 160, 140)]
+
+
+def test_seed_with_wrong_shape_is_ignored():
+    det = FrameDifferenceDetector(min_contour_area_px=300)
+    det.seed_background(np.zeros((10, 10), dtype=np.float32))
+    det.detect(noisy_frame(0, noise=4))
+    assert det.background_state().shape == (240, 320)
+
+
+def test_monitor_resumes_from_checkpoint(tmp_path):
+    vehicles = (SyntheticVehicle(vehicle_id=1, entry_frame=30, x0=-60.0, y0=150.0, width=60, height=30, vx_px=8.0),)
+    scene = SyntheticScene(width=320, height=240, n_frames=60, vehicles=vehicles)
+    video = write_scene_video(scene, tmp_path / "road.avi")
+    config = MonitorConfig(min_contour_area_px=300, checkpoint_file=str(tmp_path / "state.npz"))
+
+    first_run = SpeedMonitor(config=config)
+    first_run.run(video_source=str(video), output_csv=str(tmp_path / "a.csv"), max_frames=40)
+    first = load_checkpoint(tmp_path / "state.npz")
+    assert first.frame_idx == 40
+    # IDs are reserved past the saving run's, in case it crashes before the next save.
+    assert first.tracker.next_id == first_run.tracker.state().next_id + CHECKPOINT_ID_BLOCK
+    assert first.background is not None
+    assert len(first.tracker.tracks) == 1  # the vehicle, still in view
+
+    monitor = SpeedMonitor(config=config)
+    monitor.run(video_source=str(video), output_csv=str(tmp_path / "b.csv"), max_frames=5)
+    second = load_checkpoint(tmp_path / "state.npz")
+    assert second.frame_idx == 5
+    assert second.tracker.next_id >= first.tracker.next_id
+    assert monitor.tracker.state().next_id >= first.tracker.next_id
+
+
+def test_resumed_run_does_not_summarize_vehicles_twice(tmp_path):
+    def road(x0, entry_frame, name):
+        vehicle = SyntheticVehicle(vehicle_id=1, entry_frame=entry_frame, x0=x0, y0=150.0, width=60, height=30,
+                                   vx_px=8.0)
+        scene = SyntheticScene(width=320, height=240, n_frames=40, vehicles=(vehicle,))
+        return write_scene_video(scene, tmp_path / name)
+
+    config = MonitorConfig(min_contour_area_px=300, checkpoint_file=str(tmp_path / "state.npz"))
+    SpeedMonitor(config=config).run(video_source=str(road(-60.0, 30, "a.avi")), output_csv=str(tmp_path / "a.csv"))
+    checkpoint = load_checkpoint(tmp_path / "state.npz")
+    assert checkpoint.tracks_summarized
+    (vehicle,) = checkpoint.tracker.tracks
+    assert str(vehicle.track_id) in {r["track_id"] for r in read_csv_rows(tmp_path / "a.csv")}
+
+    # After a quick restart the camera still sees the vehicle, which keeps its track.
+    resumed = SpeedMonitor(config=config)
+    resumed.run(video_source=str(road(28.0, 0, "b.avi")), output_csv=str(tmp_path / "b.csv"), max_frames=10)
+    assert str(vehicle.track_id) not in {r["track_id"] for r in read_csv_rows(tmp_path / "b.csv")}
@@ -0,0 +1,56 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from conftest import speed_rows
+from speed_monitor.columnar import (
+    ColumnarSpeedLogger,
+    columnar_to_csv,
+    csv_to_columnar,
+    epoch_ns_to_iso,
+    iso_to_epoch_ns,
+    iter_columnar_chunks,
+    read_columnar,
+)
+from speed_monitor.config import MonitorConfig
+from speed_monitor.logger import CsvSpeedLogger
+from speed_monitor.monitor import make_logger
+
+
+def test_iso_epoch_ns_round_trip():
+    for iso in ["2024-05-01T12:00:00+00:00", "2024-05-01T12:00:00.033333+00:00"]:
+        assert epoch_ns_to_iso(iso_to_epoch_ns(iso)) == iso
+
+
+def test_columnar_logger_chunks_and_mmap_reader(tmp_path):
+    rows = speed_rows(25)
+    with ColumnarSpeedLogger(tmp_path / "log", chunk_rows=10) as logger:
+        for row in rows:
+            logger.log(row)
+
+    chunks = list(iter_columnar_chunks(tmp_path / "log"))
+    assert [len(c["frame_idx"]) for c in chunks] == [10, 10, 5]
+    assert isinstance(chunks[0]["speed_mph"], np.memmap)
+
+    cols = read_columnar(tmp_path / "log")
+    assert cols["track_id"].tolist() == [r.track_id for r in rows]
+    assert np.allclose(cols["speed_mph"], [r.speed_mph for r in rows])
+
+
+def test_csv_columnar_csv_round_trip(tmp_path):
+    with CsvSpeedLogger(tmp_path / "in.csv") as logger:
+        for row in speed_rows(37):
+            logger.log(row)
+
+    assert csv_to_columnar(tmp_path / "in.csv", tmp_path / "log", chunk_rows=8) == 37
+    assert columnar_to_csv(tmp_path / "log", tmp_path / "out.csv") == 37
+    assert (tmp_path / "in.csv").read_text() == (tmp_path / "out.csv").read_text()
+
+
+def test_make_logger_rejects_columnar_summaries(tmp_path):
+    config = MonitorConfig(log_format="columnar")
+    with pytest.raises(ValueError, match="requires log_mode 'frames'"):
+        make_logger(config, str(tmp_path / "log"))
+    frames = dataclasses.replace(config, log_mode="frames")
+    assert isinstance(make_logger(frames, str(tmp_path / "log")), ColumnarSpeedLogger)
@@ -0,0 +1,145 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from speed_monitor.detector import (
+    BackgroundSubtractorDetector,
+    FrameDifferenceDetector,
+    get_detector_class,
+)
+
+
+def _frame(boxes, shape=(120, 200)):
+    """Gray background with white filled rectangles (x1, y1, x2, y2)."""
+    frame = np.full((*shape, 3), 60, dtype=np.uint8)
+    for x1, y1, x2, y2 in boxes:
+        frame[y1:y2, x1:x2] = 255
+    return frame
+
+
+def _run(detector, boxes_last):
+    for _ in range(30):
+        detector.detect(_frame([]))
+    return detector.detect(_frame(boxes_last))
+
+
+def test_detect_full_frame():
+    det = BackgroundSubtractorDetector(min_contour_area_px=50)
+    result = _run(det, [(20, 20, 40, 40), (150, 80, 170, 100)])
+    assert len(result.bboxes) == 2
+    assert result.foreground_mask.shape == (120, 200)
+
+
+def test_detect_roi_rectangle_translates_boxes():
+    roi = ((100, 50), (199, 50), (199, 119), (100, 119))
+    det = BackgroundSubtractorDetector(min_contour_area_px=50, roi=roi)
+    result = _run(det, [(20, 20, 40, 40), (150, 80, 170, 100)])
+
+    # Only the box inside the ROI is found, in full-frame coordinates.
+    assert len(result.bboxes) == 1
+    b = result.bboxes[0]
+    assert abs(b.x1 - 150) <= 2 and abs(b.y1 - 80) <= 2
+    assert abs(b.x2 - 170) <= 2 and abs(b.y2 - 100) <= 2
+    assert result.foreground_mask.shape == (70, 100)
+    assert result.foreground_offset == (100, 50)
+
+
+def test_detect_roi_polygon_masks_outside():
+    # Triangle covering the lower-left half of the frame's right side.
+    roi = ((100, 0), (100, 119), (199, 119))
+    det = BackgroundSubtractorDetector(min_contour_area_px=50, roi=roi)
+    result = _run(det, [(170, 5, 190, 25), (110, 90, 130, 110)])
+
+    assert len(result.bboxes) == 1
+    assert result.bboxes[0].x1 >= 100 and result.bboxes[0].y1 >= 80
+
+
+def test_detect_scaled_reports_native_coordinates():
+    det = BackgroundSubtractorDetector(min_contour_area_px=200, scale=0.5)
+    result = _run(det, [(40, 20, 80, 60), (150, 80, 156, 86)])
+
+    # The 6x6 blob falls under the (scaled) area threshold.
+    assert len(result.bboxes) == 1
+    b = result.bboxes[0]
+    assert abs(b.x1 - 40) <= 2 and abs(b.y1 - 20) <= 2
+    assert abs(b.x2 - 80) <= 2 and abs(b.y2 - 60) <= 2
+    assert result.foreground_mask.shape == (60, 100)
+    assert result.foreground_scale == 0.5
+
+
+def test_frame_difference_detector_matches_mog2_boxes():
+    boxes = [(20, 20, 40, 40), (150, 80, 170, 100)]
+    roi = ((100, 0), (100, 119), (199, 119))
+    for kwargs in ({}, {"scale": 0.5}, {"roi": roi}):
+        mog2 = _run(BackgroundSubtractorDetector(min_contour_area_px=50, **kwargs), boxes)
+        diff = _run(FrameDifferenceDetector(min_contour_area_px=50, **kwargs), boxes)
+        assert diff.bboxes == mog2.bboxes
+        assert diff.foreground_mask.shape == mog2.foreground_mask.shape
+
+
+def test_frame_difference_background_absorbs_stopped_objects():
+    det = FrameDifferenceDetector(min_contour_area_px=50, alpha=0.2)
+    assert det.detect(_frame([(20, 20, 40, 40)])).bboxes == []  # first frame seeds the background
+    assert len(det.detect(_frame([(60, 20, 80, 40)])).bboxes) == 2  # new position + ghost
+    # Foreground pixels are learned at a tenth of `alpha`.
+    for _ in range(150):
+        result = det.detect(_frame([(60, 20, 80, 40)]))
+    assert result.bboxes == []
+
+
+def test_get_detector_class():
+    assert get_detector_class("mog2") is BackgroundSubtractorDetector
+    assert get_detector_class("frame_diff") is FrameDifferenceDetector
+    with pytest.raises(ValueError):
+        get_detector_class("yolo")
+
+
+@pytest.mark.parametrize("cls", [BackgroundSubtractorDetector, FrameDifferenceDetector])
+@pytest.mark.parametrize("scale", [1.0, 0.5])
+def test_detect_reuses_work_buffers(cls, scale):
+    det = cls(min_contour_area_px=50, scale=scale)
+    frames = [_frame([(10 + 4 * i, 100, 40 + 4 * i, 130)], shape=(480, 640)) for i in range(8)]
+    for frame in frames[:4]:
+        det.detect(frame)
+
+    tracemalloc.start()
+    try:
+        for frame in frames[4:]:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            result = det.detect(frame)
+            transient = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+    # A single 640x480 mask is 300 KiB; only contours and boxes may be allocated.
+    assert transient < 32 * 1024
+    del result
+
+
+def test_foreground_mask_is_copied_on_demand():
+    det = BackgroundSubtractorDetector(min_contour_area_px=50)
+    first = det.detect(_frame([]))
+    kept = det.detect(_frame([(20, 20, 40, 40)]))
+    mask = kept.foreground_mask
+    det.detect(_frame([]))
+
+    # The mask read before the next frame is a private copy.
+    assert mask[30, 30] == 255 and kept.foreground_mask is mask
+    with pytest.raises(RuntimeError):
+        first.foreground_mask
+
+
+@pytest.mark.parametrize("scale", [1.0, 0.5])
+def test_detections_arrays_match_bboxes(scale):
+    roi = ((100, 50), (199, 50), (199, 119), (100, 119))
+    det = BackgroundSubtractorDetector(min_contour_area_px=50, roi=roi, scale=scale)
+    result = _run(det, [(20, 20, 40, 40), (130, 60, 150, 80), (160, 90, 190, 110)])
+
+    dets = result.detections
+    assert len(dets) == 2
+    assert dets.boxes.tolist() == [[b.x1, b.y1, b.x2, b.y2] for b in result.bboxes]
+    assert dets.centers.tolist() == [[b.cx, b.cy] for b in result.bboxes]
+    # Areas are reported in full-frame pixels whatever the detection scale.
+    assert sorted(dets.areas.tolist()) == pytest.approx([400.0, 600.0], rel=0.25)
@@ -0,0 +1,113 @@
+import time
+
+import numpy as np
+import pytest
+
+from speed_monitor.config import MonitorConfig
+from speed_monitor.display import DisplayRenderer, DisplaySnapshot
+from speed_monitor.monitor import SpeedMonitor
+from speed_monitor.synthetic import make_scene, write_scene_video
+from speed_monitor.tracker import Track
+from speed_monitor.types import BBox
+
+
+class FakeSink:
+    """Records shown images and replays scripted key presses."""
+
+    def __init__(self, keys=()) -> None:
+        self.images = []
+        self.polls = 0
+        self._keys = list(keys)
+
+    def __call__(self, image):
+        self.polls += 1
+        if image is not None:
+            self.images.append(image)
+        return self._keys.pop(0) if self._keys else 255
+
+
+def _wait_for(predicate, timeout_s=5.0):
+    deadline = time.monotonic() + timeout_s
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_render_places_scaled_mask_beside_overlay():
+    renderer = DisplayRenderer(scale=0.5, sink=FakeSink())
+    mask = np.zeros((50, 100), dtype=np.uint8)  # ROI crop at detection scale 0.5
+    mask[10:20, 10:20] = 255
+    snapshot = DisplaySnapshot(
+        frame_idx=1,
+        frame=np.zeros((200, 400, 3), dtype=np.uint8),
+        tracks=((1, BBox(40, 40, 80, 80), 31.5),),
+        mask=mask,
+        mask_offset=(100, 60),
+        mask_scale=0.5,
+    )
+
+    out = renderer.render(snapshot)
+
+    assert out.shape == (100, 400, 3)
+    # Mask pixel (10, 10) is frame pixel (120, 80), i.e. display (60, 40) in the right half.
+    assert out[45, 200 + 65].tolist() == [255, 255, 255]
+    assert out[35, 200 + 65].tolist() == [0, 0, 0]
+    # The box is drawn on the downscaled overlay.
+    assert out[20, 30].tolist() == [0, 255, 0]
+
+
+def test_submit_rate_limits_before_copying():
+    renderer = DisplayRenderer(max_fps=10.0, sink=FakeSink())
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    accepted = [renderer.submit(i, frame, [], [], now_s=0.03 * i) for i in range(10)]
+
+    # 0.0, 0.12, 0.24 — not 0.0, 0.1, 0.2: only accepted snapshots reset the interval.
+    assert accepted.count(True) == 3
+    assert renderer.stats.snapshots_rate_limited == 7
+    # Nothing consumed them, so each accepted snapshot replaced the previous one.
+    assert renderer.stats.snapshots_dropped == 2
+
+
+def test_render_thread_shows_latest_snapshot_and_reports_quit():
+    sink = FakeSink(keys=[255, ord("q")])
+    renderer = DisplayRenderer(max_fps=1000.0, sink=sink)
+    renderer.start()
+    try:
+        track = Track(track_id=7, bbox=BBox(1, 1, 5, 5), last_seen_frame=1)
+        frame = np.zeros((20, 20, 3), dtype=np.uint8)
+        renderer.submit(1, frame, [track], [12.0], now_s=0.0)
+        assert _wait_for(lambda: renderer.stats.snapshots_rendered == 1)
+        renderer.submit(2, frame, [track], [12.0], now_s=1.0)
+        assert _wait_for(lambda: renderer.quit_requested)
+    finally:
+        renderer.close()
+    assert len(sink.images) == 2
+    # The caller's frame is never drawn on.
+    assert not frame.any()
+
+
+def test_run_with_display_reuses_pipeline_speeds(tmp_path, monkeypatch):
+    scene = make_scene(width=320, height=120, n_frames=90, n_vehicles=2, seed=3)
+    video = write_scene_video(scene, tmp_path / "clip.avi")
+    config = MonitorConfig(min_contour_area_px=300, display_max_fps=1000.0)
+    sink = FakeSink()
+    snapshots = []
+
+    monitor = SpeedMonitor(config=config)
+    renderer = DisplayRenderer(max_fps=config.display_max_fps, sink=sink)
+    original_render = renderer.render
+    monkeypatch.setattr(renderer, "render", lambda snap: snapshots.append(snap) or original_render(snap))
+    monkeypatch.setattr(monitor, "_make_renderer", lambda: renderer)
+    monitor.run(video_source=str(video), output_csv=str(tmp_path / "out.csv"), display=True)
+
+    assert monitor.display_stats is renderer.stats
+    assert renderer.stats.snapshots_rendered == len(sink.images) > 0
+    assert any(speed is not None for snap in snapshots for _, _, speed in snap.tracks)
+
+
+def test_invalid_display_settings_are_rejected():
+    with pytest.raises(ValueError):
+        DisplayRenderer(max_fps=0)
+    with pytest.raises(ValueError):
+        DisplayRenderer(scale=1.5)
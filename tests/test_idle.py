@@ -0,0 +1,100 @@
+import csv
+import io
+
+import pytest
+
+from conftest import noisy_frame
+from speed_monitor.capture import CaptureStats
+from speed_monitor.config import MonitorConfig
+from speed_monitor.idle import GateStats, MotionGate
+from speed_monitor.metrics import PipelineMetrics
+from speed_monitor.monitor import SpeedMonitor
+from speed_monitor.synthetic import SyntheticScene, SyntheticVehicle, write_scene_video
+
+
+def _idle_gate(**kwargs):
+    gate = MotionGate(idle_after_frames=3, **kwargs)
+    for _ in range(3):
+        assert gate.should_detect(noisy_frame(0))
+        gate.observe(0, 0)
+    assert gate.idle
+    return gate
+
+
+def test_gate_goes_idle_only_after_quiet_frames():
+    gate = MotionGate(idle_after_frames=3)
+    gate.observe(0, 0)
+    gate.observe(0, 0)
+    gate.observe(1, 1)  # a detection restarts the count
+    gate.observe(0, 0)
+    gate.observe(0, 1)  # so does a coasting track
+    gate.observe(0, 0)
+    gate.observe(0, 0)
+    assert not gate.idle
+    gate.observe(0, 0)
+    assert gate.idle and gate.mode == "idle"
+
+
+def test_idle_gate_ignores_noise_and_wakes_on_motion():
+    gate = _idle_gate(refresh_interval=0)
+
+    assert [gate.should_detect(noisy_frame(seed)) for seed in range(1, 40)] == [False] * 39
+    # A vehicle-sized object entering the frame wakes the gate on that frame.
+    assert gate.should_detect(noisy_frame(40, box=(0, 100, 40, 130)))
+    assert not gate.idle
+    assert gate.stats.wakeups == 1
+    assert gate.stats.frames_idle == 39
+
+
+def test_idle_gate_refreshes_background_and_wakes_on_refresh_detections():
+    gate = _idle_gate(refresh_interval=5)
+    decisions = [gate.should_detect(noisy_frame(seed)) for seed in range(1, 11)]
+    assert decisions == [False] * 4 + [True] + [False] * 4 + [True]
+    assert gate.stats.frames_refresh == 2
+
+    gate.observe(0, 0)  # nothing found: stay idle
+    assert gate.idle
+    gate.observe(1, 1)
+    assert not gate.idle and gate.stats.wakeups == 1
+
+
+def test_gate_stats_fractions_and_prometheus():
+    stats = GateStats(frames_active=25, frames_idle=70, frames_refresh=5, wakeups=2)
+    assert stats.fractions() == pytest.approx({"active": 0.25, "idle": 0.70, "refresh": 0.05})
+    assert "active=25.0% idle=70.0% refresh=5.0% wakeups=2" in stats.summary_line()
+    assert GateStats().fractions() == {"active": 0.0, "idle": 0.0, "refresh": 0.0}
+
+    metrics = PipelineMetrics(stream=io.StringIO())
+    metrics.gate_stats = stats
+    text = metrics.render_prometheus(CaptureStats())
+    assert 'speed_monitor_frames_by_mode_total{mode="idle"} 70' in text
+    assert "speed_monitor_idle_wakeups_total 2" in text
+    assert "mode active=25.0% idle=70.0% refresh=5.0%" in metrics.summary_line(CaptureStats())
+
+
+def test_idle_gate_skips_quiet_frames_without_losing_vehicles(tmp_path, capsys):
+    vehicles = tuple(
+        SyntheticVehicle(vehicle_id=i + 1, entry_frame=20 + 150 * i, x0=-60.0, y0=150.0,
+                         width=60, height=30, vx_px=8.0)
+        for i in range(2)
+    )
+    scene = SyntheticScene(width=320, height=240, n_frames=260, vehicles=vehicles)
+    video = write_scene_video(scene, tmp_path / "quiet.avi")
+
+    def run(idle_gate):
+        config = MonitorConfig(min_contour_area_px=300, idle_gate=idle_gate, idle_after_frames=30)
+        monitor = SpeedMonitor(config=config)
+        monitor.run(video_source=str(video), output_csv=str(tmp_path / f"{idle_gate}.csv"))
+        with open(tmp_path / f"{idle_gate}.csv", newline="") as f:
+            return monitor, list(csv.DictReader(f))
+
+    _, baseline = run(False)
+    monitor, gated = run(True)
+
+    assert len(gated) == len(baseline) == 2
+    for a, b in zip(gated, baseline):
+        assert float(a["median_speed_mph"]) == pytest.approx(float(b["median_speed_mph"]), rel=0.02)
+    stats = monitor.gate_stats
+    assert stats.wakeups == 1
+    assert stats.fractions()["idle"] > 0.2
+    assert "idle_gate frames=260" in capsys.readouterr().err
@@ -0,0 +1,49 @@
+from speed_monitor.kalman import KalmanTracker
+from speed_monitor.tracker import CentroidTracker
+from speed_monitor.types import BBox
+
+
+def _box(cx: float, cy: float) -> BBox:
+    return BBox(int(cx) - 10, int(cy) - 10, int(cx) + 10, int(cy) + 10)
+
+
+def test_kalman_velocity_converges_for_constant_motion():
+    tr = KalmanTracker(max_age_frames=5, match_max_distance_px=30.0)
+    for f in range(1, 21):
+        tracks = tr.update(detections=[_box(100 + 12 * f, 200)], frame_idx=f)
+
+    assert len(tracks) == 1
+    vx, vy = tracks[0].velocity
+    assert abs(vx - 12.0) < 0.5
+    assert abs(vy) < 0.5
+
+
+def test_kalman_keeps_id_across_missed_detections_where_centroid_does_not():
+    kalman = KalmanTracker(max_age_frames=5, match_max_distance_px=30.0)
+    centroid = CentroidTracker(max_age_frames=5, match_max_distance_px=30.0)
+
+    for f in range(1, 11):
+        kalman.update(detections=[_box(100 + 20 * f, 200)], frame_idx=f)
+        centroid.update(detections=[_box(100 + 20 * f, 200)], frame_idx=f)
+
+    # Three frames without a detection: the car moves 80 px, beyond the gate
+    # for a stationary centroid but close to the Kalman prediction.
+    for f in range(11, 14):
+        kalman.update(detections=[], frame_idx=f)
+        centroid.update(detections=[], frame_idx=f)
+
+    k_tracks = kalman.update(detections=[_box(100 + 20 * 14, 200)], frame_idx=14)
+    c_tracks = centroid.update(detections=[_box(100 + 20 * 14, 200)], frame_idx=14)
+
+    assert [t.track_id for t in k_tracks] == [1]
+    assert sorted(t.track_id for t in c_tracks) == [1, 2]
+
+
+def test_kalman_drops_stale_state_rows():
+    tr = KalmanTracker(max_age_frames=2, match_max_distance_px=30.0)
+    tr.update(detections=[_box(100, 100), _box(300, 100)], frame_idx=1)
+    for f in range(2, 6):
+        tracks = tr.update(detections=[_box(100, 100)], frame_idx=f)
+
+    assert [t.track_id for t in tracks] == [1]
+    assert tr._ids.tolist() == [1]
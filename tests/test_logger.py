@@ -0,0 +1,33 @@
+import csv
+import time
+
+from conftest import speed_rows
+from speed_monitor.logger import CsvSpeedLogger, ThreadedCsvSpeedLogger
+
+
+def test_threaded_logger_matches_sync_output(tmp_path):
+    rows = speed_rows(1000)
+    with CsvSpeedLogger(tmp_path / "sync.csv") as logger:
+        for row in rows:
+            logger.log(row)
+    with ThreadedCsvSpeedLogger(tmp_path / "async.csv", flush_rows=64) as logger:
+        for row in rows:
+            logger.log(row)
+
+    assert (tmp_path / "sync.csv").read_text() == (tmp_path / "async.csv").read_text()
+    assert logger.stats.rows_written == 1000
+    assert logger.stats.batches_written >= 1000 // 64
+    assert logger.queue_depth == 0
+
+
+def test_threaded_logger_flushes_on_interval(tmp_path):
+    path = tmp_path / "out.csv"
+    with ThreadedCsvSpeedLogger(path, flush_rows=10_000, flush_interval_s=0.01) as logger:
+        logger.log(speed_rows(1)[0])
+        for _ in range(500):
+            if logger.stats.rows_written:
+                break
+            time.sleep(0.01)
+        # Row is on disk before the logger is closed.
+        with path.open(newline="") as f:
+            assert len(list(csv.reader(f))) == 2
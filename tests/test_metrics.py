@@ -0,0 +1,84 @@
+import dataclasses
+import io
+
+import cv2
+import numpy as np
+import pytest
+
+from speed_monitor.capture import CaptureStats
+from speed_monitor.config import MonitorConfig
+from speed_monitor.metrics import LatencyHistogram, PipelineMetrics
+from speed_monitor.monitor import SpeedMonitor
+
+
+def _record(metrics, latency_s):
+    metrics.record_frame(
+        decode_s=0.002,
+        detect_s=0.010,
+        track_s=0.001,
+        speed_s=0.0001,
+        log_s=0.0005,
+        latency_s=latency_s,
+        active_tracks=3,
+    )
+
+
+def test_latency_histogram_buckets_and_quantiles():
+    hist = LatencyHistogram(buckets_s=(0.01, 0.1, 1.0))
+    for s in (0.005, 0.005, 0.05, 0.5):
+        hist.observe(s)
+    assert hist.counts == [2, 1, 1, 0]
+    assert hist.count == 4 and hist.max_s == 0.5
+    assert hist.mean_s == pytest.approx(0.14)
+    assert 0.0 < hist.quantile(0.5) <= 0.01
+    assert hist.quantile(1.0) == pytest.approx(0.5)
+    assert LatencyHistogram().quantile(0.5) == 0.0
+
+
+def test_prometheus_text_and_budget_counter(tmp_path):
+    stream = io.StringIO()
+    path = tmp_path / "speed_monitor.prom"
+    metrics = PipelineMetrics(interval_s=60.0, budget_s=0.1, prometheus_path=path, stream=stream)
+    for latency in (0.02, 0.03, 0.2):
+        _record(metrics, latency)
+
+    assert not metrics.maybe_report(CaptureStats(frames_read=5, frames_dropped=2))
+    metrics.report(CaptureStats(frames_read=5, frames_dropped=2))
+
+    text = path.read_text()
+    assert 'speed_monitor_stage_latency_seconds_bucket{stage="detect",le="0.01"} 3' in text
+    assert 'speed_monitor_frame_latency_seconds_bucket{le="0.1"} 2' in text
+    assert 'speed_monitor_frame_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "speed_monitor_frame_latency_seconds_count 3" in text
+    assert "speed_monitor_frames_over_budget_total 1" in text
+    assert "speed_monitor_frames_dropped_total 2" in text
+    assert "speed_monitor_active_tracks 3" in text
+
+    line = stream.getvalue()
+    assert line.startswith("metrics frames=3 ") and "over_budget=1" in line and "dropped=2" in line
+
+
+def test_monitor_run_records_every_processed_frame(tmp_path):
+    clip = tmp_path / "clip.avi"
+    writer = cv2.VideoWriter(str(clip), cv2.VideoWriter_fourcc(*"MJPG"), 30.0, (160, 120))
+    for i in range(30):
+        frame = np.full((120, 160, 3), 60, dtype=np.uint8)
+        frame[40:70, 5 + 3 * i : 35 + 3 * i] = 255
+        writer.write(frame)
+    writer.release()
+
+    config = dataclasses.replace(
+        MonitorConfig(), min_contour_area_px=100, metrics_file=str(tmp_path / "m.prom"), log_async=True
+    )
+    monitor = SpeedMonitor(config=config)
+    monitor.run(video_source=str(clip), output_csv=str(tmp_path / "out.csv"))
+
+    assert monitor.metrics.frames_processed == 30
+    assert monitor.metrics.stages["detect"].count == 30
+    text = (tmp_path / "m.prom").read_text()
+    assert "speed_monitor_frames_processed_total 30" in text
+    # The summary-mode rows went through the background writer, and its stats are exported.
+    assert monitor.logger_stats.rows_written == 1
+    assert "speed_monitor_log_queue_depth 0" in text
+    assert "speed_monitor_log_rows_written_total 1" in text
+    assert SpeedMonitor(config=MonitorConfig()).metrics is None
@@ -0,0 +1,127 @@
+import dataclasses
+import functools
+import json
+import queue
+import threading
+import types
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from conftest import read_csv_rows, write_traffic_clip
+from speed_monitor.config import CameraConfig, MonitorConfig, load_config
+from speed_monitor.multicam import MultiCameraRunner
+
+
+def test_load_config_cameras(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(
+        json.dumps(
+            {
+                "cameras": [
+                    {"id": "north", "source": 0, "calibration": {"feet_per_pixel_near": 0.1}},
+                    {"source": "rtsp://cam/south", "roi": [0, 0, 100, 100]},
+                ]
+            }
+        )
+    )
+    cams = load_config(path).cameras
+    assert [c.camera_id for c in cams] == ["north", "cam1"]
+    assert cams[0].source == 0 and cams[0].calibration.feet_per_pixel_near == 0.1
+    assert cams[1].calibration is None and cams[1].roi is not None
+
+
+def test_runner_aggregates_cameras_and_restarts_crashed_live_workers(tmp_path):
+    clip = tmp_path / "clip.avi"
+    write_traffic_clip(clip, n_frames=60)
+    config = dataclasses.replace(
+        MonitorConfig(),
+        min_contour_area_px=100,
+        log_mode="frames",
+        max_worker_restarts=1,
+    )
+    cameras = [
+        CameraConfig(camera_id="a", source=str(clip)),
+        CameraConfig(camera_id="b", source=str(clip)),
+        CameraConfig(camera_id="broken", source=str(tmp_path / "missing.avi")),
+        CameraConfig(camera_id="offline", source="http://127.0.0.1:1/cam.mjpg"),
+    ]
+    runner = MultiCameraRunner(config=config, cameras=cameras, restart_backoff_s=0.01)
+    runner.run(output_csv=str(tmp_path / "out.csv"))
+
+    rows = read_csv_rows(tmp_path / "out.csv")
+    per_camera = {cam: [r for r in rows if r["camera_id"] == cam] for cam in ("a", "b")}
+    assert per_camera["a"]
+    assert len(per_camera["a"]) == len(per_camera["b"])
+
+    status = {w.camera.camera_id: w for w in runner.workers}
+    assert not status["a"].failed and status["a"].restarts == 0
+    # Restarting a file would log its rows again from the first frame.
+    assert status["broken"].failed and status["broken"].restarts == 0
+    assert status["offline"].failed and status["offline"].restarts == 1
+
+
+def test_runner_writes_async_and_rejects_columnar(tmp_path):
+    clip = tmp_path / "clip.avi"
+    write_traffic_clip(clip, n_frames=60)
+    cameras = [CameraConfig(camera_id="a", source=str(clip)), CameraConfig(camera_id="b", source=str(clip))]
+    config = dataclasses.replace(MonitorConfig(), min_contour_area_px=100, log_mode="frames", log_async=True)
+    MultiCameraRunner(config=config, cameras=cameras).run(output_csv=str(tmp_path / "out.csv"))
+
+    rows = read_csv_rows(tmp_path / "out.csv")
+    assert rows and {r["camera_id"] for r in rows} == {"a", "b"}
+
+    with pytest.raises(ValueError, match="columnar"):
+        MultiCameraRunner(config=dataclasses.replace(config, log_format="columnar"), cameras=cameras)
+    # A --video camera auto-named cam1 next to a config camera with the same ID.
+    duplicates = [CameraConfig(camera_id="cam1", source=str(clip)), CameraConfig(camera_id="cam1", source=0)]
+    with pytest.raises(ValueError, match="unique"):
+        MultiCameraRunner(config=config, cameras=duplicates)
+
+
+def test_live_worker_is_restarted_after_its_stream_ends(tmp_path):
+    write_traffic_clip(tmp_path / "clip.avi", n_frames=60)
+
+    class Handler(SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(Handler, directory=str(tmp_path)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        cameras = [
+            CameraConfig(camera_id="file", source=str(tmp_path / "clip.avi")),
+            CameraConfig(camera_id="stream", source=f"http://127.0.0.1:{server.server_port}/clip.avi"),
+        ]
+        config = dataclasses.replace(MonitorConfig(), min_contour_area_px=100, log_mode="frames", max_worker_restarts=1)
+        runner = MultiCameraRunner(config=config, cameras=cameras, restart_backoff_s=0.01)
+        runner.run(output_csv=str(tmp_path / "out.csv"))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    status = {w.camera.camera_id: w for w in runner.workers}
+    assert not status["file"].failed and status["file"].restarts == 0
+    # The HTTP "stream" ends cleanly, like a camera dropping off the network.
+    assert status["stream"].restarts == 1
+    rows = read_csv_rows(tmp_path / "out.csv")
+    n_file = sum(r["camera_id"] == "file" for r in rows)
+    assert n_file and sum(r["camera_id"] == "stream" for r in rows) == 2 * n_file
+    # The restarted worker numbers its tracks after the first run's.
+    file_ids = {r["track_id"] for r in rows if r["camera_id"] == "file"}
+    stream_ids = {r["track_id"] for r in rows if r["camera_id"] == "stream"}
+    assert len(stream_ids) == 2 * len(file_ids)
+
+
+def test_drain_is_bounded_so_supervision_keeps_running():
+    q = queue.Queue()
+    for i in range(5):
+        q.put(("a", i))
+
+    rows = []
+    logger = types.SimpleNamespace(log=rows.append)
+    MultiCameraRunner._drain(q, logger, timeout_s=0.0, max_rows=2)
+    assert len(rows) == 2
+    MultiCameraRunner._drain(q, logger, timeout_s=0.0)
+    assert len(rows) == 5
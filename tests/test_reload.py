@@ -0,0 +1,108 @@
+import dataclasses
+import json
+
+import numpy as np
+import pytest
+
+from speed_monitor.config import CalibrationConfig, MonitorConfig
+from speed_monitor.monitor import SpeedMonitor
+from speed_monitor.reload import ConfigWatcher, changed_fields
+from speed_monitor.synthetic import SyntheticScene, SyntheticVehicle, write_scene_video
+from speed_monitor.types import BBox
+
+
+def _write(path, **payload):
+    path.write_text(json.dumps(payload))
+
+
+def test_changed_fields_lists_top_level_differences():
+    old = MonitorConfig()
+    new = dataclasses.replace(old, speed_limit_mph=30.0, calibration=CalibrationConfig(fps=25.0))
+    assert changed_fields(old, new) == ["calibration", "speed_limit_mph"]
+    assert changed_fields(old, old) == []
+
+
+def test_watcher_reports_fields_changed_in_the_file(tmp_path, capsys):
+    path = tmp_path / "config.json"
+    _write(path, min_contour_area_px=800, speed_limit_mph=25)
+    watcher = ConfigWatcher(path, poll_interval_s=1.0)
+    assert watcher.poll(now_s=1e9) is None  # unchanged
+
+    _write(path, min_contour_area_px=600, speed_limit_mph=25, detector="frame_diff")
+    assert watcher.poll(now_s=0.0) is None  # not due yet
+    assert watcher.poll(now_s=2e9) == {"min_contour_area_px": 600, "detector": "frame_diff"}
+
+    path.write_text("{not json")
+    watcher.request_reload()
+    assert watcher.poll() is None
+    assert "Config reload failed" in capsys.readouterr().err
+
+    # The last good file stays the reference.
+    _write(path, min_contour_area_px=600, speed_limit_mph=35, detector="frame_diff")
+    watcher.request_reload()
+    assert watcher.poll() == {"speed_limit_mph": 35.0}
+
+
+def test_apply_config_keeps_background_and_tracks():
+    config = MonitorConfig(detector="frame_diff", min_contour_area_px=2000)
+    monitor = SpeedMonitor(config=config)
+    rng = np.random.default_rng(0)
+    background = rng.integers(40, 90, (120, 160, 3), dtype=np.uint8)
+    for _ in range(5):
+        monitor.process_frame(background, 1)
+
+    frame = background.copy()
+    frame[40:70, 20:60] = 230  # 1200 px: below the initial threshold
+    det, tracks = monitor.process_frame(frame, 6)
+    assert det.bboxes == [] and tracks == []
+
+    changed = monitor.apply_config(dataclasses.replace(config, min_contour_area_px=500, match_max_distance_px=10.0))
+    assert changed == ["min_contour_area_px", "match_max_distance_px"]
+    det, (tr,) = monitor.process_frame(frame, 7)  # no relearning: found at once
+    assert det.bboxes == [BBox(20, 40, 60, 70)]
+
+    moved = background.copy()
+    moved[40:70, 40:80] = 230
+    _, tracks = monitor.process_frame(moved, 8)
+    # 20 px exceeds the new matching distance: a second track starts.
+    assert len(tracks) == 2 and tr.last_seen_frame == 7
+
+    with pytest.raises(ValueError, match="detector requires a restart"):
+        monitor.apply_config(dataclasses.replace(monitor.config, detector="mog2"))
+    with pytest.raises(ValueError, match="frame_diff_alpha"):
+        monitor.apply_config(dataclasses.replace(monitor.config, min_contour_area_px=1, frame_diff_alpha=2.0))
+    assert monitor.config.min_contour_area_px == 500
+
+
+def test_apply_config_recalibrates_cached_speeds():
+    config = MonitorConfig(calibration=CalibrationConfig(fps=30.0, feet_per_pixel_near=0.1))
+    monitor = SpeedMonitor(config=config)
+    tracks = []
+    for f in (1, 2):
+        tracks = monitor._tracker.update(detections=[BBox(10 * f, 10, 10 * f + 20, 30)], frame_idx=f)
+    (before,) = monitor.estimate_speeds_mph(tracks)
+
+    monitor.apply_config(dataclasses.replace(config, calibration=CalibrationConfig(fps=30.0, feet_per_pixel_near=0.2)))
+    (after,) = monitor.estimate_speeds_mph(tracks)
+    assert after == pytest.approx(2.0 * before)
+
+
+def test_run_applies_reload_between_frames(tmp_path, capsys):
+    scene = SyntheticScene(
+        width=160, height=120, n_frames=10,
+        vehicles=(SyntheticVehicle(vehicle_id=1, entry_frame=0, x0=0.0, y0=50.0, width=30, height=20, vx_px=4.0),),
+    )
+    video = write_scene_video(scene, tmp_path / "road.avi")
+    path = tmp_path / "config.json"
+    _write(path, min_contour_area_px=300)
+
+    monitor = SpeedMonitor(config=MonitorConfig(min_contour_area_px=300, config_poll_interval_s=0.0), config_path=path)
+    _write(path, min_contour_area_px=300, speed_limit_mph=20, max_frame_stride=2)
+    monitor.request_config_reload()
+    monitor.run(video_source=str(video), output_csv=str(tmp_path / "out.csv"))
+
+    assert monitor.config.speed_limit_mph == 20.0
+    assert monitor.config.max_frame_stride == 4
+    err = capsys.readouterr().err
+    assert "Config reloaded: speed_limit_mph None -> 20.0" in err
+    assert "ignoring max_frame_stride (requires a restart)" in err
@@ -0,0 +1,58 @@
+import time
+
+import cv2
+
+from conftest import FakeCapture
+from speed_monitor.capture import DirectCapture
+from speed_monitor.config import MonitorConfig
+from speed_monitor.monitor import SpeedMonitor
+from speed_monitor.scheduler import StrideScheduler
+
+
+def test_stride_rises_under_load_and_recovers():
+    sched = StrideScheduler(budget_s=0.030, max_stride=4, smoothing=1.0)
+
+    sched.record(0.070)
+    assert sched.stride == 3
+
+    sched.record(0.500)
+    assert sched.stride == 4  # capped
+
+    for _ in range(5):
+        sched.record(0.005)
+    assert sched.stride == 1
+
+
+def test_direct_capture_grabs_skipped_frames_with_true_indices():
+    sched = StrideScheduler(budget_s=1.0)
+    sched.stride = 3
+    cap = FakeCapture(10)
+    src = DirectCapture(cap, scheduler=sched)
+
+    idxs = []
+    while (item := src.read()) is not None:
+        idxs.append(item.frame_idx)
+
+    assert idxs == [1, 4, 7, 10]
+    assert cap.grabs == 6
+    assert src.stats.frames_skipped == 6
+
+
+def test_monitor_counts_slow_decoding_as_load(tmp_path, monkeypatch):
+    class SlowDecodeCapture(FakeCapture):
+        def isOpened(self):
+            return True
+
+        def read(self):
+            time.sleep(0.02)
+            return super().read()
+
+    cap = SlowDecodeCapture(20)
+    monkeypatch.setattr(cv2, "VideoCapture", lambda source: cap)
+    config = MonitorConfig(adaptive_stride=True, latency_budget_ms=5.0, max_frame_stride=4)
+    monitor = SpeedMonitor(config=config)
+    monitor.run(video_source="slow.avi", output_csv=str(tmp_path / "out.csv"))
+
+    # Processing a tiny frame is far under budget; decoding it is not.
+    assert monitor.scheduler.stride == 4
+    assert cap.grabs > 0
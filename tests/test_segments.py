@@ -0,0 +1,92 @@
+import dataclasses
+
+import pytest
+
+from conftest import read_csv_rows, write_traffic_clip
+from speed_monitor.config import MonitorConfig
+from speed_monitor.monitor import SpeedMonitor
+from speed_monitor.segments import Segment, plan_segments, run_segmented
+
+
+def test_plan_segments_covers_every_frame_once():
+    segments = plan_segments(300, 3, warmup_frames=50)
+    assert segments == [
+        Segment(index=0, warmup_start=1, start=1, end=100),
+        Segment(index=1, warmup_start=51, start=101, end=200),
+        Segment(index=2, warmup_start=151, start=201, end=None),
+    ]
+    assert len(plan_segments(2, 8, warmup_frames=10)) == 2
+    with pytest.raises(ValueError):
+        plan_segments(0, 2, warmup_frames=10)
+
+
+def test_segmented_summaries_match_sequential_run(tmp_path):
+    clip = tmp_path / "clip.avi"
+    write_traffic_clip(clip)
+    config = dataclasses.replace(MonitorConfig(), min_contour_area_px=100, segment_warmup_frames=100)
+
+    SpeedMonitor(config=config).run(video_source=str(clip), output_csv=str(tmp_path / "seq.csv"))
+    run_segmented(
+        config=config,
+        video_path=str(clip),
+        output_path=str(tmp_path / "par.csv"),
+        n_segments=3,
+        warmup_frames=config.segment_warmup_frames,
+        max_workers=2,
+    )
+
+    seq = read_csv_rows(tmp_path / "seq.csv")
+    par = read_csv_rows(tmp_path / "par.csv")
+    # Vehicles crossing segment boundaries are stitched back into one record.
+    assert len(par) == len(seq) == 6
+    by_entry = lambda r: int(r["entry_frame"])  # noqa: E731
+    for a, b in zip(sorted(seq, key=by_entry), sorted(par, key=by_entry)):
+        assert abs(int(a["entry_frame"]) - int(b["entry_frame"])) <= 2
+        assert abs(int(a["exit_frame"]) - int(b["exit_frame"])) <= 2
+        assert float(b["robust_speed_mph"]) == pytest.approx(float(a["robust_speed_mph"]), rel=0.15)
+
+
+def test_segmented_frames_mode_has_one_row_per_track_per_frame(tmp_path):
+    clip = tmp_path / "clip.avi"
+    write_traffic_clip(clip)
+    config = dataclasses.replace(MonitorConfig(), min_contour_area_px=100, log_mode="frames")
+
+    SpeedMonitor(config=config).run(video_source=str(clip), output_csv=str(tmp_path / "seq.csv"))
+    run_segmented(
+        config=config,
+        video_path=str(clip),
+        output_path=str(tmp_path / "par.csv"),
+        n_segments=3,
+        warmup_frames=100,
+        max_workers=2,
+    )
+
+    def keys(rows):
+        return sorted((int(r["frame_idx"]), int(r["track_id"])) for r in rows)
+
+    assert keys(read_csv_rows(tmp_path / "par.csv")) == keys(read_csv_rows(tmp_path / "seq.csv"))
+
+
+def test_vehicle_missed_at_the_cut_keeps_one_record(tmp_path):
+    clip = tmp_path / "clip.avi"
+    # Segments end at frames 120 and 240; nothing is detected around either cut.
+    write_traffic_clip(clip, hidden_frames={119, 120, 121, 239, 240})
+    config = dataclasses.replace(MonitorConfig(), min_contour_area_px=100)
+
+    SpeedMonitor(config=config).run(video_source=str(clip), output_csv=str(tmp_path / "seq.csv"))
+    run_segmented(
+        config=config,
+        video_path=str(clip),
+        output_path=str(tmp_path / "par.csv"),
+        n_segments=3,
+        warmup_frames=100,
+        max_workers=2,
+    )
+
+    seq = read_csv_rows(tmp_path / "seq.csv")
+    par = read_csv_rows(tmp_path / "par.csv")
+    assert len(par) == len(seq) == 6
+    by_entry = lambda r: int(r["entry_frame"])  # noqa: E731
+    for a, b in zip(sorted(seq, key=by_entry), sorted(par, key=by_entry)):
+        assert abs(int(a["exit_frame"]) - int(b["exit_frame"])) <= 2
+        assert int(b["samples"]) == pytest.approx(int(a["samples"]), abs=3)
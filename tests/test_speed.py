@@ -1,7 +1,13 @@
+import json
+
+import numpy as np
 import pytest
 
-from speed_monitor.config import CalibrationConfig
-from speed_monitor.speed import feet_per_pixel_at_y, speed_mph_from_pixel_displacement
+from speed_monitor.config import CalibrationConfig, MonitorConfig, load_config
+from speed_monitor.monitor import SpeedMonitor
+from speed_monitor.speed import GroundPlane, feet_per_pixel_at_y, speed_mph_from_pixel_displacement
+from speed_monitor.tracker import CentroidTracker
+from speed_monitor.types import BBox
 
 
 def test_speed_mph_from_pixel_displacement_constant_scale() -> None:
@@ -33,3 +39,103 @@ def test_feet_per_pixel_interpolates_by_y() -> None:
 
     mid = feet_per_pixel_at_y(cal, 350)
     assert 0.02 < mid < 0.06
+
+
+def test_ground_plane_matches_scalar_speed() -> None:
+    """Vectorized near/far speeds equal the scalar per-track computation."""
+    cal = CalibrationConfig(fps=30.0, feet_per_pixel_near=0.06, feet_per_pixel_far=0.02, y_near=600, y_far=100)
+    rng = np.random.default_rng(0)
+    p0 = rng.uniform(0, 700, (50, 2))
+    p1 = p0 + rng.uniform(-20, 20, (50, 2))
+    frames = rng.integers(1, 4, 50)
+
+    got = GroundPlane(cal).speeds_mph(p0, p1, frames)
+    want = [
+        speed_mph_from_pixel_displacement(
+            pixel_distance=float(np.hypot(*(b - a))),
+            frames_delta=int(n),
+            calibration=cal,
+            y_for_scale=float(b[1]),
+        )
+        for a, b, n in zip(p0, p1, frames)
+    ]
+    assert got == pytest.approx(want)
+
+
+def test_ground_plane_homography_corrects_perspective() -> None:
+    """A trapezoid in the image maps to a 12 x 100 ft rectangle on the road."""
+    cal = CalibrationConfig(
+        fps=30.0,
+        homography_image_points=((400, 700), (880, 700), (600, 100), (680, 100)),
+        homography_ground_points_ft=((0, 0), (12, 0), (0, 100), (12, 100)),
+    )
+    ground = GroundPlane(cal)
+    assert ground.to_ground(np.array([[880.0, 700.0], [600.0, 100.0]])) == pytest.approx(
+        np.array([[12.0, 0.0], [0.0, 100.0]]), abs=1e-6
+    )
+
+    # Crossing the whole lane width at either end is 12 ft, despite 480 vs 80 px.
+    near, far = ground.speeds_mph(
+        np.array([[400.0, 700.0], [600.0, 100.0]]),
+        np.array([[880.0, 700.0], [680.0, 100.0]]),
+        np.array([30, 30]),
+    )
+    assert near == pytest.approx(12.0 * 3600.0 / 5280.0)
+    assert far == pytest.approx(near)
+
+
+def test_load_config_homography(tmp_path) -> None:
+    """Parse a homography calibration and reject malformed point lists."""
+    path = tmp_path / "config.json"
+    path.write_text(
+        json.dumps(
+            {
+                "calibration": {
+                    "homography": {
+                        "image_points": [[0, 0], [10, 0], [0, 10], [10, 10]],
+                        "ground_points_ft": [[0, 0], [5, 0], [0, 5], [5, 5]],
+                    }
+                }
+            }
+        )
+    )
+    cal = load_config(path).calibration
+    assert cal.homography_ground_points_ft[3] == (5.0, 5.0)
+
+    path.write_text(json.dumps({"calibration": {"homography": {"image_points": [[0, 0]]}}}))
+    with pytest.raises(ValueError):
+        load_config(path)
+
+
+def test_window_least_squares_speed_is_stable_and_cached() -> None:
+    calibration = CalibrationConfig(fps=30.0, feet_per_pixel_near=0.1)
+    true_mph = 5.0 * 0.1 * 30.0 * 3600.0 / 5280.0  # 5 px/frame
+    rng = np.random.default_rng(0)
+
+    def run(window: int) -> list[float]:
+        config = MonitorConfig(calibration=calibration, speed_smoothing_window=window)
+        monitor = SpeedMonitor(config=config)
+        tracker = CentroidTracker(match_max_distance_px=50.0, history_size=window)
+        readings = []
+        for f in range(1, 121):
+            x = int(round(5.0 * f + rng.normal(0.0, 2.0)))
+            tracks = tracker.update(detections=[BBox(x, 100, x + 40, 120)], frame_idx=f)
+            (speed,) = monitor.estimate_speeds_mph(tracks)
+            if speed is not None:
+                readings.append(speed)
+        return readings
+
+    endpoint = np.array(run(2)[30:])
+    fitted = np.array(run(30)[30:])
+    assert abs(fitted.mean() - true_mph) < 0.05 * true_mph
+    assert fitted.std() < 0.1 * endpoint.std()
+
+    # A coasting track keeps its cached speed until it is matched again.
+    config = MonitorConfig(calibration=calibration, speed_smoothing_window=2)
+    monitor = SpeedMonitor(config=config)
+    tracker = CentroidTracker(match_max_distance_px=50.0, history_size=2)
+    tracker.update(detections=[BBox(0, 0, 10, 10)], frame_idx=1)
+    tracks = tracker.update(detections=[BBox(5, 0, 15, 10)], frame_idx=2)
+    (first,) = monitor.estimate_speeds_mph(tracks)
+    tracks[0].history.append((3, 1000.0, 0.0))  # not a match: last_seen_frame is unchanged
+    assert monitor.estimate_speeds_mph(tracks) == [first] == [tracks[0].speed_mph]
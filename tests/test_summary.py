@@ -0,0 +1,73 @@
+import pytest
+
+from speed_monitor.summary import VehicleSummarizer
+from speed_monitor.tracker import CentroidTracker
+from speed_monitor.types import BBox
+
+
+def test_tracker_reports_stale_tracks_as_closed():
+    tr = CentroidTracker(max_age_frames=2, match_max_distance_px=20.0, report_closed=True)
+    tr.update(detections=[BBox(0, 0, 10, 10)], frame_idx=1)
+    for f in range(2, 5):
+        tr.update(detections=[], frame_idx=f)
+        closed = tr.pop_closed_tracks()
+    assert [t.track_id for t in closed] == [1]
+    assert tr.pop_closed_tracks() == []
+
+
+def test_tracker_does_not_queue_closed_tracks_by_default():
+    tr = CentroidTracker(max_age_frames=1, max_tracks=2)
+    for f in range(1, 50):
+        tr.update(detections=[BBox(0, 0, 10, 10), BBox(200, 0, 210, 10), BBox(400, 0, 410, 10)], frame_idx=2 * f)
+    assert tr.pop_closed_tracks() == []
+    assert len(tr.close_all()) == 2
+
+
+def test_summarizer_emits_one_record_per_vehicle():
+    tracker = CentroidTracker(max_age_frames=2, match_max_distance_px=20.0)
+    summarizer = VehicleSummarizer()
+    speeds = [None, 30.0, 31.0, 29.0, 30.0, 90.0]
+
+    for f, speed in enumerate(speeds, start=1):
+        for t in tracker.update(detections=[BBox(10 * f, 0, 10 * f + 10, 10)], frame_idx=f):
+            summarizer.observe(t, f, speed)
+
+    (track,) = tracker.close_all()
+    summary = summarizer.close(track, "2024-01-01T00:00:00+00:00")
+
+    assert summary.track_id == track.track_id
+    assert (summary.entry_frame, summary.exit_frame) == (1, 6)
+    assert summary.samples == 5
+    assert summary.path_length_px == pytest.approx(50.0)
+    assert summary.median_speed_mph == pytest.approx(30.0)
+    assert summary.max_speed_mph == pytest.approx(90.0)
+    # The 90 mph outlier is excluded from the interquartile mean.
+    assert summary.robust_speed_mph == pytest.approx(30.0, abs=0.5)
+    assert summarizer.close(track, "2024-01-01T00:00:00+00:00") is None
+
+
+def test_summarizer_robust_speed_with_two_samples():
+    tracker = CentroidTracker(max_age_frames=2, match_max_distance_px=20.0)
+    summarizer = VehicleSummarizer()
+    for f, speed in enumerate([20.0, 30.0], start=1):
+        for t in tracker.update(detections=[BBox(10 * f, 0, 10 * f + 10, 10)], frame_idx=f):
+            summarizer.observe(t, f, speed)
+
+    (track,) = tracker.close_all()
+    assert summarizer.close(track, "2024-01-01T00:00:00+00:00").robust_speed_mph == pytest.approx(25.0)
+
+
+def test_detached_state_continues_in_another_summarizer():
+    first, second = VehicleSummarizer(), VehicleSummarizer()
+    tracker = CentroidTracker(match_max_distance_px=20.0)
+    for f, speed in enumerate([10.0, 20.0, 30.0, 40.0], start=1):
+        (t,) = tracker.update(detections=[BBox(10 * f, 0, 10 * f + 10, 10)], frame_idx=f)
+        (first if f <= 2 else second).observe(t, f, speed)
+
+    merged = VehicleSummarizer()
+    merged.attach(t.track_id, first.detach(t.track_id))
+    merged.attach(t.track_id, second.detach(t.track_id))
+    summary = merged.close(t, "2024-01-01T00:00:00+00:00")
+    assert (summary.entry_frame, summary.exit_frame, summary.samples) == (1, 4, 4)
+    assert summary.path_length_px == pytest.approx(20.0)  # the 10 px gap between stretches is not counted
+    assert summary.median_speed_mph == pytest.approx(25.0)
@@ -1,5 +1,9 @@
-from speed_monitor.tracker import CentroidTracker
-from speed_monitor.types import BBox
+import numpy as np
+import pytest
+
+from speed_monitor.kalman import KalmanTracker
+from speed_monitor.tracker import CentroidTracker, TrackHistory
+from speed_monitor.types import BBox, Detections
 
 
 def test_tracker_keeps_id_for_small_motion():
@@ -25,3 +29,74 @@ def test_tracker_creates_new_id_when_far_apart():
 
     assert tid1 in ids
     assert len(ids) == 2
+
+
+def test_track_history_is_bounded_ring_buffer():
+    hist = TrackHistory(3)
+    for f in range(1, 6):
+        hist.append((f, float(f), 2.0 * f))
+
+    assert len(hist) == 3
+    assert hist[0] == (3, 3.0, 6.0)
+    assert hist[-1] == (5, 5.0, 10.0)
+    assert [s[0] for s in hist] == [3, 4, 5]
+    assert hist.as_array()[:, 0].tolist() == [3.0, 4.0, 5.0]
+
+
+def test_tracker_history_size_and_max_tracks():
+    tr = CentroidTracker(max_age_frames=100, match_max_distance_px=5.0, history_size=4, max_tracks=2)
+
+    for f in range(1, 11):
+        tracks = tr.update(detections=[BBox(0, 0, 10, 10)], frame_idx=f)
+    assert len(tracks[0].history) == 4
+
+    # Two new far-apart detections push the total to 3; the least recently
+    # seen track is evicted.
+    tr.update(detections=[BBox(100, 0, 110, 10)], frame_idx=11)
+    tracks = tr.update(detections=[BBox(0, 0, 10, 10), BBox(200, 0, 210, 10)], frame_idx=12)
+    assert sorted(t.track_id for t in tracks) == [1, 3]
+
+
+@pytest.mark.parametrize("capacity", [2, 5, 16])
+def test_track_history_fitted_segment_matches_polyfit(capacity):
+    rng = np.random.default_rng(capacity)
+    hist = TrackHistory(capacity)
+    frame = 1_000_000  # large frame indices must not cost precision
+    for _ in range(2000):  # several laps of the ring and rebases of the origin
+        frame += int(rng.integers(1, 5))
+        hist.append((frame, 3.0 * frame % 997 + rng.normal(), 0.5 * frame % 631 + rng.normal()))
+        samples = hist.as_array()
+        if len(samples) < 2:
+            assert hist.fitted_segment() is None
+            continue
+
+        f = samples[:, 0] - samples[0, 0]
+        bx, ax = np.polyfit(f, samples[:, 1], 1)
+        by, ay = np.polyfit(f, samples[:, 2], 1)
+        expected = (ax, ay, ax + bx * f[-1], ay + by * f[-1], f[-1])
+        assert hist.fitted_segment() == pytest.approx(expected, abs=1e-6)
+
+
+def test_track_history_fitted_segment_two_samples_is_displacement():
+    hist = TrackHistory(2)
+    for sample in [(1, 0.0, 0.0), (4, 10.0, 20.0), (6, 16.0, 21.0)]:
+        hist.append(sample)
+    assert hist.fitted_segment() == pytest.approx((10.0, 20.0, 16.0, 21.0, 2.0))
+
+    same_frame = TrackHistory(4)
+    same_frame.append((7, 1.0, 1.0))
+    same_frame.append((7, 2.0, 2.0))
+    assert same_frame.fitted_segment() is None
+
+
+@pytest.mark.parametrize("tracker_cls", [CentroidTracker, KalmanTracker])
+def test_tracker_accepts_detections_arrays(tracker_cls):
+    from_list, from_arrays = tracker_cls(), tracker_cls()
+    for f in range(1, 6):
+        boxes = [BBox(10 + 5 * f, 10, 30 + 5 * f, 30), BBox(200 - 5 * f, 100, 220 - 5 * f, 120)]
+        a = from_list.update(detections=boxes, frame_idx=f)
+        b = from_arrays.update(detections=Detections(np.array([(x.x1, x.y1, x.x2, x.y2) for x in boxes])), frame_idx=f)
+    assert [(t.track_id, t.bbox, t.history.as_array().tolist()) for t in a] == [
+        (t.track_id, t.bbox, t.history.as_array().tolist()) for t in b
+    ]
+    assert len(from_arrays.update(detections=Detections(np.empty((0, 4))), frame_idx=6)) == 2
@@ -0,0 +1,141 @@
+import datetime as dt
+import gc
+import json
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from speed_monitor.config import CalibrationConfig, MonitorConfig
+from speed_monitor.monitor import SpeedMonitor
+from speed_monitor.synthetic import SyntheticScene, SyntheticVehicle, write_scene_video
+from speed_monitor.traffic import TrafficStats
+
+T0 = 1_699_999_920.0  # on a minute boundary, 120 s into a 300 s bucket
+
+
+def test_bucket_statistics_match_numpy():
+    stats = TrafficStats(intervals_s=(60.0,), histogram_bin_mph=5.0, max_speed_mph=60.0)
+    stats.advance(T0 - 10.0)
+    speeds = np.random.default_rng(0).normal(32.0, 6.0, 4000)
+    speeds[:3] = [0.0, 75.0, 90.0]  # bounds: 0 and above the histogram range
+    for i, mph in enumerate(speeds):
+        stats.observe(mph, T0 - 10.0 + i * 0.002, speed_limit_mph=40.0)
+    (rec,) = stats.advance(T0)
+
+    assert rec.count == 4000
+    assert rec.over_limit == int((speeds > 40.0).sum())
+    assert rec.mean_mph == pytest.approx(speeds.mean())
+    assert rec.max_mph == 90.0
+    assert rec.p50_mph == pytest.approx(np.percentile(speeds, 50), abs=0.25)
+    assert rec.p85_mph == pytest.approx(np.percentile(speeds, 85), abs=0.25)
+    expected, _ = np.histogram(np.minimum(speeds, 59.9), bins=np.arange(0.0, 65.0, 5.0))
+    assert rec.histogram == tuple(expected.tolist())
+
+
+def test_buckets_align_report_empty_periods_and_flush_partials():
+    stats = TrafficStats(intervals_s=(60.0, 300.0))
+    assert stats.advance(T0) == []
+    stats.observe(30.0, T0 + 5.0)
+    stats.observe(40.0, T0 + 15.0)
+
+    records = stats.advance(T0 + 230.0)
+    minute = [r for r in records if r.interval_s == 60.0]
+    assert [r.count for r in minute] == [2, 0, 0]
+    assert minute[0].start_iso == dt.datetime.fromtimestamp(T0, dt.timezone.utc).isoformat()
+    assert minute[0].complete and minute[1].p85_mph is None and minute[1].mean_mph is None
+    (five,) = [r for r in records if r.interval_s == 300.0]
+    assert five.count == 2 and not five.complete  # the run started 120 s into it
+    assert five.mean_mph == 35.0
+
+    stats.observe(50.0, T0 + 235.0)
+    partial = stats.flush()
+    assert [(r.interval_s, r.count, r.complete) for r in partial] == [(60.0, 1, False), (300.0, 1, False)]
+    assert stats.flush() == []
+
+
+def test_memory_is_bounded_by_configuration_not_traffic():
+    stats = TrafficStats(intervals_s=(60.0, 300.0, 900.0))
+    rng = np.random.default_rng(1)
+    speeds = rng.uniform(10.0, 70.0, 60_000).tolist()
+    for i in range(10_000):
+        stats.observe(speeds[i], T0 + i)
+
+    tracemalloc.start()
+    gc.collect()
+    before = tracemalloc.take_snapshot()
+    for i in range(10_000, 60_000):
+        stats.observe(speeds[i], T0 + i)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Keeping even one float per vehicle would take 400 KB.
+    assert growth < 64 * 1024
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        TrafficStats(intervals_s=())
+    with pytest.raises(ValueError):
+        TrafficStats(histogram_bin_mph=0.3)
+
+
+@pytest.mark.parametrize("log_mode", ["summary", "frames"])
+def test_monitor_counts_each_vehicle_once(tmp_path, log_mode):
+    vehicles = tuple(
+        SyntheticVehicle(vehicle_id=i + 1, entry_frame=10 + 60 * i, x0=-60.0, y0=150.0, width=60, height=30, vx_px=8.0)
+        for i in range(2)
+    )
+    scene = SyntheticScene(width=320, height=240, n_frames=140, vehicles=vehicles)
+    video = write_scene_video(scene, tmp_path / "road.avi")
+    config = MonitorConfig(
+        calibration=CalibrationConfig(fps=30.0, feet_per_pixel_near=0.05),
+        min_contour_area_px=300,
+        log_mode=log_mode,
+        traffic_stats_file=str(tmp_path / "traffic.jsonl"),
+        traffic_intervals_s=(3600.0,),
+    )
+    monitor = SpeedMonitor(config=config)
+    monitor.run(video_source=str(video), output_csv=str(tmp_path / "out.csv"))
+
+    records = [json.loads(line) for line in (tmp_path / "traffic.jsonl").read_text().splitlines()]
+    assert sum(r["count"] for r in records) == 2
+    (last, *_) = [r for r in records if r["count"]]
+    assert last["p85_mph"] == pytest.approx(8.2, abs=1.0)
+    assert sum(last["histogram"]) == last["count"]
+
+
+def test_monitor_counts_vehicle_in_the_bucket_of_its_exit_frame(tmp_path, monkeypatch):
+    vehicles = (SyntheticVehicle(vehicle_id=1, entry_frame=0, x0=0.0, y0=50.0, width=30, height=20, vx_px=8.0),)
+    scene = SyntheticScene(width=160, height=120, n_frames=60, vehicles=vehicles)
+    video = write_scene_video(scene, tmp_path / "road.avi")
+    config = MonitorConfig(
+        min_contour_area_px=200,
+        max_track_age_frames=20,
+        traffic_stats_file=str(tmp_path / "traffic.jsonl"),
+        traffic_intervals_s=(1.0,),
+    )
+    monkeypatch.setattr(time, "time", lambda: T0)
+    monitor = SpeedMonitor(config=config)
+    monitor.run(video_source=str(video), output_csv=str(tmp_path / "out.csv"))
+
+    # Last seen around frame 18 (0.6 s), but only closed 21 frames later, in the next second.
+    records = [json.loads(line) for line in (tmp_path / "traffic.jsonl").read_text().splitlines()]
+    assert [(r["start_iso"], r["count"]) for r in records[:2]] == [
+        (dt.datetime.fromtimestamp(T0, dt.timezone.utc).isoformat(), 1),
+        (dt.datetime.fromtimestamp(T0 + 1.0, dt.timezone.utc).isoformat(), 0),
+    ]
+    assert records[0]["complete"]
+
+
+def test_live_stream_time_follows_the_wall_clock():
+    monitor = SpeedMonitor(config=MonitorConfig(calibration=CalibrationConfig(fps=30.0)))
+    monitor._stream_start_s = T0
+    # A file: frame offsets at the calibrated FPS.
+    assert monitor._stream_time_s(60) == pytest.approx(T0 + 2.0)
+    # A live camera that delivered 60 frames in 10 s is timed by when frame 60 was read.
+    monitor._live_clock = (60, T0 + 10.0)
+    assert monitor._stream_time_s(60) == pytest.approx(T0 + 10.0)
+    assert monitor._stream_time_s(30) == pytest.approx(T0 + 9.0)